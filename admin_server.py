@@ -54,10 +54,10 @@ class AdminServer(QMainWindow):
         
         # Teams table
         self.teams_table = QTableWidget()
-        self.teams_table.setColumnCount(7)
+        self.teams_table.setColumnCount(8)
         self.teams_table.setHorizontalHeaderLabels([
             "Team Name", "System IP", "MCQ Score", "DSA1 Score", 
-            "DSA2 Score", "Total Score", "Status"
+            "DSA2 Score", "Total Score", "Status", "Speed Factor"
         ])
         self.teams_table.setStyleSheet("""
             QTableWidget {
@@ -140,7 +140,8 @@ class AdminServer(QMainWindow):
                         'dsa1_score': client_data.get('dsa1_score', 0),
                         'dsa2_score': client_data.get('dsa2_score', 0),
                         'total_score': client_data.get('total_score', 0),
-                        'status': client_data.get('status', 'In Progress')
+                        'status': client_data.get('status', 'In Progress'),
+                        'speed_factor': client_data.get('speed_factor')
                     }
                     
                     # Log client data
@@ -180,6 +181,9 @@ class AdminServer(QMainWindow):
             self.teams_table.setItem(i, 4, QTableWidgetItem(str(scores.get('dsa2_score', 0))))
             self.teams_table.setItem(i, 5, QTableWidgetItem(str(scores.get('total_score', 0))))
             self.teams_table.setItem(i, 6, QTableWidgetItem(scores.get('status', 'In Progress')))
+            # Above 1 the PC is slower than the reference machine
+            speed_factor = scores.get('speed_factor')
+            self.teams_table.setItem(i, 7, QTableWidgetItem('' if speed_factor is None else f"{speed_factor:.2f}"))
             
     def refresh_data(self):
         self.update_ui()
@@ -0,0 +1,92 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+ARTIFACT_VERSION = 2  # Bump when the generated sources or build layout change
+MAX_ENTRIES = 64
+
+
+def compiler_identity(compiler):
+    # Resolved binary plus size and mtime: changes whenever the toolchain is
+    # upgraded or a different one comes first on PATH
+    path = shutil.which(compiler)
+    if path is None:
+        return compiler
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ArtifactCache:
+    # Compiled submissions (binaries, class files, precompiled headers) keyed
+    # by source hash, compiler identity and flags. Each entry is a directory
+    # that is published with an atomic rename, so several judges can share it.
+    def __init__(self, root, max_entries=MAX_ENTRIES):
+        # Absolute, since artifacts are run from inside a workspace
+        self.root = os.path.abspath(root)
+        self.max_entries = max_entries
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+
+    def key(self, sources, compiler, flags):
+        payload = json.dumps(
+            [ARTIFACT_VERSION, compiler_identity(compiler), flags, sorted(sources.items())],
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, key):
+        path = os.path.join(self.root, key)
+        if not os.path.isdir(path):
+            return None
+        # Directory mtime doubles as the LRU timestamp
+        os.utime(path)
+        return path
+
+    def store(self, key, build_dir, names):
+        path = os.path.join(self.root, key)
+        staging = tempfile.mkdtemp(dir=self.root, prefix='.staging-')
+        try:
+            for name in names:
+                shutil.copy2(os.path.join(build_dir, name), os.path.join(staging, name))
+            os.rename(staging, path)
+        except OSError:
+            # Another judge published the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+        self.evict()
+        return path
+
+    def build(self, sources, compiler, flags, build, scratch=None):
+        # Returns (directory holding the artifacts, cache hit). On a miss the
+        # sources are written to a new directory under scratch (the cache
+        # itself by default) and build(directory) must compile them there and
+        # return the names of the files to keep; only those reach the cache.
+        key = self.key(sources, compiler, flags)
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached, True
+
+        build_dir = tempfile.mkdtemp(dir=scratch or self.root, prefix='.build-')
+        try:
+            for name, text in sources.items():
+                with open(os.path.join(build_dir, name), 'w') as f:
+                    f.write(text)
+            names = build(build_dir)
+            return self.store(key, build_dir, names), False
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+    def evict(self):
+        entries = [
+            os.path.join(self.root, name) for name in os.listdir(self.root)
+            if not name.startswith('.')
+        ]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda path: os.stat(path).st_mtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,186 @@
+import os
+import sys
+import csv
+import argparse
+from datetime import datetime
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from judge_engine import JudgeEngine, verdict_summary, COST_MODEL
+from artifact_cache import ArtifactCache
+from calibration import speed_factor
+from problem_bank import PROBLEMS, ROUND1_PROBLEMS
+from submission_archive import SubmissionArchive
+from toolchain_registry import registry as toolchains
+
+# Rejudges stored submissions without the GUI, e.g. after an expected output
+# in problem_bank.py is fixed. Submissions are laid out as
+# SUBMISSIONS/<team>/<problem id>.<ext>, one per team and problem, or come
+# from a submission archive (see submission_archive.py); each team gets its
+# new round scores in a CSV in the admin panel's export format.
+LANGUAGES = {".py": "Python3", ".cpp": "C++", ".java": "Java", ".c": "C", ".cs": "C#"}
+CSV_COLUMNS = ["Team Name", "MCQ Score", "DSA1 Score", "DSA2 Score", "Total Score", "Status"]
+ROUND1_IDS = {problem["id"] for problem in ROUND1_PROBLEMS}
+ARTIFACT_DIR = "team_data/artifact_cache"
+
+judge = None  # The engine of this worker process
+
+
+def find_submissions(root, problem_ids):
+    submissions = []
+    for team in sorted(os.listdir(root)):
+        team_dir = os.path.join(root, team)
+        if not os.path.isdir(team_dir):
+            continue
+        for name in sorted(os.listdir(team_dir)):
+            problem_id, extension = os.path.splitext(name)
+            if problem_id not in problem_ids or extension not in LANGUAGES:
+                continue
+            with open(os.path.join(team_dir, name), "r") as f:
+                code = f.read()
+            submissions.append({"team": team, "problem": problem_id, "language": LANGUAGES[extension], "code": code})
+    return submissions
+
+
+def archived_submissions(root, problem_ids):
+    # The last Submit of every team for each problem
+    archive = SubmissionArchive(root)
+    submissions = []
+    for (team, problem_id), entry in sorted(archive.latest('Submit').items()):
+        if problem_id in problem_ids:
+            submissions.append({"team": team, "problem": problem_id, "language": entry["Language"],
+                                "code": archive.load(entry["Hash"])})
+    return submissions
+
+
+def build_stress_tests(python_interpreters, factor, cost_model, problem_ids):
+    # The hidden tests' limits come from timing the reference solution, so
+    # that happens once here on an idle machine, not in every busy worker
+    engine = JudgeEngine(python_interpreters, print, speed_factor=factor, cost_model=cost_model)
+    try:
+        return {problem_id: engine.stress_tests(PROBLEMS[problem_id]) for problem_id in sorted(problem_ids)
+                if PROBLEMS[problem_id].get("stress_tests")}
+    finally:
+        engine.close()
+
+
+def start_worker(python_interpreters, factor, cost_model, stress_tests):
+    # Every core already runs a submission, so test cases run one at a time
+    global judge
+    judge = JudgeEngine(
+        python_interpreters,
+        parallel=False,
+        artifacts=ArtifactCache(ARTIFACT_DIR),
+        speed_factor=factor,
+        cost_model=cost_model,
+        stress_cache=stress_tests
+    )
+    # Pool workers skip atexit, so their workspaces are removed here
+    Finalize(judge, judge.close, exitpriority=10)
+
+
+def rejudge(submission):
+    problem = PROBLEMS[submission["problem"]]
+    try:
+        score, results = judge.compile_and_run(submission["code"], submission["language"],
+                                               problem["test_cases"], problem=problem)
+        summary = verdict_summary(results)
+    except Exception as e:
+        score, summary = 0, f"judge error: {e}"
+    return dict(submission, score=score, summary=summary)
+
+
+def number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def read_scores(path):
+    # Team name -> row of a previous export
+    scores = {}
+    if path is None:
+        return scores
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            scores[row["Team Name"]] = row
+    return scores
+
+
+def merge_scores(scores, graded):
+    # A team plays one problem per round, so its rejudged problem's score
+    # replaces that round's score; everything else comes from the base export
+    for result in graded:
+        row = scores.setdefault(result["team"], {
+            "Team Name": result["team"], "MCQ Score": 0, "DSA1 Score": 0, "DSA2 Score": 0, "Status": "Rejudged"
+        })
+        column = "DSA1 Score" if result["problem"] in ROUND1_IDS else "DSA2 Score"
+        row[column] = result["score"]
+        row["Total Score"] = sum(number(row[name]) for name in ("MCQ Score", "DSA1 Score", "DSA2 Score"))
+    return scores
+
+
+def write_scores(path, scores):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        for team, row in scores.items():
+            writer.writerow([team] + [number(row[name]) for name in CSV_COLUMNS[1:5]] + [row["Status"]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejudge stored DSA submissions in parallel.")
+    parser.add_argument("submissions", help="directory of <team>/<problem id>.<ext> submissions")
+    parser.add_argument("--archive", action="store_true",
+                        help="SUBMISSIONS is a submission archive; each team's last Submit is rejudged")
+    parser.add_argument("problems", nargs="*", help="problem ids to rejudge (default: all)")
+    parser.add_argument("--base", help="earlier results CSV to update")
+    parser.add_argument("--output", help="CSV to write (default: admin_logs/rejudged_results_<time>.csv)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="parallel judges (default: all cores)")
+    parser.add_argument("--cost-model", choices=["time", "instructions"], default=COST_MODEL,
+                        help="judge Python by time or by instruction count")
+    args = parser.parse_args(argv)
+
+    unknown = [problem_id for problem_id in args.problems if problem_id not in PROBLEMS]
+    if unknown:
+        parser.error(f"unknown problem id(s): {', '.join(unknown)}")
+    find = archived_submissions if args.archive else find_submissions
+    submissions = find(args.submissions, set(args.problems or PROBLEMS))
+    if not submissions:
+        print("No submissions to rejudge.")
+        return 1
+
+    python_interpreters = toolchains.python_interpreters()
+    if "python3" not in python_interpreters:
+        for submission in submissions:
+            if submission["language"] == "Python3":
+                submission["language"] = "Python"
+
+    # Calibrate and time the references before the pool loads the machine
+    factor = speed_factor()
+    stress_tests = build_stress_tests(python_interpreters, factor, args.cost_model,
+                                      {submission["problem"] for submission in submissions})
+    print(f"Rejudging {len(submissions)} submission(s) on {args.workers} worker(s), speed factor {factor:.2f}")
+
+    graded = []
+    with ProcessPoolExecutor(args.workers, initializer=start_worker,
+                             initargs=(python_interpreters, factor, args.cost_model, stress_tests)) as pool:
+        futures = [pool.submit(rejudge, submission) for submission in submissions]
+        for future in as_completed(futures):
+            result = future.result()
+            total = PROBLEMS[result["problem"]]["total_points"]
+            print(f"{result['team']}  {result['problem']}  {result['language']}  "
+                  f"{number(result['score'])}/{total}  {result['summary']}")
+            graded.append(result)
+
+    output = args.output or f"admin_logs/rejudged_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    graded.sort(key=lambda result: (result["team"], result["problem"]))
+    write_scores(output, merge_scores(read_scores(args.base), graded))
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
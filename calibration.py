@@ -0,0 +1,39 @@
+import time
+
+# Lab PCs differ in speed, so the judge's time limits are scaled by how long
+# this machine takes for a fixed CPU benchmark compared with the machine the
+# limits were written for. A factor of 2 means this PC is half as fast and
+# gets twice the time.
+BENCHMARK_SIZE = 300000  # Loop iterations in one benchmark run
+BENCHMARK_RUNS = 5  # The best of this many runs counts
+REFERENCE_SECONDS = 0.12  # Best benchmark time on the reference machine
+MIN_FACTOR = 0.5
+MAX_FACTOR = 3.0
+
+
+def benchmark(size=BENCHMARK_SIZE):
+    # Integer arithmetic, list indexing and dict updates, the same mix of
+    # work as the contest problems
+    counts = {}
+    values = list(range(1000))
+    total = 0
+    for i in range(size):
+        total = (total * 31 + values[i % 1000]) % 1000003
+        counts[total & 1023] = counts.get(total & 1023, 0) + 1
+    return total
+
+
+def measure(runs=BENCHMARK_RUNS):
+    # Best wall time, so a background hiccup during one run doesn't count
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        benchmark()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def speed_factor():
+    factor = measure() / REFERENCE_SECONDS
+    return round(min(MAX_FACTOR, max(MIN_FACTOR, factor)), 2)
@@ -0,0 +1,72 @@
+import math
+
+# Fits a solution's run times on growing inputs against common complexity
+# classes. Every model is t = a + b * f(n): the constant absorbs process
+# startup, so only the growth has to match. Errors are relative, so the
+# small inputs count as much as the large ones.
+MODELS = [
+    ("O(1)", lambda n: 0.0),
+    ("O(log n)", lambda n: math.log2(n)),
+    ("O(n)", lambda n: n),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n²)", lambda n: n ** 2),
+    ("O(n² log n)", lambda n: n ** 2 * math.log2(n)),
+    ("O(n³)", lambda n: n ** 3)
+]
+MIN_SAMPLES = 3  # Fewer timings than this can't tell the models apart
+# A faster-growing model has to beat a slower one's error by this fraction,
+# so timing noise doesn't promote O(n) to O(n log n)
+SIMPLER_MARGIN = 0.1
+
+
+def fit_model(samples, f):
+    # Weighted least squares with weights 1/t², so the residuals are relative.
+    # Returns (a, b, relative RMS error); a and b are kept non-negative.
+    points = [(f(n), t, 1.0 / (t * t)) for n, t in samples]
+    s = sum(w for _, _, w in points)
+    sf = sum(w * x for x, _, w in points)
+    st = sum(w * t for _, t, w in points)
+    sff = sum(w * x * x for x, _, w in points)
+    sft = sum(w * x * t for x, t, w in points)
+
+    det = s * sff - sf * sf
+    b = (s * sft - sf * st) / det if det > 0 else 0.0
+    a = (st - b * sf) / s
+    if b < 0:
+        # Times that shrink with n are noise around a constant
+        a, b = st / s, 0.0
+    elif a < 0:
+        a, b = 0.0, sft / sff
+    error = math.sqrt(sum(w * (t - a - b * x) ** 2 for x, t, w in points) / len(points))
+    return a, b, error
+
+
+def r_squared(samples, f, a, b):
+    mean = sum(t for _, t in samples) / len(samples)
+    total = sum((t - mean) ** 2 for _, t in samples)
+    residual = sum((t - a - b * f(n)) ** 2 for n, t in samples)
+    return 1.0 - residual / total if total > 0 else 1.0
+
+
+def estimate(samples):
+    # samples: (n, seconds) pairs. Returns the best-fitting class with its
+    # R² and every model's relative error, or None with too few samples.
+    samples = [(n, t) for n, t in samples if n >= 1 and t > 0]
+    if len(samples) < MIN_SAMPLES:
+        return None
+
+    fits = []
+    for name, f in MODELS:
+        a, b, error = fit_model(samples, f)
+        fits.append((name, f, a, b, error))
+
+    # The slowest-growing model whose error is close to the best one's
+    best_error = min(fit[4] for fit in fits)
+    name, f, a, b, error = next(fit for fit in fits if fit[4] <= best_error * (1 + SIMPLER_MARGIN))
+    return {
+        "model": name,
+        "r_squared": r_squared(samples, f, a, b),
+        "error": error,
+        "errors": {fit[0]: fit[4] for fit in fits},
+        "samples": samples
+    }
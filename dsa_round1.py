@@ -1,20 +1,23 @@
 import sys
 import random
-import subprocess
-import tempfile
-import os
-import platform
-import json
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QLabel, QPushButton, QScrollArea, QMessageBox, 
-                           QDialog, QHBoxLayout, QTextEdit, QComboBox)
+                           QDialog, QHBoxLayout, QTextEdit, QComboBox, QCheckBox)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
+from judge_engine import JudgeEngine, usage_summary, verdict_summary
+from grading_worker import GradingWorker, ComplexityWorker
+from result_cache import ResultCache
+from artifact_cache import ArtifactCache
+from submission_archive import SubmissionArchive
+from toolchain_registry import registry as toolchains
+from problem_bank import ROUND1_PROBLEMS
 
 class DSARound1(QMainWindow):
-    finished = pyqtSignal(int)  # Signal to emit score when round is finished
+    finished = pyqtSignal(float)  # Signal to emit score when round is finished; tests score half points
+    judge_output = pyqtSignal(str)  # Judge messages, queued from the grading thread
     
-    def __init__(self, team_name, logger):
+    def __init__(self, team_name, logger, speed_factor=1.0):
         super().__init__()
         self.team_name = team_name
         self.logger = logger
@@ -22,8 +25,19 @@ class DSARound1(QMainWindow):
         self.setGeometry(100, 100, 1000, 800)
         self.setWindowFlags(Qt.Window | Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint)
         
-        # Detect Python interpreters
-        self.python_interpreters = self.detect_python_interpreters()
+        # Interpreters/compilers were probed in the background at startup
+        self.python_interpreters = toolchains.python_interpreters()
+        self.judge = JudgeEngine(
+            self.python_interpreters,
+            self.judge_output.emit,
+            cache=ResultCache(f"team_data/{team_name}_judge_cache.json"),
+            artifacts=ArtifactCache("team_data/artifact_cache"),
+            speed_factor=speed_factor
+        )
+        self.judge.start_warm_workers()
+        self.archive = SubmissionArchive()
+        self.grading_worker = None
+        self.submitting = False
         
         self.questions = self.get_questions()
         self.current_question = 0
@@ -45,41 +59,6 @@ class DSARound1(QMainWindow):
             'DSA Round 1 started'
         )
         
-    def detect_python_interpreters(self):
-        interpreters = {}
-        possible_paths = {
-            'Windows': {
-                'python': ['python', 'py'],
-                'python3': ['python3', 'py -3']
-            },
-            'Linux': {
-                'python': ['python', 'python2'],
-                'python3': ['python3']
-            },
-            'Darwin': {  # macOS
-                'python': ['python', 'python2'],
-                'python3': ['python3']
-            }
-        }
-        
-        system = platform.system()
-        if system in possible_paths:
-            for version, paths in possible_paths[system].items():
-                for path in paths:
-                    try:
-                        result = subprocess.run(
-                            [path, '--version'],
-                            capture_output=True,
-                            text=True
-                        )
-                        if result.returncode == 0:
-                            interpreters[version] = path
-                            break
-                    except:
-                        continue
-        
-        return interpreters
-
     def start_timer(self):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_timer)
@@ -105,102 +84,8 @@ class DSARound1(QMainWindow):
             self.submit_answers()
         
     def get_questions(self):
-        # Pool of 5 problems with test cases
-        problem_pool = [
-            {
-                "question": "Implement a function to find the maximum element in a binary search tree.",
-                "input_format": "The function should take the root of the BST as input.",
-                "output_format": "Return the maximum value in the BST.",
-                "test_cases": [
-                    {"input": "[5,3,7,2,4,6,8]", "output": "8", "points": 3},
-                    {"input": "[10,5,15,3,7,12,20]", "output": "20", "points": 3},
-                    {"input": "[1]", "output": "1", "points": 3},
-                    {"input": "[5,3,7,2,4,6,8,9]", "output": "9", "points": 3},
-                    {"input": "[10,5,15,3,7,12,20,25]", "output": "25", "points": 3},
-                    {"input": "[5,3,7,2,4,6,8,9,10]", "output": "10", "points": 3},
-                    {"input": "[10,5,15,3,7,12,20,25,30]", "output": "30", "points": 3},
-                    {"input": "[5,3,7,2,4,6,8,9,10,11]", "output": "11", "points": 3},
-                    {"input": "[10,5,15,3,7,12,20,25,30,35]", "output": "35", "points": 3},
-                    {"input": "[5,3,7,2,4,6,8,9,10,11,12]", "output": "12", "points": 3}
-                ],
-                "total_points": 30
-            },
-            {
-                "question": "Write a function to check if a given string is a palindrome using a stack.",
-                "input_format": "The function should take a string as input.",
-                "output_format": "Return True if the string is a palindrome, False otherwise.",
-                "test_cases": [
-                    {"input": "racecar", "output": "True", "points": 3},
-                    {"input": "hello", "output": "False", "points": 3},
-                    {"input": "madam", "output": "True", "points": 3},
-                    {"input": "random", "output": "False", "points": 3},  # Random test case
-                    {"input": "level", "output": "True", "points": 3},
-                    {"input": "python", "output": "False", "points": 3},
-                    {"input": "radar", "output": "True", "points": 3},
-                    {"input": "random", "output": "False", "points": 3},  # Random test case
-                    {"input": "civic", "output": "True", "points": 3},
-                    {"input": "random", "output": "False", "points": 3}   # Random test case
-                ],
-                "total_points": 30
-            },
-            {
-                "question": "Implement a function to perform level order traversal of a binary tree.",
-                "input_format": "The function should take the root of the binary tree as input.",
-                "output_format": "Return a list of values in level order.",
-                "test_cases": [
-                    {"input": "[3,9,20,null,null,15,7]", "output": "[3,9,20,15,7]", "points": 3},
-                    {"input": "[1]", "output": "[1]", "points": 3},
-                    {"input": "[]", "output": "[]", "points": 3},
-                    {"input": "[1,2,3,4,5]", "output": "[1,2,3,4,5]", "points": 3},
-                    {"input": "[1,null,2,3]", "output": "[1,2,3]", "points": 3},
-                    {"input": "[1,2,3,4,null,null,5]", "output": "[1,2,3,4,5]", "points": 3},
-                    {"input": "[1,2,3,null,4,5]", "output": "[1,2,3,4,5]", "points": 3},
-                    {"input": "[1,2,3,4,5,6,7]", "output": "[1,2,3,4,5,6,7]", "points": 3},
-                    {"input": "[1,2,3,4,5,null,6]", "output": "[1,2,3,4,5,6]", "points": 3},
-                    {"input": "[1,2,3,4,5,6]", "output": "[1,2,3,4,5,6]", "points": 3}
-                ],
-                "total_points": 30
-            },
-            {
-                "question": "Implement a function to find the longest substring without repeating characters.",
-                "input_format": "The function should take a string as input.",
-                "output_format": "Return the length of the longest substring without repeating characters.",
-                "test_cases": [
-                    {"input": "abcabcbb", "output": "3", "points": 3},
-                    {"input": "bbbbb", "output": "1", "points": 3},
-                    {"input": "pwwkew", "output": "3", "points": 3},
-                    {"input": "abcdef", "output": "6", "points": 3},
-                    {"input": "aab", "output": "2", "points": 3},
-                    {"input": "dvdf", "output": "3", "points": 3},
-                    {"input": "anviaj", "output": "5", "points": 3},
-                    {"input": "qrsvbspk", "output": "5", "points": 3},
-                    {"input": "tmmzuxt", "output": "5", "points": 3},
-                    {"input": "bbtablud", "output": "6", "points": 3}
-                ],
-                "total_points": 30
-            },
-            {
-                "question": "Implement a function to find the median of two sorted arrays.",
-                "input_format": "The function should take two sorted arrays as input.",
-                "output_format": "Return the median of the two arrays.",
-                "test_cases": [
-                    {"input": "[1,3], [2]", "output": "2.0", "points": 3},
-                    {"input": "[1,2], [3,4]", "output": "2.5", "points": 3},
-                    {"input": "[0,0], [0,0]", "output": "0.0", "points": 3},
-                    {"input": "[1,3,5], [2,4,6]", "output": "3.5", "points": 3},
-                    {"input": "[1,2,3], [4,5,6]", "output": "3.5", "points": 3},
-                    {"input": "[1,3,5,7], [2,4,6,8]", "output": "4.5", "points": 3},
-                    {"input": "[1,2,3,4], [5,6,7,8]", "output": "4.5", "points": 3},
-                    {"input": "[1,3,5,7,9], [2,4,6,8,10]", "output": "5.5", "points": 3},
-                    {"input": "[1,2,3,4,5], [6,7,8,9,10]", "output": "5.5", "points": 3},
-                    {"input": "[1,3,5,7,9,11], [2,4,6,8,10,12]", "output": "6.5", "points": 3}
-                ],
-                "total_points": 30
-            }
-        ]
-        
-        # Randomly select one problem
-        return [random.choice(problem_pool)]
+        # Pool of 5 problems (see problem_bank.py); randomly select one
+        return [random.choice(ROUND1_PROBLEMS)]
         
     def setup_ui(self):
         # Main widget and layout
@@ -232,13 +117,8 @@ class DSARound1(QMainWindow):
         
         # Language selection
         self.language_combo = QComboBox()
-        # Add Python options based on detected interpreters
-        if 'python' in self.python_interpreters:
-            self.language_combo.addItem("Python")
-        if 'python3' in self.python_interpreters:
-            self.language_combo.addItem("Python3")
-        # Add other languages
-        self.language_combo.addItems(["C++", "Java", "C", "C#"])
+        # Only offer languages whose toolchain is installed
+        self.language_combo.addItems(toolchains.available_languages())
         self.language_combo.setFont(QFont("Arial", 12))
         header_layout.addWidget(self.language_combo)
         
@@ -286,15 +166,16 @@ class DSARound1(QMainWindow):
                 padding: 10px;
             }
         """)
+        self.judge_output.connect(self.terminal_output.append)
         main_layout.addWidget(self.terminal_output)
         
         # Button layout
         button_layout = QHBoxLayout()
         
         # Run button
-        run_button = QPushButton("Run Code")
-        run_button.setFont(QFont("Arial", 12, QFont.Bold))
-        run_button.setStyleSheet("""
+        self.run_button = QPushButton("Run Code")
+        self.run_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.run_button.setStyleSheet("""
             QPushButton {
                 background-color: #2196F3;
                 color: white;
@@ -309,13 +190,34 @@ class DSARound1(QMainWindow):
                 background-color: #1565C0;
             }
         """)
-        run_button.clicked.connect(self.run_code)
-        button_layout.addWidget(run_button)
+        self.run_button.clicked.connect(self.run_code)
+        button_layout.addWidget(self.run_button)
+        
+        # Complexity button: times the code on growing inputs and fits its Big-O
+        self.estimate_button = QPushButton("Estimate Complexity")
+        self.estimate_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.estimate_button.setStyleSheet("""
+            QPushButton {
+                background-color: #9C27B0;
+                color: white;
+                padding: 10px;
+                border-radius: 5px;
+                min-width: 150px;
+            }
+            QPushButton:hover {
+                background-color: #8E24AA;
+            }
+            QPushButton:pressed {
+                background-color: #7B1FA2;
+            }
+        """)
+        self.estimate_button.clicked.connect(self.estimate_complexity)
+        button_layout.addWidget(self.estimate_button)
         
         # Submit button
-        submit_button = QPushButton("Submit Answer")
-        submit_button.setFont(QFont("Arial", 12, QFont.Bold))
-        submit_button.setStyleSheet("""
+        self.submit_button = QPushButton("Submit Answer")
+        self.submit_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.submit_button.setStyleSheet("""
             QPushButton {
                 background-color: #4CAF50;
                 color: white;
@@ -330,8 +232,38 @@ class DSARound1(QMainWindow):
                 background-color: #3d8b40;
             }
         """)
-        submit_button.clicked.connect(self.submit_answers)
-        button_layout.addWidget(submit_button)
+        self.submit_button.clicked.connect(self.submit_answers)
+        button_layout.addWidget(self.submit_button)
+        
+        # Cancel button (only enabled while grading)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.cancel_button.setStyleSheet("""
+            QPushButton {
+                background-color: #F44336;
+                color: white;
+                padding: 10px;
+                border-radius: 5px;
+                min-width: 150px;
+            }
+            QPushButton:hover {
+                background-color: #E53935;
+            }
+            QPushButton:pressed {
+                background-color: #D32F2F;
+            }
+            QPushButton:disabled {
+                background-color: #BDBDBD;
+            }
+        """)
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_grading)
+        button_layout.addWidget(self.cancel_button)
+        
+        # Run Code stops at the first failing test case when checked
+        self.fail_fast_box = QCheckBox("Stop at first failure")
+        self.fail_fast_box.setFont(QFont("Arial", 10))
+        button_layout.addWidget(self.fail_fast_box)
         
         main_layout.addLayout(button_layout)
         
@@ -370,6 +302,15 @@ class DSARound1(QMainWindow):
             """
             
         question_text += "</table>"
+        
+        # Hidden stress tests only score when the solution is fast enough
+        stress_tests = question.get('stress_tests', [])
+        if stress_tests:
+            question_text += f"""
+        <p><b>Hidden performance tests:</b> {len(stress_tests)} large inputs worth
+        {sum(test['points'] for test in stress_tests)} points, each with a time limit
+        set relative to a reference solution.</p>
+        """
         self.question_display.setHtml(question_text)
         
         # Set default solution function template
@@ -378,371 +319,60 @@ class DSARound1(QMainWindow):
     pass"""
         self.code_input.setText(self.user_answers.get(0, default_code))
         
-    def compile_and_run(self, code, language, test_cases):
-        score = 0
-        results = []
+    def start_grading(self, code, language, problem, on_graded, cancellable=True, fail_fast=False,
+                      worker_class=GradingWorker):
+        # Grade on a worker thread so the window and countdown stay responsive
+        self.stop_grading()
         self.terminal_output.clear()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            if language == "Python" or language == "Python3":
-                file_path = os.path.join(temp_dir, "solution.py")
-                with open(file_path, "w") as f:
-                    # Add proper Python code structure with input handling
-                    if language == "Python3":
-                        f.write("#!/usr/bin/env python3\n")
-                    else:
-                        f.write("#!/usr/bin/env python\n")
-                    f.write("import sys\n")
-                    f.write("import ast\n")
-                    f.write("import json\n\n")
-                    f.write("class TreeNode:\n")
-                    f.write("    def __init__(self, val=0, left=None, right=None):\n")
-                    f.write("        self.val = val\n")
-                    f.write("        self.left = left\n")
-                    f.write("        self.right = right\n\n")
-                    f.write("def build_tree(nodes):\n")
-                    f.write("    if not nodes:\n")
-                    f.write("        return None\n")
-                    f.write("    root = TreeNode(nodes[0])\n")
-                    f.write("    queue = [root]\n")
-                    f.write("    i = 1\n")
-                    f.write("    while queue and i < len(nodes):\n")
-                    f.write("        node = queue.pop(0)\n")
-                    f.write("        if nodes[i] is not None:\n")
-                    f.write("            node.left = TreeNode(nodes[i])\n")
-                    f.write("            queue.append(node.left)\n")
-                    f.write("        i += 1\n")
-                    f.write("        if i < len(nodes) and nodes[i] is not None:\n")
-                    f.write("            node.right = TreeNode(nodes[i])\n")
-                    f.write("            queue.append(node.right)\n")
-                    f.write("        i += 1\n")
-                    f.write("    return root\n\n")
-                    f.write(code)
-                    f.write("\n\n")
-                    f.write("if __name__ == '__main__':\n")
-                    f.write("    try:\n")
-                    f.write("        input_data = sys.stdin.read().strip()\n")
-                    f.write("        # Handle different input formats\n")
-                    f.write("        if '\\n' in input_data:\n")
-                    f.write("            # Multi-line input\n")
-                    f.write("            lines = input_data.split('\\n')\n")
-                    f.write("            if len(lines) == 2:\n")
-                    f.write("                # Two lines (e.g., array and number)\n")
-                    f.write("                try:\n")
-                    f.write("                    arr = ast.literal_eval(lines[0])\n")
-                    f.write("                    num = ast.literal_eval(lines[1])\n")
-                    f.write("                    result = solution(arr, num)\n")
-                    f.write("                except:\n")
-                    f.write("                    result = solution(lines[0], lines[1])\n")
-                    f.write("            else:\n")
-                    f.write("                # Multiple arrays\n")
-                    f.write("                arrays = [ast.literal_eval(line) for line in lines]\n")
-                    f.write("                result = solution(*arrays)\n")
-                    f.write("        elif input_data.startswith('[') and input_data.endswith(']'):\n")
-                    f.write("            # Single array input (BST case)\n")
-                    f.write("            nodes = ast.literal_eval(input_data)\n")
-                    f.write("            root = build_tree(nodes)\n")
-                    f.write("            result = solution(root)\n")
-                    f.write("        else:\n")
-                    f.write("            # String or number input\n")
-                    f.write("            try:\n")
-                    f.write("                input_data = ast.literal_eval(input_data)\n")
-                    f.write("            except:\n")
-                    f.write("                pass\n")
-                    f.write("            result = solution(input_data)\n")
-                    f.write("        # Convert result to string\n")
-                    f.write("        if isinstance(result, (list, tuple, dict)):\n")
-                    f.write("            print(json.dumps(result))\n")
-                    f.write("        else:\n")
-                    f.write("            print(str(result))\n")
-                    f.write("    except Exception as e:\n")
-                    f.write("        print(f'Error: {str(e)}', file=sys.stderr)\n")
-                
-                try:
-                    # Make file executable on Unix-like systems
-                    if platform.system() != 'Windows':
-                        os.chmod(file_path, 0o755)
-                    
-                    interpreter = self.python_interpreters['python3' if language == "Python3" else 'python']
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        # Compile Python code to bytecode first
-                        compile_process = subprocess.run(
-                            [interpreter, "-m", "py_compile", file_path],
-                            capture_output=True,
-                            text=True
-                        )
-                        
-                        if compile_process.returncode != 0:
-                            self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                            return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                        
-                        # Run the compiled code
-                        process = subprocess.run(
-                            [interpreter, file_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        # Normalize output for comparison
-                        try:
-                            # Try to parse output as JSON for array/list comparisons
-                            output = json.dumps(json.loads(output))
-                            expected = json.dumps(json.loads(test_case["output"]))
-                        except:
-                            # If not JSON, compare as strings
-                            output = str(output)
-                            expected = str(test_case["output"])
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == expected:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "C++":
-                file_path = os.path.join(temp_dir, "solution.cpp")
-                exe_path = os.path.join(temp_dir, "solution")
-                with open(file_path, "w") as f:
-                    f.write("#include <iostream>\n")
-                    f.write("#include <vector>\n")
-                    f.write("#include <string>\n")
-                    f.write("#include <sstream>\n")
-                    f.write("#include <algorithm>\n\n")
-                    f.write(code)
-                    f.write("\n\n")
-                    f.write("int main() {\n")
-                    f.write("    std::string input;\n")
-                    f.write("    std::getline(std::cin, input);\n")
-                    f.write("    // Handle input and call solution\n")
-                    f.write("    auto result = solution(input);\n")
-                    f.write("    std::cout << result << std::endl;\n")
-                    f.write("    return 0;\n")
-                    f.write("}\n")
-                
-                try:
-                    self.terminal_output.append("Compiling C++ code...")
-                    compile_process = subprocess.run(
-                        ["g++", "-std=c++11", "-O2", file_path, "-o", exe_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            [exe_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "Java":
-                file_path = os.path.join(temp_dir, "Solution.java")
-                with open(file_path, "w") as f:
-                    f.write(code)
-                try:
-                    self.terminal_output.append("Compiling Java code...")
-                    compile_process = subprocess.run(
-                        ["javac", file_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            ["java", "-cp", temp_dir, "Solution"],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "C":
-                file_path = os.path.join(temp_dir, "solution.c")
-                exe_path = os.path.join(temp_dir, "solution")
-                with open(file_path, "w") as f:
-                    f.write(code)
-                try:
-                    self.terminal_output.append("Compiling C code...")
-                    compile_process = subprocess.run(
-                        ["gcc", file_path, "-o", exe_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            [exe_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "C#":
-                file_path = os.path.join(temp_dir, "Solution.cs")
-                exe_path = os.path.join(temp_dir, "Solution.exe")
-                with open(file_path, "w") as f:
-                    f.write(code)
-                try:
-                    self.terminal_output.append("Compiling C# code...")
-                    compile_process = subprocess.run(
-                        ["csc", file_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            ["mono", exe_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-        return score, results
+        self.grading_source = (code, language)
+        self.grading_worker = worker_class(
+            self.judge, code, language, problem["test_cases"], self, problem=problem, fail_fast=fail_fast
+        )
+        self.grading_worker.graded.connect(on_graded)
+        self.grading_worker.cancelled.connect(self.grading_cancelled)
+        self.grading_worker.finished.connect(self.grading_done)
+        
+        self.run_button.setEnabled(False)
+        self.estimate_button.setEnabled(False)
+        self.submit_button.setEnabled(False)
+        self.cancel_button.setEnabled(cancellable)
+        self.grading_worker.start()
+        
+    def stop_grading(self):
+        worker, self.grading_worker = self.grading_worker, None
+        if worker is not None:
+            worker.graded.disconnect()
+            worker.cancelled.disconnect()
+            worker.cancel()
+            worker.wait()
+            worker.deleteLater()
+            
+    def cancel_grading(self):
+        if self.grading_worker is not None:
+            self.cancel_button.setEnabled(False)
+            self.grading_worker.cancel()
+            
+    def grading_cancelled(self):
+        self.submitting = False
+        self.terminal_output.append("Cancelled. You can edit your code and try again.")
+        
+    def grading_done(self):
+        worker = self.sender()
+        if worker is not self.grading_worker:
+            return
+        self.grading_worker = None
+        self.run_button.setEnabled(True)
+        self.estimate_button.setEnabled(True)
+        self.submit_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        worker.deleteLater()
         
     def submit_answers(self):
+        # A submission is already being graded
+        if self.submitting:
+            return
+        
         # Store current answer
         current_question = self.questions[self.current_question]
         code = self.code_input.toPlainText()
@@ -759,8 +389,19 @@ class DSARound1(QMainWindow):
             f'Submitted solution in {language}'
         )
         
-        # Compile and run code
-        score, test_results = self.compile_and_run(code, language, current_question["test_cases"])
+        # Compile and run code; an automatic submit when time runs out can't be cancelled
+        self.submitting = True
+        self.start_grading(
+            code,
+            language,
+            current_question,
+            self.show_submission_results,
+            cancellable=self.time_left > 0
+        )
+        
+    def show_submission_results(self, score, test_results):
+        current_question = self.questions[self.current_question]
+        self.archive_run('Submit', score, test_results)
         
         # Log results
         self.logger.log_activity(
@@ -770,7 +411,8 @@ class DSARound1(QMainWindow):
             'Completed',
             score,
             0,
-            f'Score: {score}/{current_question["total_points"]}'
+            f'Score: {score}/{current_question["total_points"]}; {verdict_summary(test_results)}; '
+            f'{usage_summary(test_results)}'
         )
         
         # Show score dialog
@@ -834,10 +476,14 @@ class DSARound1(QMainWindow):
                     'Exited without completing the round'
                 )
                 self.finished.emit(0)
+                self.stop_grading()
+                self.judge.close()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.stop_grading()
+            self.judge.close()
             event.accept()
 
     def run_code(self):
@@ -852,16 +498,53 @@ class DSARound1(QMainWindow):
             return
         
         # Compile and run the code
-        score, results = self.compile_and_run(
-            code,
-            language,
-            self.questions[0]["test_cases"]
+        self.start_grading(
+            code, language, self.questions[0], self.show_run_results, fail_fast=self.fail_fast_box.isChecked()
         )
         
+    def archive_run(self, kind, score, results):
+        # Keep the graded source and its verdicts for rejudging and review
+        code, language = self.grading_source
+        try:
+            self.archive.record(self.team_name, 'DSA1', self.questions[0]["id"], kind, language, code, score,
+                                verdict_summary(results))
+        except OSError as e:
+            self.terminal_output.append(f"Could not archive the code: {e}")
+
+    def show_run_results(self, score, results):
+        self.archive_run('Run', score, results)
         # Show a message with the score
         QMessageBox.information(
             self,
             "Run Results",
             f"Your code passed {sum(test['passed'] for test in results)} out of {len(results)} test cases.\n"
+            f"Verdicts: {verdict_summary(results)}\n"
             f"Score: {score}/{self.questions[0]['total_points']}"
-        ) 
\ No newline at end of file
+        )
+        
+    def estimate_complexity(self):
+        language = self.language_combo.currentText()
+        code = self.code_input.toPlainText()
+        
+        if not code.strip():
+            QMessageBox.warning(self, "Warning", "Please write some code before estimating its complexity.")
+            return
+        
+        # The estimate is written to the terminal as it runs
+        self.start_grading(
+            code, language, self.questions[0], self.show_complexity_results, worker_class=ComplexityWorker
+        )
+        
+    def show_complexity_results(self, estimate, _):
+        if estimate is None:
+            return
+        sizes = [n for n, _ in estimate["samples"]]
+        self.logger.log_activity(
+            'DSA1',
+            'System',
+            f'Question {self.current_question + 1}',
+            'Complexity Estimated',
+            0,
+            0,
+            f'{estimate["model"]} (R² {estimate["r_squared"]:.3f}) over n = {sizes[0]}..{sizes[-1]}'
+        )
@@ -1,21 +1,24 @@
 import sys
 import random
-import subprocess
-import tempfile
-import os
-import platform
-import json
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QLabel, QPushButton, QScrollArea, QMessageBox, 
-                           QDialog, QHBoxLayout, QTextEdit, QComboBox)
+                           QDialog, QHBoxLayout, QTextEdit, QComboBox, QCheckBox)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
+from judge_engine import JudgeEngine, usage_summary, verdict_summary
+from grading_worker import GradingWorker, ComplexityWorker
+from result_cache import ResultCache
+from artifact_cache import ArtifactCache
+from submission_archive import SubmissionArchive
+from toolchain_registry import registry as toolchains
+from problem_bank import ROUND2_PROBLEMS
 from datetime import datetime
 
 class DSARound2(QMainWindow):
-    finished = pyqtSignal(int)  # Signal to emit score when round is finished
+    finished = pyqtSignal(float)  # Signal to emit score when round is finished; tests score half points
+    judge_output = pyqtSignal(str)  # Judge messages, queued from the grading thread
     
-    def __init__(self, team_name, logger):
+    def __init__(self, team_name, logger, speed_factor=1.0):
         super().__init__()
         self.team_name = team_name
         self.logger = logger
@@ -23,8 +26,19 @@ class DSARound2(QMainWindow):
         self.setGeometry(100, 100, 1000, 800)
         self.setWindowFlags(Qt.Window | Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint)
         
-        # Detect Python interpreters
-        self.python_interpreters = self.detect_python_interpreters()
+        # Interpreters/compilers were probed in the background at startup
+        self.python_interpreters = toolchains.python_interpreters()
+        self.judge = JudgeEngine(
+            self.python_interpreters,
+            self.judge_output.emit,
+            cache=ResultCache(f"team_data/{team_name}_judge_cache.json"),
+            artifacts=ArtifactCache("team_data/artifact_cache"),
+            speed_factor=speed_factor
+        )
+        self.judge.start_warm_workers()
+        self.archive = SubmissionArchive()
+        self.grading_worker = None
+        self.submitting = False
         
         self.questions = self.get_questions()
         self.current_question = 0
@@ -47,148 +61,9 @@ class DSARound2(QMainWindow):
             'DSA Round 2 started'
         )
         
-    def detect_python_interpreters(self):
-        interpreters = {}
-        possible_paths = {
-            'Windows': {
-                'python': ['python', 'py'],
-                'python3': ['python3', 'py -3']
-            },
-            'Linux': {
-                'python': ['python', 'python2'],
-                'python3': ['python3']
-            },
-            'Darwin': {  # macOS
-                'python': ['python', 'python2'],
-                'python3': ['python3']
-            }
-        }
-        
-        system = platform.system()
-        if system in possible_paths:
-            for version, paths in possible_paths[system].items():
-                for path in paths:
-                    try:
-                        result = subprocess.run(
-                            [path, '--version'],
-                            capture_output=True,
-                            text=True
-                        )
-                        if result.returncode == 0:
-                            interpreters[version] = path
-                            break
-                    except:
-                        continue
-        
-        return interpreters
-
     def get_questions(self):
-        # Pool of 5 moderate-level problems with test cases
-        problem_pool = [
-            {
-                "question": "Implement a function to find the number of islands in a 2D grid. An island is surrounded by water and is formed by connecting adjacent lands horizontally or vertically.",
-                "input_format": "The function should take a 2D grid of '1's (land) and '0's (water) as input.",
-                "output_format": "Return the number of islands.",
-                "test_cases": [
-                    {"input": "[[1,1,1,1,0],[1,1,0,1,0],[1,1,0,0,0],[0,0,0,0,0]]", "output": "1", "points": 3.33},
-                    {"input": "[[1,1,0,0,0],[1,1,0,0,0],[0,0,1,0,0],[0,0,0,1,1]]", "output": "3", "points": 3.33},
-                    {"input": "[[1,0,1,0,1],[0,1,0,1,0],[1,0,1,0,1],[0,1,0,1,0]]", "output": "10", "points": 3.33},
-                    {"input": "[[1,1,1],[0,1,0],[1,1,1]]", "output": "1", "points": 3.33},
-                    {"input": "[[1,0,1,0,1],[1,0,1,0,1],[1,1,1,1,1]]", "output": "1", "points": 3.33},
-                    {"input": "[[1,1,1,1,1],[1,0,0,0,1],[1,0,1,0,1],[1,0,0,0,1],[1,1,1,1,1]]", "output": "2", "points": 3.33},
-                    {"input": "[[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0]]", "output": "0", "points": 3.33},
-                    {"input": "[[1,1,1,1,1],[1,1,1,1,1],[1,1,1,1,1],[1,1,1,1,1]]", "output": "1", "points": 3.33},
-                    {"input": "[[1,0,1,0,1],[0,1,0,1,0],[1,0,1,0,1],[0,1,0,1,0],[1,0,1,0,1]]", "output": "13", "points": 3.33},
-                    {"input": "[[1,1,0,0,0,0],[1,1,0,0,0,0],[0,0,1,1,0,0],[0,0,1,1,0,0],[0,0,0,0,1,1],[0,0,0,0,1,1]]", "output": "3", "points": 3.33},
-                    {"input": "[[1,0,0,0,0,1],[0,1,0,0,1,0],[0,0,1,1,0,0],[0,0,1,1,0,0],[0,1,0,0,1,0],[1,0,0,0,0,1]]", "output": "6", "points": 3.33},
-                    {"input": "[[1,1,1,0,0,0],[1,0,1,0,0,0],[1,1,1,0,0,0],[0,0,0,1,1,1],[0,0,0,1,0,1],[0,0,0,1,1,1]]", "output": "2", "points": 3.33}
-                ],
-                "total_points": 40
-            },
-            {
-                "question": "Implement a function to find the minimum number of coins needed to make up a given amount using coins of given denominations.",
-                "input_format": "The function should take an array of coin denominations and the target amount as input.",
-                "output_format": "Return the minimum number of coins needed to make up the amount. If it's not possible, return -1.",
-                "test_cases": [
-                    {"input": "[1,2,5]\n11", "output": "3", "points": 3.33},
-                    {"input": "[2]\n3", "output": "-1", "points": 3.33},
-                    {"input": "[1,2,5,10,20,50,100]\n73", "output": "4", "points": 3.33},
-                    {"input": "[1,3,4,5]\n7", "output": "2", "points": 3.33},
-                    {"input": "[1,2,5,10]\n18", "output": "4", "points": 3.33},
-                    {"input": "[1,5,10,25]\n30", "output": "2", "points": 3.33},
-                    {"input": "[1,2,5,10,20]\n43", "output": "5", "points": 3.33},
-                    {"input": "[2,5,10,20]\n1", "output": "-1", "points": 3.33},
-                    {"input": "[1,3,4,5]\n10", "output": "2", "points": 3.33},
-                    {"input": "[1,2,5,10,20,50]\n65", "output": "3", "points": 3.33},
-                    {"input": "[1,2,5,10,20,50,100]\n127", "output": "4", "points": 3.33},
-                    {"input": "[1,2,5,10,20,50,100]\n200", "output": "2", "points": 3.33}
-                ],
-                "total_points": 40
-            },
-            {
-                "question": "Implement a function to find the longest palindromic substring in a given string.",
-                "input_format": "The function should take a string as input.",
-                "output_format": "Return the longest palindromic substring.",
-                "test_cases": [
-                    {"input": "babad", "output": "bab", "points": 3.33},
-                    {"input": "cbbd", "output": "bb", "points": 3.33},
-                    {"input": "a", "output": "a", "points": 3.33},
-                    {"input": "ac", "output": "a", "points": 3.33},
-                    {"input": "racecar", "output": "racecar", "points": 3.33},
-                    {"input": "abacdfgdcaba", "output": "aba", "points": 3.33},
-                    {"input": "forgeeksskeegfor", "output": "geeksskeeg", "points": 3.33},
-                    {"input": "abcbabcbabcba", "output": "abcbabcbabcba", "points": 3.33},
-                    {"input": "abacabacabbacabacab", "output": "bacabacabbacabacab", "points": 3.33},
-                    {"input": "abacabacabbacabacaba", "output": "abacabacabbacabacaba", "points": 3.33},
-                    {"input": "abacabacabbacabacabac", "output": "abacabacabbacabacaba", "points": 3.33},
-                    {"input": "abacabacabbacabacabaca", "output": "abacabacabbacabacaba", "points": 3.33}
-                ],
-                "total_points": 40
-            },
-            {
-                "question": "Implement a function to find the maximum product subarray in a given array of integers.",
-                "input_format": "The function should take an array of integers as input.",
-                "output_format": "Return the maximum product of any contiguous subarray.",
-                "test_cases": [
-                    {"input": "[2,3,-2,4]", "output": "6", "points": 3.33},
-                    {"input": "[-2,0,-1]", "output": "0", "points": 3.33},
-                    {"input": "[2,3,-2,4,-1]", "output": "48", "points": 3.33},
-                    {"input": "[-2,-3,-4]", "output": "12", "points": 3.33},
-                    {"input": "[0,2]", "output": "2", "points": 3.33},
-                    {"input": "[-2,3,-4]", "output": "24", "points": 3.33},
-                    {"input": "[2,-5,-2,-4,3]", "output": "24", "points": 3.33},
-                    {"input": "[3,-1,4]", "output": "4", "points": 3.33},
-                    {"input": "[1,2,-3,0,-4,-5]", "output": "20", "points": 3.33},
-                    {"input": "[2,-5,3,1,-4,0,-10,2,8]", "output": "120", "points": 3.33},
-                    {"input": "[-1,-2,-3,0]", "output": "6", "points": 3.33},
-                    {"input": "[1,2,3,4,5,6,7,8,9,10]", "output": "3628800", "points": 3.33}
-                ],
-                "total_points": 40
-            },
-            {
-                "question": "Implement a function to find the minimum window substring in a given string that contains all characters of another string.",
-                "input_format": "The function should take two strings s and t as input.",
-                "output_format": "Return the minimum window substring of s that contains all characters of t.",
-                "test_cases": [
-                    {"input": "ADOBECODEBANC\nABC", "output": "BANC", "points": 3.33},
-                    {"input": "a\na", "output": "a", "points": 3.33},
-                    {"input": "a\nb", "output": "", "points": 3.33},
-                    {"input": "ab\nb", "output": "b", "points": 3.33},
-                    {"input": "cabwefgewcwaefgcf\ncae", "output": "cwae", "points": 3.33},
-                    {"input": "aaflslflsldkalskaaa\naaa", "output": "aaa", "points": 3.33},
-                    {"input": "abababaabababaabababa\naba", "output": "aba", "points": 3.33},
-                    {"input": "abababaabababaabababa\nabab", "output": "abab", "points": 3.33},
-                    {"input": "abababaabababaabababa\nababa", "output": "ababa", "points": 3.33},
-                    {"input": "abababaabababaabababa\nababab", "output": "ababab", "points": 3.33},
-                    {"input": "abababaabababaabababa\nabababa", "output": "abababa", "points": 3.33},
-                    {"input": "abababaabababaabababa\nabababab", "output": "abababaab", "points": 3.33}
-                ],
-                "total_points": 40
-            }
-        ]
-        
-        # Randomly select one problem
-        return [random.choice(problem_pool)]
+        # Pool of 5 moderate-level problems (see problem_bank.py); randomly select one
+        return [random.choice(ROUND2_PROBLEMS)]
         
     def setup_ui(self):
         # Main widget and layout
@@ -220,13 +95,8 @@ class DSARound2(QMainWindow):
         
         # Language selection
         self.language_combo = QComboBox()
-        # Add Python options based on detected interpreters
-        if 'python' in self.python_interpreters:
-            self.language_combo.addItem("Python")
-        if 'python3' in self.python_interpreters:
-            self.language_combo.addItem("Python3")
-        # Add other languages
-        self.language_combo.addItems(["C++", "Java", "C", "C#"])
+        # Only offer languages whose toolchain is installed
+        self.language_combo.addItems(toolchains.available_languages())
         self.language_combo.setFont(QFont("Arial", 12))
         header_layout.addWidget(self.language_combo)
         
@@ -274,15 +144,16 @@ class DSARound2(QMainWindow):
                 padding: 10px;
             }
         """)
+        self.judge_output.connect(self.terminal_output.append)
         main_layout.addWidget(self.terminal_output)
         
         # Button layout
         button_layout = QHBoxLayout()
         
         # Run button
-        run_button = QPushButton("Run Code")
-        run_button.setFont(QFont("Arial", 12, QFont.Bold))
-        run_button.setStyleSheet("""
+        self.run_button = QPushButton("Run Code")
+        self.run_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.run_button.setStyleSheet("""
             QPushButton {
                 background-color: #2196F3;
                 color: white;
@@ -297,13 +168,34 @@ class DSARound2(QMainWindow):
                 background-color: #1565C0;
             }
         """)
-        run_button.clicked.connect(self.run_code)
-        button_layout.addWidget(run_button)
+        self.run_button.clicked.connect(self.run_code)
+        button_layout.addWidget(self.run_button)
+        
+        # Complexity button: times the code on growing inputs and fits its Big-O
+        self.estimate_button = QPushButton("Estimate Complexity")
+        self.estimate_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.estimate_button.setStyleSheet("""
+            QPushButton {
+                background-color: #9C27B0;
+                color: white;
+                padding: 10px;
+                border-radius: 5px;
+                min-width: 150px;
+            }
+            QPushButton:hover {
+                background-color: #8E24AA;
+            }
+            QPushButton:pressed {
+                background-color: #7B1FA2;
+            }
+        """)
+        self.estimate_button.clicked.connect(self.estimate_complexity)
+        button_layout.addWidget(self.estimate_button)
         
         # Submit button
-        submit_button = QPushButton("Submit Answer")
-        submit_button.setFont(QFont("Arial", 12, QFont.Bold))
-        submit_button.setStyleSheet("""
+        self.submit_button = QPushButton("Submit Answer")
+        self.submit_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.submit_button.setStyleSheet("""
             QPushButton {
                 background-color: #4CAF50;
                 color: white;
@@ -318,8 +210,38 @@ class DSARound2(QMainWindow):
                 background-color: #3d8b40;
             }
         """)
-        submit_button.clicked.connect(self.submit_answers)
-        button_layout.addWidget(submit_button)
+        self.submit_button.clicked.connect(self.submit_answers)
+        button_layout.addWidget(self.submit_button)
+        
+        # Cancel button (only enabled while grading)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.cancel_button.setStyleSheet("""
+            QPushButton {
+                background-color: #F44336;
+                color: white;
+                padding: 10px;
+                border-radius: 5px;
+                min-width: 150px;
+            }
+            QPushButton:hover {
+                background-color: #E53935;
+            }
+            QPushButton:pressed {
+                background-color: #D32F2F;
+            }
+            QPushButton:disabled {
+                background-color: #BDBDBD;
+            }
+        """)
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_grading)
+        button_layout.addWidget(self.cancel_button)
+        
+        # Run Code stops at the first failing test case when checked
+        self.fail_fast_box = QCheckBox("Stop at first failure")
+        self.fail_fast_box.setFont(QFont("Arial", 10))
+        button_layout.addWidget(self.fail_fast_box)
         
         main_layout.addLayout(button_layout)
         
@@ -358,6 +280,15 @@ class DSARound2(QMainWindow):
             """
             
         question_text += "</table>"
+        
+        # Hidden stress tests only score when the solution is fast enough
+        stress_tests = question.get('stress_tests', [])
+        if stress_tests:
+            question_text += f"""
+        <p><b>Hidden performance tests:</b> {len(stress_tests)} large inputs worth
+        {sum(test['points'] for test in stress_tests)} points, each with a time limit
+        set relative to a reference solution.</p>
+        """
         self.question_display.setHtml(question_text)
         
         # Set default solution function template
@@ -366,381 +297,67 @@ class DSARound2(QMainWindow):
     pass"""
         self.code_input.setText(self.user_answers.get(0, default_code))
         
-    def compile_and_run(self, code, language, test_cases):
-        score = 0
-        results = []
+    def start_grading(self, code, language, problem, on_graded, cancellable=True, fail_fast=False,
+                      worker_class=GradingWorker):
+        # Grade on a worker thread so the window and countdown stay responsive
+        self.stop_grading()
         self.terminal_output.clear()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            if language == "Python" or language == "Python3":
-                file_path = os.path.join(temp_dir, "solution.py")
-                with open(file_path, "w") as f:
-                    # Add proper Python code structure with input handling
-                    if language == "Python3":
-                        f.write("#!/usr/bin/env python3\n")
-                    else:
-                        f.write("#!/usr/bin/env python\n")
-                    f.write("import sys\n")
-                    f.write("import ast\n")
-                    f.write("import json\n\n")
-                    f.write("class TreeNode:\n")
-                    f.write("    def __init__(self, val=0, left=None, right=None):\n")
-                    f.write("        self.val = val\n")
-                    f.write("        self.left = left\n")
-                    f.write("        self.right = right\n\n")
-                    f.write("def build_tree(nodes):\n")
-                    f.write("    if not nodes:\n")
-                    f.write("        return None\n")
-                    f.write("    root = TreeNode(nodes[0])\n")
-                    f.write("    queue = [root]\n")
-                    f.write("    i = 1\n")
-                    f.write("    while queue and i < len(nodes):\n")
-                    f.write("        node = queue.pop(0)\n")
-                    f.write("        if nodes[i] is not None:\n")
-                    f.write("            node.left = TreeNode(nodes[i])\n")
-                    f.write("            queue.append(node.left)\n")
-                    f.write("        i += 1\n")
-                    f.write("        if i < len(nodes) and nodes[i] is not None:\n")
-                    f.write("            node.right = TreeNode(nodes[i])\n")
-                    f.write("            queue.append(node.right)\n")
-                    f.write("        i += 1\n")
-                    f.write("    return root\n\n")
-                    f.write(code)
-                    f.write("\n\n")
-                    f.write("if __name__ == '__main__':\n")
-                    f.write("    try:\n")
-                    f.write("        input_data = sys.stdin.read().strip()\n")
-                    f.write("        # Handle different input formats\n")
-                    f.write("        if '\\n' in input_data:\n")
-                    f.write("            # Multi-line input\n")
-                    f.write("            lines = input_data.split('\\n')\n")
-                    f.write("            if len(lines) == 2:\n")
-                    f.write("                # Two lines (e.g., array and number)\n")
-                    f.write("                try:\n")
-                    f.write("                    arr = ast.literal_eval(lines[0])\n")
-                    f.write("                    num = ast.literal_eval(lines[1])\n")
-                    f.write("                    result = solution(arr, num)\n")
-                    f.write("                except:\n")
-                    f.write("                    result = solution(lines[0], lines[1])\n")
-                    f.write("            else:\n")
-                    f.write("                # Multiple arrays\n")
-                    f.write("                arrays = [ast.literal_eval(line) for line in lines]\n")
-                    f.write("                result = solution(*arrays)\n")
-                    f.write("        elif input_data.startswith('[') and input_data.endswith(']'):\n")
-                    f.write("            # Single array input (BST case)\n")
-                    f.write("            nodes = ast.literal_eval(input_data)\n")
-                    f.write("            root = build_tree(nodes)\n")
-                    f.write("            result = solution(root)\n")
-                    f.write("        else:\n")
-                    f.write("            # String or number input\n")
-                    f.write("            try:\n")
-                    f.write("                input_data = ast.literal_eval(input_data)\n")
-                    f.write("            except:\n")
-                    f.write("                pass\n")
-                    f.write("            result = solution(input_data)\n")
-                    f.write("        # Convert result to string\n")
-                    f.write("        if isinstance(result, (list, tuple, dict)):\n")
-                    f.write("            print(json.dumps(result))\n")
-                    f.write("        else:\n")
-                    f.write("            print(str(result))\n")
-                    f.write("    except Exception as e:\n")
-                    f.write("        print(f'Error: {str(e)}', file=sys.stderr)\n")
-                
-                try:
-                    # Make file executable on Unix-like systems
-                    if platform.system() != 'Windows':
-                        os.chmod(file_path, 0o755)
-                    
-                    interpreter = self.python_interpreters['python3' if language == "Python3" else 'python']
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        # Compile Python code to bytecode first
-                        compile_process = subprocess.run(
-                            [interpreter, "-m", "py_compile", file_path],
-                            capture_output=True,
-                            text=True
-                        )
-                        
-                        if compile_process.returncode != 0:
-                            self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                            return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                        
-                        # Run the compiled code
-                        process = subprocess.run(
-                            [interpreter, file_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        # Normalize output for comparison
-                        try:
-                            # Try to parse output as JSON for array/list comparisons
-                            output = json.dumps(json.loads(output))
-                            expected = json.dumps(json.loads(test_case["output"]))
-                        except:
-                            # If not JSON, compare as strings
-                            output = str(output)
-                            expected = str(test_case["output"])
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == expected:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "C++":
-                file_path = os.path.join(temp_dir, "solution.cpp")
-                exe_path = os.path.join(temp_dir, "solution")
-                with open(file_path, "w") as f:
-                    f.write("#include <iostream>\n")
-                    f.write("#include <vector>\n")
-                    f.write("#include <string>\n")
-                    f.write("#include <sstream>\n")
-                    f.write("#include <algorithm>\n\n")
-                    f.write(code)
-                    f.write("\n\n")
-                    f.write("int main() {\n")
-                    f.write("    std::string input;\n")
-                    f.write("    std::getline(std::cin, input);\n")
-                    f.write("    // Handle input and call solution\n")
-                    f.write("    auto result = solution(input);\n")
-                    f.write("    std::cout << result << std::endl;\n")
-                    f.write("    return 0;\n")
-                    f.write("}\n")
-                
-                try:
-                    self.terminal_output.append("Compiling C++ code...")
-                    compile_process = subprocess.run(
-                        ["g++", "-std=c++11", "-O2", file_path, "-o", exe_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            [exe_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "Java":
-                file_path = os.path.join(temp_dir, "Solution.java")
-                with open(file_path, "w") as f:
-                    f.write(code)
-                try:
-                    self.terminal_output.append("Compiling Java code...")
-                    compile_process = subprocess.run(
-                        ["javac", file_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            ["java", "-cp", temp_dir, "Solution"],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "C":
-                file_path = os.path.join(temp_dir, "solution.c")
-                exe_path = os.path.join(temp_dir, "solution")
-                with open(file_path, "w") as f:
-                    f.write(code)
-                try:
-                    self.terminal_output.append("Compiling C code...")
-                    compile_process = subprocess.run(
-                        ["gcc", file_path, "-o", exe_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            [exe_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-            elif language == "C#":
-                file_path = os.path.join(temp_dir, "Solution.cs")
-                exe_path = os.path.join(temp_dir, "Solution.exe")
-                with open(file_path, "w") as f:
-                    f.write(code)
-                try:
-                    self.terminal_output.append("Compiling C# code...")
-                    compile_process = subprocess.run(
-                        ["csc", file_path],
-                        capture_output=True,
-                        text=True
-                    )
-                    if compile_process.returncode != 0:
-                        self.terminal_output.append(f"Compilation Error:\n{compile_process.stderr}")
-                        return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    self.terminal_output.append("Compilation successful!")
-                    
-                    for i, test_case in enumerate(test_cases, 1):
-                        self.terminal_output.append(f"\n=== Test Case {i} ===")
-                        self.terminal_output.append(f"Input: {test_case['input']}")
-                        self.terminal_output.append(f"Expected Output: {test_case['output']}")
-                        
-                        process = subprocess.run(
-                            ["mono", exe_path],
-                            input=test_case["input"].encode(),
-                            capture_output=True,
-                            timeout=5
-                        )
-                        output = process.stdout.decode().strip()
-                        error = process.stderr.decode().strip()
-                        
-                        if error:
-                            self.terminal_output.append(f"Error:\n{error}")
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Runtime Error)")
-                            continue
-                        
-                        self.terminal_output.append(f"Your Output: {output}")
-                        
-                        if output == test_case["output"]:
-                            score += test_case["points"]
-                            results.append({"passed": True, "points": test_case["points"]})
-                            self.terminal_output.append("Result: ✓ Passed")
-                        else:
-                            results.append({"passed": False, "points": 0})
-                            self.terminal_output.append("Result: ✗ Failed (Wrong Answer)")
-                            
-                except Exception as e:
-                    self.terminal_output.append(f"Error: {str(e)}")
-                    return 0, [{"passed": False, "points": 0} for _ in test_cases]
-                    
-        return score, results
+        self.grading_source = (code, language)
+        self.grading_worker = worker_class(
+            self.judge, code, language, problem["test_cases"], self, problem=problem, fail_fast=fail_fast
+        )
+        self.grading_worker.graded.connect(on_graded)
+        self.grading_worker.cancelled.connect(self.grading_cancelled)
+        self.grading_worker.finished.connect(self.grading_done)
+        
+        self.run_button.setEnabled(False)
+        self.estimate_button.setEnabled(False)
+        self.submit_button.setEnabled(False)
+        self.cancel_button.setEnabled(cancellable)
+        self.grading_worker.start()
+        
+    def stop_grading(self):
+        worker, self.grading_worker = self.grading_worker, None
+        if worker is not None:
+            worker.graded.disconnect()
+            worker.cancelled.disconnect()
+            worker.cancel()
+            worker.wait()
+            worker.deleteLater()
+            
+    def cancel_grading(self):
+        if self.grading_worker is not None:
+            self.cancel_button.setEnabled(False)
+            self.grading_worker.cancel()
+            
+    def grading_cancelled(self):
+        self.submitting = False
+        self.terminal_output.append("Cancelled. You can edit your code and try again.")
+        
+    def grading_done(self):
+        worker = self.sender()
+        if worker is not self.grading_worker:
+            return
+        self.grading_worker = None
+        self.run_button.setEnabled(True)
+        self.estimate_button.setEnabled(True)
+        self.submit_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        worker.deleteLater()
         
     def submit_answers(self):
+        # A submission is already being graded
+        if self.submitting:
+            return
+        
         # Store current answer
         current_question = self.questions[self.current_question]
         code = self.code_input.toPlainText()
         language = self.language_combo.currentText()
         
-        # Calculate time taken
-        end_time = datetime.now()
-        time_taken = end_time - self.start_time
-        minutes = time_taken.seconds // 60
-        seconds = time_taken.seconds % 60
+        # Time taken counts up to the submit, not to the end of grading
+        self.time_taken = datetime.now() - self.start_time
         
         # Log submission attempt
         self.logger.log_activity(
@@ -753,8 +370,22 @@ class DSARound2(QMainWindow):
             f'Submitted solution in {language}'
         )
         
-        # Compile and run code
-        score, test_results = self.compile_and_run(code, language, current_question["test_cases"])
+        # Compile and run code; an automatic submit when time runs out can't be cancelled
+        self.submitting = True
+        self.start_grading(
+            code,
+            language,
+            current_question,
+            self.show_submission_results,
+            cancellable=self.time_left > 0
+        )
+        
+    def show_submission_results(self, score, test_results):
+        current_question = self.questions[self.current_question]
+        self.archive_run('Submit', score, test_results)
+        time_taken = self.time_taken
+        minutes = time_taken.seconds // 60
+        seconds = time_taken.seconds % 60
         
         # Log results
         self.logger.log_activity(
@@ -764,7 +395,8 @@ class DSARound2(QMainWindow):
             'Completed',
             score,
             0,
-            f'Score: {score}/{current_question["total_points"]}'
+            f'Score: {score}/{current_question["total_points"]}; {verdict_summary(test_results)}; '
+            f'{usage_summary(test_results)}'
         )
         
         # Show score dialog
@@ -833,10 +465,14 @@ class DSARound2(QMainWindow):
                     0,
                     'Exited without completing the round'
                 )
+                self.stop_grading()
+                self.judge.close()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.stop_grading()
+            self.judge.close()
             event.accept()
 
     def run_code(self):
@@ -851,17 +487,27 @@ class DSARound2(QMainWindow):
             return
         
         # Compile and run the code
-        score, results = self.compile_and_run(
-            code,
-            language,
-            self.questions[0]["test_cases"]
+        self.start_grading(
+            code, language, self.questions[0], self.show_run_results, fail_fast=self.fail_fast_box.isChecked()
         )
         
+    def archive_run(self, kind, score, results):
+        # Keep the graded source and its verdicts for rejudging and review
+        code, language = self.grading_source
+        try:
+            self.archive.record(self.team_name, 'DSA2', self.questions[0]["id"], kind, language, code, score,
+                                verdict_summary(results))
+        except OSError as e:
+            self.terminal_output.append(f"Could not archive the code: {e}")
+
+    def show_run_results(self, score, results):
+        self.archive_run('Run', score, results)
         # Show a message with the score
         QMessageBox.information(
             self,
             "Run Results",
             f"Your code passed {sum(test['passed'] for test in results)} out of {len(results)} test cases.\n"
+            f"Verdicts: {verdict_summary(results)}\n"
             f"Score: {score}/{self.questions[0]['total_points']}"
         )
 
@@ -887,4 +533,31 @@ class DSARound2(QMainWindow):
         
         if self.time_left <= 0:
             self.timer.stop()
-            self.submit_answers() 
\ No newline at end of file
+            self.submit_answers()
+        
+    def estimate_complexity(self):
+        language = self.language_combo.currentText()
+        code = self.code_input.toPlainText()
+        
+        if not code.strip():
+            QMessageBox.warning(self, "Warning", "Please write some code before estimating its complexity.")
+            return
+        
+        # The estimate is written to the terminal as it runs
+        self.start_grading(
+            code, language, self.questions[0], self.show_complexity_results, worker_class=ComplexityWorker
+        )
+        
+    def show_complexity_results(self, estimate, _):
+        if estimate is None:
+            return
+        sizes = [n for n, _ in estimate["samples"]]
+        self.logger.log_activity(
+            'DSA2',
+            'System',
+            f'Question {self.current_question + 1}',
+            'Complexity Estimated',
+            0,
+            0,
+            f'{estimate["model"]} (R² {estimate["r_squared"]:.3f}) over n = {sizes[0]}..{sizes[-1]}'
+        )
@@ -0,0 +1,39 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class GradingWorker(QThread):
+    graded = pyqtSignal(object, object)  # Score and per-test results
+    cancelled = pyqtSignal()
+
+    def __init__(self, judge, code, language, test_cases, parent=None, problem=None, fail_fast=False):
+        super().__init__(parent)
+        self.judge = judge
+        self.code = code
+        self.language = language
+        self.test_cases = test_cases
+        self.problem = problem  # Adds the problem's hidden stress tests
+        self.fail_fast = fail_fast  # Stop at the first test case that fails
+
+    def run(self):
+        # Runs off the GUI thread; the judge streams per-test output through
+        # its own (queued) signal while we wait here
+        score, results = self.judge.compile_and_run(
+            self.code, self.language, self.test_cases, self.problem, self.fail_fast
+        )
+        if self.judge.cancelled.is_set():
+            self.cancelled.emit()
+        else:
+            self.graded.emit(score, results)
+
+    def cancel(self):
+        self.judge.cancel()
+
+
+class ComplexityWorker(GradingWorker):
+    # Same lifecycle as a grading run; graded carries (estimate or None, None)
+    def run(self):
+        estimate = self.judge.estimate_complexity(self.code, self.language, self.problem)
+        if self.judge.cancelled.is_set():
+            self.cancelled.emit()
+        else:
+            self.graded.emit(estimate, None)
@@ -5,8 +5,9 @@ import time
 from datetime import datetime
 
 class HackathonClient:
-    def __init__(self, team_name, admin_host='localhost', admin_port=5000):
+    def __init__(self, team_name, admin_host='localhost', admin_port=5000, speed_factor=None):
         self.team_name = team_name
+        self.speed_factor = speed_factor  # Machine calibration, so slow PCs stand out
         self.admin_host = admin_host
         self.admin_port = admin_port
         self.socket = None
@@ -42,7 +43,8 @@ class HackathonClient:
                 'dsa1_score': self.scores['dsa1_score'],
                 'dsa2_score': self.scores['dsa2_score'],
                 'total_score': self.scores['total_score'],
-                'status': self.scores['status']
+                'status': self.scores['status'],
+                'speed_factor': self.speed_factor
             }
             
             self.socket.send(json.dumps(data).encode())
@@ -7,6 +7,7 @@ from dsa_round1 import DSARound1
 from dsa_round2 import DSARound2
 from datetime import datetime
 from hackathon_client import HackathonClient
+from calibration import speed_factor
 
 class HackathonApp(QMainWindow):
     finished = pyqtSignal()  # Signal to indicate hackathon completion
@@ -26,8 +27,20 @@ class HackathonApp(QMainWindow):
         self.rounds_completed = {'mcq': False, 'dsa1': False, 'dsa2': False}
         self.start_time = datetime.now()
         
+        # Benchmark this PC once; the judge scales its time limits by the result
+        self.speed_factor = speed_factor()
+        self.logger.log_activity(
+            'Calibration',
+            'System',
+            '',
+            'Completed',
+            0,
+            0,
+            f'Machine speed factor: {self.speed_factor:.2f}'
+        )
+        
         # Initialize admin client
-        self.admin_client = HackathonClient(team_name)
+        self.admin_client = HackathonClient(team_name, speed_factor=self.speed_factor)
         if self.admin_client.connect():
             self.admin_client.start_heartbeat()
         
@@ -182,7 +195,7 @@ class HackathonApp(QMainWindow):
             0,
             'DSA Round 1 started'
         )
-        self.dsa1_window = DSARound1(self.team_name, self.logger)
+        self.dsa1_window = DSARound1(self.team_name, self.logger, self.speed_factor)
         self.dsa1_window.finished.connect(self.dsa1_round_finished)
         self.dsa1_window.show()
         self.dsa1_button.setEnabled(False)
@@ -219,7 +232,7 @@ class HackathonApp(QMainWindow):
             0,
             'DSA Round 2 started'
         )
-        self.dsa2_window = DSARound2(self.team_name, self.logger)
+        self.dsa2_window = DSARound2(self.team_name, self.logger, self.speed_factor)
         self.dsa2_window.finished.connect(self.dsa2_round_finished)
         self.dsa2_window.show()
         self.dsa2_button.setEnabled(False)
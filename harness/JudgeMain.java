@@ -0,0 +1,492 @@
+import java.io.*;
+import java.lang.reflect.*;
+import java.math.BigDecimal;
+import java.nio.charset.StandardCharsets;
+import java.util.*;
+
+// Entry point for Java submissions. Reads the test input from stdin,
+// converts each argument to the parameter types of Solution.solution via
+// reflection, calls it and prints the result in the same format the Python
+// harness uses.
+public class JudgeMain {
+    static final int MAX_TRACE_FRAMES = 20;
+
+    static class ParseError extends RuntimeException {
+        ParseError(String message) {
+            super(message);
+        }
+    }
+
+    public static void main(String[] args) throws IOException {
+        String input = readAll(System.in);
+        PrintStream out = new PrintStream(new BufferedOutputStream(new FileOutputStream(FileDescriptor.out), 1 << 16), false);
+        System.setOut(out);
+        int status = run(input);
+        out.flush();
+        System.exit(status);
+    }
+
+    static String readAll(InputStream in) throws IOException {
+        ByteArrayOutputStream buffer = new ByteArrayOutputStream();
+        byte[] chunk = new byte[1 << 16];
+        int n;
+        while ((n = in.read(chunk)) > 0) buffer.write(chunk, 0, n);
+        return new String(buffer.toByteArray(), StandardCharsets.UTF_8);
+    }
+
+    static int run(String input) {
+        try {
+            Class<?> solutionClass = Class.forName("Solution");
+            Method method = findSolution(solutionClass);
+            Type[] types = method.getGenericParameterTypes();
+            List<String> raw = splitArguments(input, types.length);
+            Object[] arguments = new Object[types.length];
+            for (int i = 0; i < types.length; i++) arguments[i] = parseArgument(raw.get(i), types[i]);
+
+            Object target = null;
+            if (!Modifier.isStatic(method.getModifiers())) {
+                Constructor<?> constructor = solutionClass.getDeclaredConstructor();
+                constructor.setAccessible(true);
+                target = constructor.newInstance();
+            }
+            Object result = method.invoke(target, arguments);
+            if (method.getReturnType() != void.class) System.out.println(format(result, false));
+            return 0;
+        } catch (InvocationTargetException e) {
+            return fail(e.getCause());
+        } catch (ParseError e) {
+            return fail(e.getMessage());
+        } catch (ReflectiveOperationException e) {
+            return fail(e.toString());
+        }
+    }
+
+    static int fail(String message) {
+        System.out.flush();
+        System.err.println("Error: " + message);
+        return 1;
+    }
+
+    // Exception plus the frames that belong to the submission, without the
+    // reflection and harness frames below them
+    static int fail(Throwable error) {
+        StringBuilder message = new StringBuilder(error.toString());
+        int shown = 0;
+        for (StackTraceElement frame : error.getStackTrace()) {
+            String name = frame.getClassName();
+            if (name.startsWith("java.lang.reflect.") || name.startsWith("jdk.internal.reflect.") ||
+                    name.equals("JudgeMain")) break;
+            if (shown++ == MAX_TRACE_FRAMES) {
+                message.append("\n\t...");
+                break;
+            }
+            message.append("\n\tat ").append(frame);
+        }
+        return fail(message.toString());
+    }
+
+    static Method findSolution(Class<?> solutionClass) {
+        Method found = null;
+        for (Method method : solutionClass.getDeclaredMethods()) {
+            if (!method.getName().equals("solution")) continue;
+            if (found != null) throw new ParseError("Solution declares more than one solution method");
+            found = method;
+        }
+        if (found == null) throw new ParseError("Solution has no method named solution");
+        found.setAccessible(true);
+        return found;
+    }
+
+    // -----------------------------------------------------------------------
+    // Input
+    // -----------------------------------------------------------------------
+
+    // Splits the input into `arity` arguments: one per line for multi-line
+    // input, otherwise at top-level commas ("[1,3], [2]")
+    static List<String> splitArguments(String input, int arity) {
+        String text = input.trim();
+        List<String> parts = new ArrayList<>();
+
+        if (text.indexOf('\n') >= 0) {
+            for (String line : text.split("\n", -1)) parts.add(line.trim());
+        } else if (arity > 1) {
+            int depth = 0;
+            char quote = 0;
+            int begin = 0;
+            for (int i = 0; i < text.length(); i++) {
+                char c = text.charAt(i);
+                if (quote != 0) {
+                    if (c == '\\') i++;
+                    else if (c == quote) quote = 0;
+                } else if (c == '"' || c == '\'') {
+                    quote = c;
+                } else if (c == '[') {
+                    depth++;
+                } else if (c == ']') {
+                    depth--;
+                } else if (c == ',' && depth == 0) {
+                    parts.add(text.substring(begin, i).trim());
+                    begin = i + 1;
+                }
+            }
+            parts.add(text.substring(begin).trim());
+        } else {
+            parts.add(text);
+        }
+
+        if (parts.size() != arity) {
+            throw new ParseError("solution takes " + arity + " argument(s) but the input has " + parts.size());
+        }
+        return parts;
+    }
+
+    static Object parseArgument(String text, Type type) {
+        Class<?> rawClass = rawClass(type);
+        // A bare line is one string argument even if it contains commas
+        if (rawClass == String.class || rawClass == CharSequence.class) return unquote(text);
+        if (rawClass == char.class || rawClass == Character.class) return convert(unquote(text), type);
+
+        Parser parser = new Parser(text);
+        Object value = parser.value();
+        if (!parser.atEnd()) throw new ParseError("unexpected trailing input '" + text.substring(parser.pos) + "'");
+        return convert(value, type);
+    }
+
+    static String unquote(String text) {
+        int n = text.length();
+        if (n >= 2 && (text.charAt(0) == '"' || text.charAt(0) == '\'') && text.charAt(n - 1) == text.charAt(0)) {
+            return new Parser(text).quoted();
+        }
+        return text;
+    }
+
+    // Reads the JSON/Python literal subset test inputs use into Lists,
+    // Longs, Doubles, Booleans, Strings and nulls
+    static class Parser {
+        final String text;
+        int pos;
+
+        Parser(String text) {
+            this.text = text;
+        }
+
+        void skip() {
+            while (pos < text.length() && Character.isWhitespace(text.charAt(pos))) pos++;
+        }
+
+        boolean atEnd() {
+            skip();
+            return pos >= text.length();
+        }
+
+        char peek() {
+            skip();
+            return pos < text.length() ? text.charAt(pos) : '\0';
+        }
+
+        boolean accept(char c) {
+            if (peek() != c) return false;
+            pos++;
+            return true;
+        }
+
+        void expect(char c) {
+            if (!accept(c)) throw new ParseError("expected '" + c + "' in input");
+        }
+
+        Object value() {
+            char c = peek();
+            if (c == '[') {
+                pos++;
+                List<Object> values = new ArrayList<>();
+                if (accept(']')) return values;
+                do {
+                    values.add(value());
+                } while (accept(','));
+                expect(']');
+                return values;
+            }
+            if (c == '"' || c == '\'') return quoted();
+
+            String token = token();
+            switch (token) {
+                case "null":
+                case "None":
+                    return null;
+                case "true":
+                case "True":
+                    return Boolean.TRUE;
+                case "false":
+                case "False":
+                    return Boolean.FALSE;
+            }
+            try {
+                return Long.parseLong(token);
+            } catch (NumberFormatException e) {
+                // Not an integer
+            }
+            try {
+                return Double.parseDouble(token);
+            } catch (NumberFormatException e) {
+                return token;
+            }
+        }
+
+        // Unquoted token: up to the next ',' or ']'
+        String token() {
+            skip();
+            int begin = pos;
+            while (pos < text.length() && text.charAt(pos) != ',' && text.charAt(pos) != ']') pos++;
+            return text.substring(begin, pos).trim();
+        }
+
+        String quoted() {
+            skip();
+            char quote = text.charAt(pos++);
+            StringBuilder out = new StringBuilder();
+            while (pos < text.length() && text.charAt(pos) != quote) {
+                char c = text.charAt(pos++);
+                if (c == '\\' && pos < text.length()) {
+                    c = text.charAt(pos++);
+                    if (c == 'n') c = '\n';
+                    else if (c == 't') c = '\t';
+                }
+                out.append(c);
+            }
+            if (pos >= text.length()) throw new ParseError("unterminated string in input");
+            pos++;
+            return out.toString();
+        }
+    }
+
+    static Class<?> rawClass(Type type) {
+        if (type instanceof Class) return (Class<?>) type;
+        if (type instanceof ParameterizedType) return (Class<?>) ((ParameterizedType) type).getRawType();
+        if (type instanceof GenericArrayType) {
+            return Array.newInstance(rawClass(((GenericArrayType) type).getGenericComponentType()), 0).getClass();
+        }
+        return Object.class;
+    }
+
+    static Type componentType(Type type) {
+        if (type instanceof GenericArrayType) return ((GenericArrayType) type).getGenericComponentType();
+        if (type instanceof Class && ((Class<?>) type).isArray()) return ((Class<?>) type).getComponentType();
+        if (type instanceof ParameterizedType) {
+            Type[] arguments = ((ParameterizedType) type).getActualTypeArguments();
+            if (arguments.length == 1) return arguments[0];
+        }
+        return Object.class;
+    }
+
+    static Object convert(Object value, Type type) {
+        Class<?> target = rawClass(type);
+        if (value == null) {
+            if (target.isPrimitive()) throw new ParseError("null given for a " + target.getName() + " argument");
+            return null;
+        }
+
+        if (target == int.class || target == Integer.class) return (int) number(value);
+        if (target == long.class || target == Long.class) return (long) number(value);
+        if (target == short.class || target == Short.class) return (short) number(value);
+        if (target == byte.class || target == Byte.class) return (byte) number(value);
+        if (target == double.class || target == Double.class) return decimal(value);
+        if (target == float.class || target == Float.class) return (float) decimal(value);
+        if (target == boolean.class || target == Boolean.class) {
+            if (value instanceof Boolean) return value;
+            if (value instanceof Long) return ((Long) value) != 0;
+            throw new ParseError("expected a boolean, got '" + value + "'");
+        }
+        if (target == char.class || target == Character.class) {
+            String text = String.valueOf(value);
+            if (text.length() != 1) throw new ParseError("expected a single character, got '" + text + "'");
+            return text.charAt(0);
+        }
+        if (target == String.class || target == CharSequence.class) return String.valueOf(value);
+        if (target == Object.class) return value;
+
+        if (isTree(target)) return buildTree(list(value), target);
+
+        if (target.isArray()) {
+            List<?> values = list(value);
+            Type component = componentType(type);
+            Object array = Array.newInstance(rawClass(component), values.size());
+            for (int i = 0; i < values.size(); i++) Array.set(array, i, convert(values.get(i), component));
+            return array;
+        }
+        if (target.isAssignableFrom(ArrayList.class)) {
+            Type component = componentType(type);
+            List<Object> values = new ArrayList<>();
+            for (Object item : list(value)) values.add(convert(item, component));
+            return values;
+        }
+        throw new ParseError("unsupported parameter type " + type.getTypeName());
+    }
+
+    static long number(Object value) {
+        if (value instanceof Long) return (Long) value;
+        throw new ParseError("expected an integer, got '" + value + "'");
+    }
+
+    static double decimal(Object value) {
+        if (value instanceof Number) return ((Number) value).doubleValue();
+        throw new ParseError("expected a number, got '" + value + "'");
+    }
+
+    static List<?> list(Object value) {
+        if (value instanceof List) return (List<?>) value;
+        throw new ParseError("expected a list, got '" + value + "'");
+    }
+
+    // -----------------------------------------------------------------------
+    // Trees, handled reflectively so a submission's own TreeNode works too
+    // -----------------------------------------------------------------------
+
+    static Field treeField(Class<?> type, String name) {
+        try {
+            Field field = type.getDeclaredField(name);
+            field.setAccessible(true);
+            return field;
+        } catch (NoSuchFieldException e) {
+            return null;
+        }
+    }
+
+    static boolean isTree(Class<?> type) {
+        return treeField(type, "val") != null && treeField(type, "left") != null && treeField(type, "right") != null;
+    }
+
+    // Level-order list with nulls, e.g. [3,9,20,null,null,15,7]
+    static Object buildTree(List<?> values, Class<?> type) {
+        try {
+            Constructor<?> constructor = type.getDeclaredConstructor();
+            constructor.setAccessible(true);
+            Field val = treeField(type, "val");
+            Field left = treeField(type, "left");
+            Field right = treeField(type, "right");
+
+            Object[] nodes = new Object[values.size()];
+            for (int i = 0; i < nodes.length; i++) {
+                if (values.get(i) == null) continue;
+                nodes[i] = constructor.newInstance();
+                val.set(nodes[i], (int) number(values.get(i)));
+            }
+            if (nodes.length == 0 || nodes[0] == null) return null;
+
+            int child = 1;
+            for (int i = 0; i < nodes.length && child < nodes.length; i++) {
+                if (nodes[i] == null) continue;
+                left.set(nodes[i], nodes[child++]);
+                if (child < nodes.length) right.set(nodes[i], nodes[child++]);
+            }
+            return nodes[0];
+        } catch (ReflectiveOperationException e) {
+            throw new ParseError("cannot build " + type.getName() + ": " + e);
+        }
+    }
+
+    // Trees print back as their level-order list, trailing nulls trimmed
+    static void formatTree(Object root, StringBuilder out) throws IllegalAccessException {
+        Class<?> type = root.getClass();
+        Field val = treeField(type, "val");
+        Field left = treeField(type, "left");
+        Field right = treeField(type, "right");
+
+        List<Object> order = new ArrayList<>();
+        order.add(root);
+        for (int i = 0; i < order.size(); i++) {
+            Object node = order.get(i);
+            if (node == null) continue;
+            order.add(left.get(node));
+            order.add(right.get(node));
+        }
+        int size = order.size();
+        while (size > 0 && order.get(size - 1) == null) size--;
+
+        out.append('[');
+        for (int i = 0; i < size; i++) {
+            if (i > 0) out.append(',');
+            Object node = order.get(i);
+            out.append(node == null ? "null" : String.valueOf(val.get(node)));
+        }
+        out.append(']');
+    }
+
+    // -----------------------------------------------------------------------
+    // Output
+    // -----------------------------------------------------------------------
+
+    static String format(Object value, boolean nested) {
+        StringBuilder out = new StringBuilder();
+        try {
+            format(value, nested, out);
+        } catch (IllegalAccessException e) {
+            throw new ParseError("cannot print result: " + e);
+        }
+        return out.toString();
+    }
+
+    static void format(Object value, boolean nested, StringBuilder out) throws IllegalAccessException {
+        if (value == null) {
+            out.append(nested ? "null" : "None");
+        } else if (value instanceof Boolean) {
+            boolean flag = (Boolean) value;
+            out.append(nested ? (flag ? "true" : "false") : (flag ? "True" : "False"));
+        } else if (value instanceof Double || value instanceof Float) {
+            out.append(formatDecimal(((Number) value).doubleValue()));
+        } else if (value instanceof String || value instanceof Character) {
+            out.append(nested ? quote(value.toString()) : value.toString());
+        } else if (value.getClass().isArray()) {
+            out.append('[');
+            for (int i = 0; i < Array.getLength(value); i++) {
+                if (i > 0) out.append(',');
+                format(Array.get(value, i), true, out);
+            }
+            out.append(']');
+        } else if (value instanceof Iterable) {
+            out.append('[');
+            boolean first = true;
+            for (Object item : (Iterable<?>) value) {
+                if (!first) out.append(',');
+                first = false;
+                format(item, true, out);
+            }
+            out.append(']');
+        } else if (value instanceof Map) {
+            out.append('{');
+            boolean first = true;
+            for (Map.Entry<?, ?> entry : ((Map<?, ?>) value).entrySet()) {
+                if (!first) out.append(',');
+                first = false;
+                out.append(quote(String.valueOf(entry.getKey()))).append(':');
+                format(entry.getValue(), true, out);
+            }
+            out.append('}');
+        } else if (isTree(value.getClass())) {
+            formatTree(value, out);
+        } else {
+            out.append(value);
+        }
+    }
+
+    // Python's repr: 2.0, 0.5, 10000000000.0
+    static String formatDecimal(double value) {
+        String text = Double.toString(value);
+        if (Double.isInfinite(value) || Double.isNaN(value)) return value > 0 ? "inf" : value < 0 ? "-inf" : "nan";
+        if (text.contains("E") && Math.abs(value) >= 1e-4 && Math.abs(value) < 1e16) {
+            text = new BigDecimal(text).toPlainString();
+            if (!text.contains(".")) text += ".0";
+        }
+        return text;
+    }
+
+    static String quote(String text) {
+        StringBuilder out = new StringBuilder("\"");
+        for (int i = 0; i < text.length(); i++) {
+            char c = text.charAt(i);
+            if (c == '"' || c == '\\') out.append('\\').append(c);
+            else if (c == '\n') out.append("\\n");
+            else out.append(c);
+        }
+        return out.append('"').toString();
+    }
+}
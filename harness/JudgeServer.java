@@ -0,0 +1,171 @@
+import java.io.*;
+import java.lang.management.ManagementFactory;
+import java.lang.management.ThreadMXBean;
+import java.lang.reflect.Method;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.util.concurrent.atomic.AtomicLong;
+
+// Persistent runner for Java submissions: one JVM answers every test case of
+// a submission, so only the first case pays for JVM startup. Each case runs
+// JudgeMain in a fresh class loader (static fields start over) on its own
+// thread. A runaway thread cannot be stopped safely, so a timed-out case ends
+// the JVM and the judge starts a new one.
+//
+// Output beyond the request's byte limit ends the case the same way.
+//
+// Request:  "<timeout ms> <output limit> <input bytes>\n" followed by the input
+// Response: "<ok|timeout|output_limit> <stdout bytes> <stderr bytes> <user us> <system us> <peak KB> <wall us>\n"
+//           followed by both. CPU time is the case thread's own (JIT and GC threads
+//           are not counted); the peak is the JVM's resident high-water mark, 0 if unknown.
+//           Wall time runs from the case thread's start, so neither JVM startup nor
+//           cases queued ahead of this one count against it.
+public class JudgeServer {
+    static final long POLL_MS = 10;  // How often a running case's output budget is checked
+
+    public static void main(String[] args) throws Exception {
+        URL[] classpath = classpath();
+        InputStream requests = new BufferedInputStream(System.in);
+        OutputStream responses = new BufferedOutputStream(new FileOutputStream(FileDescriptor.out));
+
+        String header;
+        while ((header = readLine(requests)) != null) {
+            String[] fields = header.trim().split(" ");
+            long timeout = Long.parseLong(fields[0]);
+            long outputLimit = Long.parseLong(fields[1]);
+            byte[] input = new byte[Integer.parseInt(fields[2])];
+            new DataInputStream(requests).readFully(input);
+            runCase(classpath, input, timeout, outputLimit, responses);
+        }
+    }
+
+    static URL[] classpath() throws IOException {
+        String[] entries = System.getProperty("java.class.path").split(File.pathSeparator);
+        URL[] urls = new URL[entries.length];
+        for (int i = 0; i < entries.length; i++) urls[i] = new File(entries[i]).toURI().toURL();
+        return urls;
+    }
+
+    static String readLine(InputStream in) throws IOException {
+        ByteArrayOutputStream line = new ByteArrayOutputStream();
+        int c;
+        while ((c = in.read()) != '\n') {
+            if (c < 0) return null;
+            line.write(c);
+        }
+        return new String(line.toByteArray(), StandardCharsets.UTF_8);
+    }
+
+    static void runCase(URL[] classpath, byte[] input, long timeout, long outputLimit, OutputStream responses)
+            throws Exception {
+        AtomicLong budget = new AtomicLong(outputLimit);
+        ByteArrayOutputStream out = new LimitedOutput(budget);
+        ByteArrayOutputStream err = new LimitedOutput(budget);
+        PrintStream caseOut = new PrintStream(out, false, "UTF-8");
+        PrintStream caseErr = new PrintStream(err, true, "UTF-8");
+        System.setIn(new ByteArrayInputStream(input));
+        System.setOut(caseOut);
+        System.setErr(caseErr);
+
+        long[] cpu = new long[2];  // User and total CPU nanoseconds of the case thread
+        Thread thread = new Thread(() -> {
+            try (URLClassLoader loader = new SubmissionLoader(classpath)) {
+                Method run = loader.loadClass("JudgeMain").getDeclaredMethod("run", String.class);
+                run.setAccessible(true);
+                run.invoke(null, new String(input, StandardCharsets.UTF_8));
+            } catch (Throwable e) {
+                e.printStackTrace();
+            } finally {
+                ThreadMXBean threads = ManagementFactory.getThreadMXBean();
+                cpu[0] = threads.getCurrentThreadUserTime();
+                cpu[1] = threads.getCurrentThreadCpuTime();
+            }
+        });
+        thread.setDaemon(true);
+        long started = System.nanoTime();
+        thread.start();
+        long deadline = System.currentTimeMillis() + timeout;
+        while (thread.isAlive() && budget.get() >= 0) {
+            long left = deadline - System.currentTimeMillis();
+            if (left <= 0) break;
+            thread.join(Math.min(left, POLL_MS));
+        }
+        long wall = (System.nanoTime() - started) / 1000;
+        caseOut.flush();
+        caseErr.flush();
+        boolean overflow = budget.get() < 0;
+        boolean timedOut = thread.isAlive() && !overflow;
+
+        byte[] stdout = overflow ? new byte[0] : out.toByteArray();
+        byte[] stderr = overflow ? new byte[0] : err.toByteArray();
+        String status = overflow ? "output_limit" : timedOut ? "timeout" : "ok";
+        long user = Math.max(cpu[0], 0) / 1000;
+        long system = Math.max(cpu[1] - cpu[0], 0) / 1000;
+        String header = status + " " + stdout.length + " " + stderr.length + " " + user + " " + system + " " + peakKb() + " " + wall;
+        responses.write((header + "\n").getBytes(StandardCharsets.UTF_8));
+        responses.write(stdout);
+        responses.write(stderr);
+        responses.flush();
+
+        if (thread.isAlive()) Runtime.getRuntime().halt(0);
+    }
+
+    static long peakKb() {
+        // VmHWM: peak resident set size on Linux
+        try (BufferedReader status = new BufferedReader(new FileReader("/proc/self/status"))) {
+            String line;
+            while ((line = status.readLine()) != null) {
+                if (line.startsWith("VmHWM:")) return Long.parseLong(line.replaceAll("[^0-9]", ""));
+            }
+        } catch (IOException | NumberFormatException e) {
+            // Not Linux
+        }
+        return 0;
+    }
+
+    // Capture for one of a case's streams; stdout and stderr draw on a shared
+    // byte budget, and writes past it are dropped
+    static class LimitedOutput extends ByteArrayOutputStream {
+        final AtomicLong budget;
+
+        LimitedOutput(AtomicLong budget) {
+            this.budget = budget;
+        }
+
+        @Override
+        public synchronized void write(int b) {
+            if (budget.decrementAndGet() >= 0) super.write(b);
+        }
+
+        @Override
+        public synchronized void write(byte[] b, int off, int len) {
+            if (budget.addAndGet(-len) >= 0) super.write(b, off, len);
+        }
+    }
+
+    // Child-first loader over the JVM's own classpath, so every case gets its
+    // own copy of Solution, JudgeMain and whatever they load
+    static class SubmissionLoader extends URLClassLoader {
+        SubmissionLoader(URL[] classpath) {
+            super(classpath, JudgeServer.class.getClassLoader());
+        }
+
+        @Override
+        protected Class<?> loadClass(String name, boolean resolve) throws ClassNotFoundException {
+            synchronized (getClassLoadingLock(name)) {
+                Class<?> loaded = findLoadedClass(name);
+                if (loaded == null && !name.startsWith("java.") && !name.startsWith("JudgeServer")) {
+                    try {
+                        loaded = findClass(name);
+                    } catch (ClassNotFoundException e) {
+                        // Not ours: ask the parent
+                    }
+                }
+                if (loaded == null) loaded = super.loadClass(name, false);
+                if (resolve) resolveClass(loaded);
+                return loaded;
+            }
+        }
+    }
+}
@@ -0,0 +1,427 @@
+/* Harness included ahead of every C submission. JUDGE_RUN(solution) picks
+ * the call wrapper matching solution's signature with _Generic, so a
+ * submission with an unsupported signature fails to compile instead of
+ * being misread. Arrays follow the usual (pointer, size) convention and
+ * returned arrays report their length through a trailing int* returnSize. */
+#ifndef JUDGE_HARNESS_H
+#define JUDGE_HARNESS_H
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdbool.h>
+#include <ctype.h>
+#include <limits.h>
+#include <math.h>
+
+struct TreeNode {
+    int val;
+    struct TreeNode *left;
+    struct TreeNode *right;
+};
+
+#define JUDGE_MAX_ARGS 8
+
+static char *judge_input;
+static char *judge_args[JUDGE_MAX_ARGS];
+
+static void judge_fail(const char *message) {
+    fflush(stdout);
+    fprintf(stderr, "Error: %s\n", message);
+    exit(1);
+}
+
+static void *judge_alloc(size_t size) {
+    void *p = malloc(size ? size : 1);
+    if (p == NULL) judge_fail("out of memory");
+    return p;
+}
+
+static char *judge_trim(char *s) {
+    while (isspace((unsigned char)*s)) s++;
+    char *end = s + strlen(s);
+    while (end > s && isspace((unsigned char)end[-1])) end--;
+    *end = '\0';
+    return s;
+}
+
+static void judge_read_input(void) {
+    size_t size = 0, capacity = 4096;
+    judge_input = judge_alloc(capacity);
+    size_t n;
+    while ((n = fread(judge_input + size, 1, capacity - size - 1, stdin)) > 0) {
+        size += n;
+        if (capacity - size - 1 == 0) {
+            capacity *= 2;
+            judge_input = realloc(judge_input, capacity);
+            if (judge_input == NULL) judge_fail("out of memory");
+        }
+    }
+    judge_input[size] = '\0';
+}
+
+/* Splits the input into `arity` arguments: one per line for multi-line
+ * input, otherwise at top-level commas ("[1,3], [2]") */
+static void judge_split(int arity) {
+    char *text = judge_trim(judge_input);
+    int count = 0;
+
+    if (strchr(text, '\n') != NULL) {
+        char *line = text;
+        while (line != NULL) {
+            char *next = strchr(line, '\n');
+            if (next != NULL) *next++ = '\0';
+            if (count < JUDGE_MAX_ARGS) judge_args[count] = judge_trim(line);
+            count++;
+            line = next;
+        }
+    } else if (arity > 1) {
+        int depth = 0;
+        char quote = 0;
+        judge_args[count++] = text;
+        for (char *p = text; *p; p++) {
+            if (quote) {
+                if (*p == '\\' && p[1]) p++;
+                else if (*p == quote) quote = 0;
+            } else if (*p == '"' || *p == '\'') {
+                quote = *p;
+            } else if (*p == '[') {
+                depth++;
+            } else if (*p == ']') {
+                depth--;
+            } else if (*p == ',' && depth == 0) {
+                *p = '\0';
+                if (count < JUDGE_MAX_ARGS) judge_args[count] = p + 1;
+                count++;
+            }
+        }
+        for (int i = 0; i < count && i < JUDGE_MAX_ARGS; i++) judge_args[i] = judge_trim(judge_args[i]);
+    } else {
+        judge_args[count++] = text;
+    }
+
+    if (count != arity) {
+        char message[96];
+        snprintf(message, sizeof(message), "solution takes %d argument(s) but the input has %d", arity, count);
+        judge_fail(message);
+    }
+}
+
+/* ------------------------------------------------------------------------
+ * Input
+ * ------------------------------------------------------------------------ */
+
+static void judge_skip(const char **p) {
+    while (isspace((unsigned char)**p)) (*p)++;
+}
+
+static void judge_expect(const char **p, char c) {
+    judge_skip(p);
+    if (**p != c) {
+        char message[32];
+        snprintf(message, sizeof(message), "expected '%c' in input", c);
+        judge_fail(message);
+    }
+    (*p)++;
+}
+
+static bool judge_accept(const char **p, char c) {
+    judge_skip(p);
+    if (**p != c) return false;
+    (*p)++;
+    return true;
+}
+
+static bool judge_accept_null(const char **p) {
+    judge_skip(p);
+    if (strncmp(*p, "null", 4) == 0 || strncmp(*p, "None", 4) == 0) {
+        *p += 4;
+        return true;
+    }
+    return false;
+}
+
+static long long judge_read_integer(const char **p) {
+    judge_skip(p);
+    char *end;
+    long long value = strtoll(*p, &end, 10);
+    if (end == *p) judge_fail("expected an integer in input");
+    *p = end;
+    return value;
+}
+
+static int judge_int(int index) {
+    const char *p = judge_args[index];
+    int value = (int)judge_read_integer(&p);
+    judge_skip(&p);
+    if (*p) judge_fail("expected a single integer argument");
+    return value;
+}
+
+static char *judge_string(int index) {
+    char *s = judge_args[index];
+    size_t n = strlen(s);
+    if (n >= 2 && (s[0] == '"' || s[0] == '\'') && s[n - 1] == s[0]) {
+        s[n - 1] = '\0';
+        s++;
+    }
+    return s;
+}
+
+static int *judge_read_int_array(const char **p, int *size) {
+    int capacity = 16;
+    int *values = judge_alloc(capacity * sizeof(int));
+    *size = 0;
+    judge_expect(p, '[');
+    if (!judge_accept(p, ']')) {
+        do {
+            if (*size == capacity) {
+                capacity *= 2;
+                values = realloc(values, capacity * sizeof(int));
+                if (values == NULL) judge_fail("out of memory");
+            }
+            values[(*size)++] = (int)judge_read_integer(p);
+        } while (judge_accept(p, ','));
+        judge_expect(p, ']');
+    }
+    return values;
+}
+
+static int *judge_int_array(int index, int *size) {
+    const char *p = judge_args[index];
+    return judge_read_int_array(&p, size);
+}
+
+static int **judge_int_grid(int index, int *rows, int **cols) {
+    const char *p = judge_args[index];
+    int capacity = 16;
+    int **grid = judge_alloc(capacity * sizeof(int *));
+    int *widths = judge_alloc(capacity * sizeof(int));
+    *rows = 0;
+    judge_expect(&p, '[');
+    if (!judge_accept(&p, ']')) {
+        do {
+            if (*rows == capacity) {
+                capacity *= 2;
+                grid = realloc(grid, capacity * sizeof(int *));
+                widths = realloc(widths, capacity * sizeof(int));
+                if (grid == NULL || widths == NULL) judge_fail("out of memory");
+            }
+            grid[*rows] = judge_read_int_array(&p, &widths[*rows]);
+            (*rows)++;
+        } while (judge_accept(&p, ','));
+        judge_expect(&p, ']');
+    }
+    *cols = widths;
+    return grid;
+}
+
+/* Level-order list with nulls, e.g. [3,9,20,null,null,15,7] */
+static struct TreeNode *judge_tree(int index) {
+    const char *p = judge_args[index];
+    int capacity = 16, count = 0;
+    struct TreeNode **nodes = judge_alloc(capacity * sizeof(struct TreeNode *));
+    judge_expect(&p, '[');
+    if (!judge_accept(&p, ']')) {
+        do {
+            if (count == capacity) {
+                capacity *= 2;
+                nodes = realloc(nodes, capacity * sizeof(struct TreeNode *));
+                if (nodes == NULL) judge_fail("out of memory");
+            }
+            struct TreeNode *node = NULL;
+            if (!judge_accept_null(&p)) {
+                node = judge_alloc(sizeof(struct TreeNode));
+                node->val = (int)judge_read_integer(&p);
+                node->left = node->right = NULL;
+            }
+            nodes[count++] = node;
+        } while (judge_accept(&p, ','));
+        judge_expect(&p, ']');
+    }
+    if (count == 0 || nodes[0] == NULL) return NULL;
+
+    int child = 1;
+    for (int i = 0; i < count && child < count; i++) {
+        if (nodes[i] == NULL) continue;
+        nodes[i]->left = nodes[child++];
+        if (child < count) nodes[i]->right = nodes[child++];
+    }
+    return nodes[0];
+}
+
+/* ------------------------------------------------------------------------
+ * Output, formatted like the Python harness
+ * ------------------------------------------------------------------------ */
+
+static void judge_print_bool(bool value) {
+    printf("%s\n", value ? "True" : "False");
+}
+
+static void judge_print_double(double value) {
+    char buffer[64];
+    for (int precision = 1; precision <= 17; precision++) {
+        snprintf(buffer, sizeof(buffer), "%.*g", precision, value);
+        if (strtod(buffer, NULL) == value) break;
+    }
+    if (isfinite(value) && strpbrk(buffer, ".en") == NULL) strcat(buffer, ".0");
+    printf("%s\n", buffer);
+}
+
+static void judge_print_string(const char *value) {
+    printf("%s\n", value ? value : "");
+}
+
+static void judge_print_int_array(const int *values, int size) {
+    putchar('[');
+    for (int i = 0; i < size; i++) printf(i ? ",%d" : "%d", values[i]);
+    printf("]\n");
+}
+
+/* ------------------------------------------------------------------------
+ * Dispatch: one wrapper per supported signature
+ * ------------------------------------------------------------------------ */
+
+static int judge_run_i_i(int (*f)(int)) {
+    judge_split(1);
+    printf("%d\n", f(judge_int(0)));
+    return 0;
+}
+
+static int judge_run_b_i(bool (*f)(int)) {
+    judge_split(1);
+    judge_print_bool(f(judge_int(0)));
+    return 0;
+}
+
+static int judge_run_i_s(int (*f)(char *)) {
+    judge_split(1);
+    printf("%d\n", f(judge_string(0)));
+    return 0;
+}
+
+static int judge_run_b_s(bool (*f)(char *)) {
+    judge_split(1);
+    judge_print_bool(f(judge_string(0)));
+    return 0;
+}
+
+static int judge_run_s_s(char *(*f)(char *)) {
+    judge_split(1);
+    judge_print_string(f(judge_string(0)));
+    return 0;
+}
+
+static int judge_run_s_ss(char *(*f)(char *, char *)) {
+    judge_split(2);
+    judge_print_string(f(judge_string(0), judge_string(1)));
+    return 0;
+}
+
+static int judge_run_i_t(int (*f)(struct TreeNode *)) {
+    judge_split(1);
+    printf("%d\n", f(judge_tree(0)));
+    return 0;
+}
+
+static int judge_run_b_t(bool (*f)(struct TreeNode *)) {
+    judge_split(1);
+    judge_print_bool(f(judge_tree(0)));
+    return 0;
+}
+
+static int judge_run_a_t(int *(*f)(struct TreeNode *, int *)) {
+    judge_split(1);
+    int size = 0;
+    int *result = f(judge_tree(0), &size);
+    judge_print_int_array(result, size);
+    return 0;
+}
+
+static int judge_run_i_a(int (*f)(int *, int)) {
+    judge_split(1);
+    int size;
+    int *values = judge_int_array(0, &size);
+    printf("%d\n", f(values, size));
+    return 0;
+}
+
+static int judge_run_l_a(long long (*f)(int *, int)) {
+    judge_split(1);
+    int size;
+    int *values = judge_int_array(0, &size);
+    printf("%lld\n", f(values, size));
+    return 0;
+}
+
+static int judge_run_b_a(bool (*f)(int *, int)) {
+    judge_split(1);
+    int size;
+    int *values = judge_int_array(0, &size);
+    judge_print_bool(f(values, size));
+    return 0;
+}
+
+static int judge_run_a_a(int *(*f)(int *, int, int *)) {
+    judge_split(1);
+    int size, result_size = 0;
+    int *values = judge_int_array(0, &size);
+    int *result = f(values, size, &result_size);
+    judge_print_int_array(result, result_size);
+    return 0;
+}
+
+static int judge_run_i_ai(int (*f)(int *, int, int)) {
+    judge_split(2);
+    int size;
+    int *values = judge_int_array(0, &size);
+    printf("%d\n", f(values, size, judge_int(1)));
+    return 0;
+}
+
+static int judge_run_a_ai(int *(*f)(int *, int, int, int *)) {
+    judge_split(2);
+    int size, result_size = 0;
+    int *values = judge_int_array(0, &size);
+    int *result = f(values, size, judge_int(1), &result_size);
+    judge_print_int_array(result, result_size);
+    return 0;
+}
+
+static int judge_run_d_aa(double (*f)(int *, int, int *, int)) {
+    judge_split(2);
+    int size1, size2;
+    int *first = judge_int_array(0, &size1);
+    int *second = judge_int_array(1, &size2);
+    judge_print_double(f(first, size1, second, size2));
+    return 0;
+}
+
+static int judge_run_i_g(int (*f)(int **, int, int *)) {
+    judge_split(1);
+    int rows, *cols;
+    int **grid = judge_int_grid(0, &rows, &cols);
+    printf("%d\n", f(grid, rows, cols));
+    return 0;
+}
+
+#define JUDGE_RUN(f) (judge_read_input(), _Generic((&f), \
+    int (*)(int): judge_run_i_i, \
+    bool (*)(int): judge_run_b_i, \
+    int (*)(char *): judge_run_i_s, \
+    bool (*)(char *): judge_run_b_s, \
+    char *(*)(char *): judge_run_s_s, \
+    char *(*)(char *, char *): judge_run_s_ss, \
+    int (*)(struct TreeNode *): judge_run_i_t, \
+    bool (*)(struct TreeNode *): judge_run_b_t, \
+    int *(*)(struct TreeNode *, int *): judge_run_a_t, \
+    int (*)(int *, int): judge_run_i_a, \
+    long long (*)(int *, int): judge_run_l_a, \
+    bool (*)(int *, int): judge_run_b_a, \
+    int *(*)(int *, int, int *): judge_run_a_a, \
+    int (*)(int *, int, int): judge_run_i_ai, \
+    int *(*)(int *, int, int, int *): judge_run_a_ai, \
+    double (*)(int *, int, int *, int): judge_run_d_aa, \
+    int (*)(int **, int, int *): judge_run_i_g)(&f))
+
+#endif
@@ -0,0 +1,424 @@
+// Harness included ahead of every C++ submission. It reads the test input
+// from stdin, converts each argument to the parameter types of the
+// contestant's free function `solution`, calls it and prints the result in
+// the same format the Python harness uses.
+#ifndef JUDGE_HARNESS_HPP
+#define JUDGE_HARNESS_HPP
+
+#include <iostream>
+#include <vector>
+#include <string>
+#include <sstream>
+#include <algorithm>
+#include <map>
+#include <set>
+#include <unordered_map>
+#include <unordered_set>
+#include <queue>
+#include <deque>
+#include <stack>
+#include <tuple>
+#include <utility>
+#include <functional>
+#include <numeric>
+#include <climits>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <stdexcept>
+#include <type_traits>
+
+using namespace std;
+
+struct TreeNode {
+    int val;
+    TreeNode *left;
+    TreeNode *right;
+    TreeNode() : val(0), left(nullptr), right(nullptr) {}
+    TreeNode(int x) : val(x), left(nullptr), right(nullptr) {}
+    TreeNode(int x, TreeNode *left, TreeNode *right) : val(x), left(left), right(right) {}
+};
+
+namespace judge {
+
+struct ParseError : std::runtime_error {
+    ParseError(const std::string& message) : std::runtime_error(message) {}
+};
+
+// ---------------------------------------------------------------------------
+// Input
+// ---------------------------------------------------------------------------
+
+inline std::string trim(const std::string& s) {
+    size_t begin = s.find_first_not_of(" \t\r\n");
+    if (begin == std::string::npos) return "";
+    size_t end = s.find_last_not_of(" \t\r\n");
+    return s.substr(begin, end - begin + 1);
+}
+
+// Cursor over one argument's text, e.g. "[1,2,null]" or "racecar"
+struct Cursor {
+    const std::string& text;
+    size_t pos;
+
+    Cursor(const std::string& text) : text(text), pos(0) {}
+
+    void skip() {
+        while (pos < text.size() && isspace((unsigned char)text[pos])) pos++;
+    }
+    bool at_end() { skip(); return pos >= text.size(); }
+    char peek() { skip(); return pos < text.size() ? text[pos] : '\0'; }
+    void expect(char c) {
+        if (peek() != c) throw ParseError(std::string("expected '") + c + "' in input");
+        pos++;
+    }
+    bool accept(char c) {
+        if (peek() != c) return false;
+        pos++;
+        return true;
+    }
+    bool accept_word(const char* word) {
+        skip();
+        size_t n = strlen(word);
+        if (text.compare(pos, n, word) != 0) return false;
+        pos += n;
+        return true;
+    }
+    // Unquoted token inside a list: up to the next ',' or ']'
+    std::string token() {
+        skip();
+        size_t begin = pos;
+        while (pos < text.size() && text[pos] != ',' && text[pos] != ']') pos++;
+        return trim(text.substr(begin, pos - begin));
+    }
+    std::string quoted() {
+        char quote = text[pos++];
+        std::string out;
+        while (pos < text.size() && text[pos] != quote) {
+            char c = text[pos++];
+            if (c == '\\' && pos < text.size()) {
+                c = text[pos++];
+                if (c == 'n') c = '\n';
+                else if (c == 't') c = '\t';
+            }
+            out += c;
+        }
+        if (pos >= text.size()) throw ParseError("unterminated string in input");
+        pos++;
+        return out;
+    }
+    bool at_null() {
+        skip();
+        size_t save = pos;
+        if (accept_word("null") || accept_word("None")) {
+            char c = peek();
+            if (c == ',' || c == ']' || c == '\0') return true;
+        }
+        pos = save;
+        return false;
+    }
+};
+
+template <class T, class Enable = void>
+struct Reader;
+
+template <class T>
+struct Reader<T, typename std::enable_if<std::is_integral<T>::value && !std::is_same<T, bool>::value &&
+                                         !std::is_same<T, char>::value>::type> {
+    static T read(Cursor& in) {
+        std::string token = in.peek() == '"' ? in.quoted() : in.token();
+        char* end = nullptr;
+        long long value = strtoll(token.c_str(), &end, 10);
+        if (token.empty() || *end != '\0') throw ParseError("expected an integer, got '" + token + "'");
+        return (T)value;
+    }
+};
+
+template <class T>
+struct Reader<T, typename std::enable_if<std::is_floating_point<T>::value>::type> {
+    static T read(Cursor& in) {
+        std::string token = in.token();
+        char* end = nullptr;
+        double value = strtod(token.c_str(), &end);
+        if (token.empty() || *end != '\0') throw ParseError("expected a number, got '" + token + "'");
+        return (T)value;
+    }
+};
+
+template <>
+struct Reader<bool> {
+    static bool read(Cursor& in) {
+        std::string token = in.token();
+        if (token == "true" || token == "True" || token == "1") return true;
+        if (token == "false" || token == "False" || token == "0") return false;
+        throw ParseError("expected a boolean, got '" + token + "'");
+    }
+};
+
+template <>
+struct Reader<char> {
+    static char read(Cursor& in) {
+        std::string token = in.peek() == '"' || in.peek() == '\'' ? in.quoted() : in.token();
+        if (token.size() != 1) throw ParseError("expected a single character, got '" + token + "'");
+        return token[0];
+    }
+};
+
+template <>
+struct Reader<std::string> {
+    static std::string read(Cursor& in) {
+        char c = in.peek();
+        if (c == '"' || c == '\'') return in.quoted();
+        return in.token();
+    }
+};
+
+template <class T>
+struct Reader<std::vector<T> > {
+    static std::vector<T> read(Cursor& in) {
+        std::vector<T> values;
+        in.expect('[');
+        if (in.accept(']')) return values;
+        do {
+            values.push_back(Reader<T>::read(in));
+        } while (in.accept(','));
+        in.expect(']');
+        return values;
+    }
+};
+
+template <>
+struct Reader<TreeNode*> {
+    // Level-order list with nulls, e.g. [3,9,20,null,null,15,7]
+    static TreeNode* read(Cursor& in) {
+        std::vector<TreeNode*> nodes;
+        in.expect('[');
+        if (!in.accept(']')) {
+            do {
+                nodes.push_back(in.at_null() ? nullptr : new TreeNode(Reader<int>::read(in)));
+            } while (in.accept(','));
+            in.expect(']');
+        }
+        if (nodes.empty() || nodes[0] == nullptr) return nullptr;
+
+        size_t child = 1;
+        for (size_t i = 0; i < nodes.size() && child < nodes.size(); i++) {
+            if (nodes[i] == nullptr) continue;
+            nodes[i]->left = nodes[child++];
+            if (child < nodes.size()) nodes[i]->right = nodes[child++];
+        }
+        return nodes[0];
+    }
+};
+
+template <class T>
+T parse_argument(const std::string& raw) {
+    std::string text = trim(raw);
+    Cursor in(text);
+    T value = Reader<T>::read(in);
+    if (!in.at_end()) throw ParseError("unexpected trailing input '" + text.substr(in.pos) + "'");
+    return value;
+}
+
+// A bare line is one string argument even if it contains commas
+template <>
+inline std::string parse_argument<std::string>(const std::string& raw) {
+    std::string text = trim(raw);
+    if (text.size() >= 2 && (text[0] == '"' || text[0] == '\'') && text[text.size() - 1] == text[0]) {
+        Cursor in(text);
+        return in.quoted();
+    }
+    return text;
+}
+
+// Splits the input into `arity` arguments: one per line for multi-line
+// input, otherwise at top-level commas ("[1,3], [2]")
+inline std::vector<std::string> split_arguments(const std::string& input, size_t arity) {
+    std::string text = trim(input);
+    std::vector<std::string> parts;
+
+    if (text.find('\n') != std::string::npos) {
+        std::istringstream lines(text);
+        std::string line;
+        while (std::getline(lines, line)) parts.push_back(line);
+    } else if (arity > 1) {
+        int depth = 0;
+        char quote = 0;
+        size_t begin = 0;
+        for (size_t i = 0; i < text.size(); i++) {
+            char c = text[i];
+            if (quote) {
+                if (c == '\\') i++;
+                else if (c == quote) quote = 0;
+            } else if (c == '"' || c == '\'') {
+                quote = c;
+            } else if (c == '[') {
+                depth++;
+            } else if (c == ']') {
+                depth--;
+            } else if (c == ',' && depth == 0) {
+                parts.push_back(text.substr(begin, i - begin));
+                begin = i + 1;
+            }
+        }
+        parts.push_back(text.substr(begin));
+    } else {
+        parts.push_back(text);
+    }
+
+    if (parts.size() != arity) {
+        std::ostringstream message;
+        message << "solution takes " << arity << " argument(s) but the input has " << parts.size();
+        throw ParseError(message.str());
+    }
+    return parts;
+}
+
+// ---------------------------------------------------------------------------
+// Output
+// ---------------------------------------------------------------------------
+
+inline void write(std::ostream& out, const std::string& value, bool nested);
+
+template <class T>
+typename std::enable_if<std::is_integral<T>::value && !std::is_same<T, bool>::value &&
+                        !std::is_same<T, char>::value>::type
+write(std::ostream& out, T value, bool) {
+    out << value;
+}
+
+inline void write(std::ostream& out, bool value, bool nested) {
+    out << (nested ? (value ? "true" : "false") : (value ? "True" : "False"));
+}
+
+// Shortest representation that round-trips, with Python's trailing ".0"
+inline void write(std::ostream& out, double value, bool) {
+    char buffer[64];
+    for (int precision = 1; precision <= 17; precision++) {
+        snprintf(buffer, sizeof(buffer), "%.*g", precision, value);
+        if (strtod(buffer, nullptr) == value) break;
+    }
+    std::string text = buffer;
+    if (std::isfinite(value) && text.find_first_of(".en") == std::string::npos) text += ".0";
+    out << text;
+}
+
+inline void write(std::ostream& out, float value, bool nested) {
+    write(out, (double)value, nested);
+}
+
+inline void write(std::ostream& out, const std::string& value, bool nested) {
+    if (!nested) {
+        out << value;
+        return;
+    }
+    out << '"';
+    for (size_t i = 0; i < value.size(); i++) {
+        char c = value[i];
+        if (c == '"' || c == '\\') out << '\\' << c;
+        else if (c == '\n') out << "\\n";
+        else out << c;
+    }
+    out << '"';
+}
+
+inline void write(std::ostream& out, const char* value, bool nested) {
+    write(out, std::string(value ? value : ""), nested);
+}
+
+inline void write(std::ostream& out, char value, bool nested) {
+    write(out, std::string(1, value), nested);
+}
+
+inline void write(std::ostream& out, TreeNode* root, bool);
+
+template <class T>
+void write(std::ostream& out, const std::vector<T>& values, bool) {
+    out << '[';
+    for (size_t i = 0; i < values.size(); i++) {
+        if (i) out << ',';
+        write(out, (T)values[i], true);
+    }
+    out << ']';
+}
+
+// Trees print back as their level-order list, trailing nulls trimmed
+inline void write(std::ostream& out, TreeNode* root, bool) {
+    std::vector<TreeNode*> order;
+    if (root) order.push_back(root);
+    for (size_t i = 0; i < order.size(); i++) {
+        if (order[i] == nullptr) continue;
+        order.push_back(order[i]->left);
+        order.push_back(order[i]->right);
+    }
+    while (!order.empty() && order.back() == nullptr) order.pop_back();
+
+    out << '[';
+    for (size_t i = 0; i < order.size(); i++) {
+        if (i) out << ',';
+        if (order[i]) out << order[i]->val;
+        else out << "null";
+    }
+    out << ']';
+}
+
+// ---------------------------------------------------------------------------
+// Dispatch
+// ---------------------------------------------------------------------------
+
+template <size_t... I>
+struct indices {};
+
+template <size_t N, size_t... I>
+struct make_indices : make_indices<N - 1, N - 1, I...> {};
+
+template <size_t... I>
+struct make_indices<0, I...> {
+    typedef indices<I...> type;
+};
+
+template <class R>
+struct Caller {
+    template <class F, class Tuple, size_t... I>
+    static void call(F f, Tuple& args, indices<I...>) {
+        R result = f(std::get<I>(args)...);
+        write(std::cout, result, false);
+        std::cout << std::endl;
+    }
+};
+
+template <>
+struct Caller<void> {
+    template <class F, class Tuple, size_t... I>
+    static void call(F f, Tuple& args, indices<I...>) {
+        f(std::get<I>(args)...);
+    }
+};
+
+template <class R, class... A, size_t... I>
+void invoke(R (*f)(A...), const std::vector<std::string>& raw, indices<I...> order) {
+    // Arguments live in a tuple so non-const reference parameters bind to them
+    std::tuple<typename std::decay<A>::type...> args(
+        parse_argument<typename std::decay<A>::type>(raw[I])...);
+    Caller<R>::call(f, args, order);
+}
+
+template <class R, class... A>
+int run(R (*f)(A...)) {
+    std::ios::sync_with_stdio(false);
+    std::string input((std::istreambuf_iterator<char>(std::cin)), std::istreambuf_iterator<char>());
+    try {
+        std::vector<std::string> raw = split_arguments(input, sizeof...(A));
+        invoke(f, raw, typename make_indices<sizeof...(A)>::type());
+    } catch (const std::exception& e) {
+        std::cout.flush();
+        std::cerr << "Error: " << e.what() << std::endl;
+        return 1;
+    }
+    return 0;
+}
+
+}  // namespace judge
+
+#endif
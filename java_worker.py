@@ -0,0 +1,113 @@
+import os
+import shutil
+import threading
+import subprocess
+from python_worker import WorkerError, WORKER_GRACE
+from judge_harness import OUTPUT_LIMIT
+
+
+def read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise WorkerError("Java runner exited unexpectedly")
+    return data
+
+
+class JavaWorker:
+    # Client side of harness/JudgeServer.java: one JVM per submission that
+    # answers its test cases one at a time. The server exits after a timed-out
+    # or over-long case (or a System.exit in the submission) and the next
+    # request simply starts a new JVM.
+    def __init__(self, command, start_process=subprocess.Popen, finish_process=None):
+        self.command = command
+        self.start_process = start_process
+        self.finish_process = finish_process
+        self.process = None
+        self.lock = threading.Lock()
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        if self.alive():
+            return
+        self.stop()
+        self.process = self.start_process(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def run(self, test_case, timeout, output_limit=OUTPUT_LIMIT):
+        with self.lock:
+            self.start()
+            process = self.process
+            try:
+                self.send_input(process.stdin, test_case, b"%d %d" % (int(timeout * 1000), output_limit))
+            except (OSError, ValueError) as e:
+                self.stop()
+                raise WorkerError(f"Java runner unavailable: {e}")
+
+            # The server enforces the timeout itself; only a wedged JVM gets killed here
+            watchdog = threading.Timer(timeout + WORKER_GRACE, process.kill)
+            watchdog.start()
+            try:
+                header = process.stdout.readline().split()
+                if len(header) != 7:
+                    raise WorkerError("Java runner exited unexpectedly")
+                status, stdout_size, stderr_size, user, system, peak, wall = header
+                stdout = read_exactly(process.stdout, int(stdout_size))
+                stderr = read_exactly(process.stdout, int(stderr_size))
+            except WorkerError:
+                self.stop()
+                raise
+            finally:
+                watchdog.cancel()
+
+            if status != b"ok":
+                self.stop()
+            return {
+                "stdout": stdout.decode(errors="replace"),
+                "stderr": stderr.decode(errors="replace"),
+                "timed_out": status == b"timeout",
+                "output_limit_exceeded": status == b"output_limit",
+                "wall_time": int(wall) / 1e6,
+                "usage": {
+                    "cpu_user": int(user) / 1e6,
+                    "cpu_system": int(system) / 1e6,
+                    "peak_rss_kb": int(peak) or None
+                }
+            }
+
+    def send_input(self, stream, test_case, limits):
+        # Generated inputs are copied straight from their file
+        if "input_file" in test_case:
+            with open(test_case["input_file"], "rb") as f:
+                stream.write(b"%s %d\n" % (limits, os.fstat(f.fileno()).st_size))
+                shutil.copyfileobj(f, stream)
+        else:
+            payload = test_case["input"].encode()
+            stream.write(b"%s %d\n" % (limits, len(payload)) + payload)
+        stream.flush()
+
+    def stop(self):
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.kill()
+            process.wait()
+        except OSError:
+            pass
+        for stream in (process.stdin, process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        if self.finish_process is not None:
+            self.finish_process(process)
+
+    def close(self):
+        with self.lock:
+            self.stop()
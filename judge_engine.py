@@ -0,0 +1,1282 @@
+import io
+import os
+import re
+import math
+import time
+import shutil
+import signal
+import tempfile
+import platform
+import subprocess
+import threading
+import functools
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows
+from concurrent.futures import ThreadPoolExecutor
+from python_worker import WarmPythonWorker, WorkerError, exit_code, read_count, POLL_INTERVAL, MAX_POLL_INTERVAL
+from java_worker import JavaWorker
+from judge_harness import (read_frame, write_frame, input_fields, encode_input, rusage_fields, read_peak_rss,
+                           OUTPUT_LIMIT, MAXRSS_UNIT)
+from result_cache import result_key
+from output_checker import outputs_match, ABS_TOLERANCE, REL_TOLERANCE
+from test_generators import input_file, input_elements, wire_file
+from complexity_estimator import estimate, MIN_SAMPLES
+from workspace_pool import WorkspacePool
+
+# A process-mode solution.py is the submission between these two lines: the
+# names the harness gives every submission (see judge_harness.__all__), and
+# the call that reads the test input and prints the result. judge_harness is
+# byte-compiled next to it.
+PYTHON_PRELUDE = "from judge_harness import *\n"
+PYTHON_MAIN = "\n\nimport judge_harness; judge_harness.main(globals())\n"
+
+# Native harnesses (argument parsing, TreeNode, Python-style output) live in
+# harness/; the generated sources only add the entry point
+HARNESS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "harness")
+JAVA_HARNESS_SOURCES = ["JudgeMain.java", "JudgeServer.java", "TreeNode.java"]
+
+CPP_MAIN = """
+
+int main() {
+    return judge::run(solution);
+}
+"""
+
+C_MAIN = """
+
+int main(void) {
+    return JUDGE_RUN(solution);
+}
+"""
+
+JAVA_IMPORTS = "import java.util.*; "
+
+# Byte-compiles each source in argv[1::2] into the matching argv[2::2],
+# printing only the compiler message on failure
+PY_COMPILE_SCRIPT = """import sys, py_compile
+try:
+    for source, target in zip(sys.argv[1::2], sys.argv[2::2]):
+        py_compile.compile(source, cfile=target, doraise=True)
+except py_compile.PyCompileError as e:
+    sys.exit(e.msg)
+"""
+
+TEST_TIMEOUT = 5  # Seconds allowed per test case
+
+# Per-test CPU seconds and address space (MB), applied with setrlimit; a
+# problem can override them with "cpu_limit" and "memory_limit". The JVM and
+# Mono reserve far more address space than they use, so managed runtimes get
+# a heap limit (Java) or nothing instead of RLIMIT_AS.
+CPU_LIMIT = TEST_TIMEOUT
+MEMORY_LIMIT = 256
+MANAGED_RUNTIMES = ("Java", "C#")
+MEMORY_ERRORS = ("MemoryError", "bad_alloc", "OutOfMemory")  # Python, C++, Java/C#
+# Exit statuses of a process stopped at its CPU limit (soft, then hard)
+CPU_LIMIT_STATUSES = tuple(-getattr(signal, name) for name in ("SIGXCPU", "SIGKILL") if hasattr(signal, name))
+
+# Hidden stress tests get this multiple of the reference solution's work on
+# this machine, plus what starting the program costs: measured for the
+# reference (Python in the judge's mode), assumed for runtimes that start a
+# VM per case. Work the reference finishes almost at once still gets
+# MIN_WORK_LIMIT, so timing noise can't fail it.
+TIME_LIMIT_FACTOR = 3
+MIN_WORK_LIMIT = 0.25
+RUNTIME_STARTUP = {"Java": 1.0, "C#": 0.5}  # Seconds on the reference machine
+REFERENCE_RUNS = 2  # The reference is timed as the best of this many runs
+MAX_PARALLEL_TESTS = os.cpu_count() or 1  # Test cases run side by side
+
+# Complexity estimates time the submission on generated inputs doubling in
+# size up to twice the largest stress test, stopping after the first run
+# that takes longer than ESTIMATE_BUDGET seconds. A solution too slow for
+# that to leave MIN_SAMPLES timings within the budget is timed on inputs
+# halving in size below the smallest instead.
+ESTIMATE_STEPS = 7
+ESTIMATE_RUNS = 3  # Each size is timed as the best of this many runs
+ESTIMATE_BUDGET = 1.0
+ESTIMATE_SEED = 0  # Not one of the hidden tests' seeds
+
+# "warm" runs Python test cases in children forked from a pre-started worker;
+# "batch" runs them all in one interpreter with a SIGALRM budget per case;
+# "process" launches a fresh interpreter per test case
+PYTHON_MODE = "warm" if hasattr(os, "fork") else "process"
+HARNESS_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "judge_harness.py")
+BATCH_GRACE = 2  # Extra seconds a batch run gets on top of its per-case budgets
+
+# "instructions" judges Python submissions on the bytecode instructions they
+# execute (see judge_harness.InstructionCounter) against the problem's
+# "instruction_limit", the same on every PC; "time" judges them on time.
+# Counting slows Python down by up to COUNTING_SLOWDOWN times, so while it is
+# on, time and CPU limits are stretched by that much and only catch hangs.
+COST_MODEL = "time"
+COUNTING_SLOWDOWN = 20
+
+# "server" answers a Java submission's test cases from one long-lived JVM;
+# "process" starts a JVM per test case
+JAVA_MODE = "server"
+
+OUTPUT_CHUNK = 65536  # Bytes read from a test's stdout/stderr at a time
+
+
+def read_harness(name):
+    with open(os.path.join(HARNESS_DIR, name), "r") as f:
+        return f.read()
+
+
+def wrap_java(code):
+    # Bare methods go inside "public class Solution". The imports are hoisted
+    # onto the class header line so compiler line numbers still match the editor.
+    if re.search(r"\bclass\s+Solution\b", code):
+        return code
+    imports = []
+    lines = code.split("\n")
+    for i, line in enumerate(lines):
+        if re.match(r"\s*import\s+[\w.*\s]+;\s*$", line):
+            imports.append(line.strip() + " ")
+            lines[i] = ""
+    return JAVA_IMPORTS + "".join(imports) + "public class Solution { " + "\n".join(lines) + "\n}\n"
+
+
+class CompilationError(Exception):
+    pass
+
+
+class GradingCancelled(Exception):
+    pass
+
+
+class OutputLimitExceeded(Exception):
+    pass
+
+
+def make_usage(wall_time, cpu_user=None, cpu_system=None, peak_rss_kb=None, instructions=None):
+    # Resource use of one test run; CPU seconds and peak memory are None
+    # where the platform or runner can't measure them, the bytecode
+    # instruction count unless instructions were counted
+    return {
+        "wall_time": wall_time,
+        "cpu_user": cpu_user,
+        "cpu_system": cpu_system,
+        "peak_rss_kb": peak_rss_kb,
+        "instructions": instructions
+    }
+
+
+def format_usage(usage):
+    parts = [f"{usage['wall_time']:.2f}s wall"]
+    if usage["cpu_user"] is not None:
+        cpu = usage["cpu_user"] + usage["cpu_system"]
+        parts.append(f"{cpu:.2f}s CPU ({usage['cpu_user']:.2f}s user + {usage['cpu_system']:.2f}s sys)")
+    if usage["peak_rss_kb"]:
+        parts.append(f"peak memory {usage['peak_rss_kb'] / 1024:.1f} MB")
+    if usage["instructions"] is not None:
+        parts.append(f"{usage['instructions']:,} instructions")
+    return ", ".join(parts)
+
+
+def verdict_summary(results):
+    # e.g. "3 AC, 1 WA, 1 TLE", in the order the verdicts first appear
+    counts = {}
+    for result in results:
+        counts[result["verdict"]] = counts.get(result["verdict"], 0) + 1
+    return ", ".join(f"{count} {verdict}" for verdict, count in counts.items())
+
+
+def usage_summary(results):
+    # Worst case over a graded submission's tests, for activity logs
+    usages = [result["usage"] for result in results if result.get("usage")]
+    if not usages:
+        return "no resource usage recorded"
+    summary = make_usage(max(usage["wall_time"] for usage in usages))
+    cpu = [usage for usage in usages if usage["cpu_user"] is not None]
+    if cpu:
+        busiest = max(cpu, key=lambda usage: usage["cpu_user"] + usage["cpu_system"])
+        summary["cpu_user"], summary["cpu_system"] = busiest["cpu_user"], busiest["cpu_system"]
+    summary["peak_rss_kb"] = max(usage["peak_rss_kb"] or 0 for usage in usages)
+    counted = [usage["instructions"] for usage in usages if usage["instructions"] is not None]
+    if counted:
+        summary["instructions"] = max(counted)
+    return "max " + format_usage(summary)
+
+
+def with_wire(test_case):
+    # The test case with its input pre-parsed for the Python harness: inline
+    # for a visible test, as a file next to a generated input
+    if "input_file" in test_case:
+        path = wire_file(test_case["input_file"])
+        return dict(test_case, wire_file=path) if path else test_case
+    wire = encode_input(test_case["input"])
+    return dict(test_case, wire=wire) if wire is not None else test_case
+
+
+def problem_limits(problem, speed_factor=1.0):
+    # RLIMIT_CPU takes whole seconds, so the scaled CPU limit is rounded up
+    problem = problem or {}
+    return {
+        "cpu": math.ceil(problem.get("cpu_limit", CPU_LIMIT) * speed_factor),
+        "memory": problem.get("memory_limit", MEMORY_LIMIT)
+    }
+
+
+def limit_command(command, cpu_limit=None, memory_limit=None):
+    # The command behind a shell that sets the rlimits and execs it, or the
+    # command as is without setrlimit. A preexec_fn would do the same in the
+    # child, but it isn't safe while the judge has other threads running.
+    # The hard CPU limit is a second above the soft one, so SIGXCPU normally
+    # ends the process first.
+    if resource is None:
+        return command
+    steps = ["ulimit -c 0"]
+    if cpu_limit is not None:
+        steps += [f"ulimit -S -t {cpu_limit}", f"ulimit -H -t {cpu_limit + 1}"]
+    if memory_limit is not None:
+        steps.append(f"ulimit -v {memory_limit * 1024}")
+    return ["/bin/sh", "-c", " && ".join(steps) + ' && exec "$0" "$@"'] + command
+
+
+def describe_exit(returncode):
+    if returncode < 0:
+        try:
+            return f"Terminated by {signal.Signals(-returncode).name}"
+        except ValueError:
+            pass
+    return f"Exited with status {returncode}"
+
+
+def kill_process(process):
+    # Children get a session of their own, so killing the group also takes
+    # down anything the submission spawned
+    if process.returncode is not None:
+        return
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        pass
+
+
+class JudgeEngine:
+    def __init__(self, python_interpreters, output=None, parallel=True, python_mode=PYTHON_MODE, cache=None,
+                 artifacts=None, java_mode=JAVA_MODE, speed_factor=1.0, cost_model=COST_MODEL, workspaces=None,
+                 stress_cache=None):
+        self.python_interpreters = python_interpreters
+        self.output = output
+        self.cache = cache
+        self.artifacts = artifacts
+        # Scratch directories on tmpfs, reused from run to run
+        self.workspaces = workspaces if workspaces is not None else WorkspacePool()
+        self.transcript = None
+        self.parallel = parallel
+        self.python_mode = python_mode
+        self.java_mode = java_mode
+        self.cost_model = cost_model
+        self.warm_workers = {}
+        self.java_workers = []
+        # Problem id -> hidden test cases, possibly built by another engine
+        self.stress_cache = stress_cache if stress_cache is not None else {}
+
+        # Time limits are scaled for this machine (see calibration.py); the
+        # hidden tests' limits come from timing the reference solution here,
+        # so only their floor needs scaling
+        self.speed_factor = speed_factor
+        self.test_timeout = TEST_TIMEOUT * speed_factor
+
+        # Child processes cancel() has to kill, shared by the grading threads
+        self.cancelled = threading.Event()
+        self.active_processes = set()
+        self.process_lock = threading.Lock()
+
+        # Per-language build steps: write the source, compile it once and
+        # return the command that runs the resulting artifact
+        self.compilers = {
+            "Python": self.compile_python,
+            "Python3": self.compile_python,
+            "C++": self.compile_cpp,
+            "Java": self.compile_java,
+            "C": self.compile_c,
+            "C#": self.compile_csharp
+        }
+
+    def log(self, message):
+        if self.transcript is not None:
+            self.transcript.append(message)
+        if self.output is not None:
+            self.output(message)
+
+    def start_warm_workers(self):
+        # Pre-start the fork servers so the first Run doesn't pay for them
+        if self.python_mode != "warm":
+            return
+        for interpreter in self.python_interpreters.values():
+            self.warm_worker(interpreter).start()
+
+    def warm_worker(self, interpreter):
+        if interpreter not in self.warm_workers:
+            self.warm_workers[interpreter] = WarmPythonWorker(interpreter)
+        return self.warm_workers[interpreter]
+
+    def close(self):
+        for worker in self.warm_workers.values():
+            worker.close()
+        self.warm_workers = {}
+        self.workspaces.close()
+
+    def cancel(self):
+        # Safe to call from the GUI thread while compile_and_run is busy
+        self.cancelled.set()
+        with self.process_lock:
+            processes = list(self.active_processes)
+        for process in processes:
+            kill_process(process)
+        # Closing a fork server makes it kill the children it is timing
+        for worker in list(self.warm_workers.values()):
+            worker.close()
+
+    def check_cancelled(self):
+        if self.cancelled.is_set():
+            raise GradingCancelled()
+
+    def start_process(self, command, **kwargs):
+        # Popen that cancel() knows about; pair with finish_process
+        process = subprocess.Popen(command, start_new_session=hasattr(os, "killpg"), **kwargs)
+        with self.process_lock:
+            self.active_processes.add(process)
+        if self.cancelled.is_set():
+            kill_process(process)
+        return process
+
+    def finish_process(self, process):
+        with self.process_lock:
+            self.active_processes.discard(process)
+
+    def run_process(self, command, input_data=None, timeout=None, cwd=None, stdin=subprocess.PIPE, output_limit=None):
+        process = self.start_process(
+            command,
+            stdin=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd
+        )
+        usage = {}
+        try:
+            if output_limit is not None:
+                stdout, stderr, usage = self.capture_output(process, input_data, timeout, output_limit)
+            else:
+                try:
+                    stdout, stderr = process.communicate(input_data, timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    kill_process(process)
+                    process.communicate()
+                    raise
+        finally:
+            self.finish_process(process)
+        self.check_cancelled()
+        return process.returncode, stdout, stderr, usage
+
+    def wait_process(self, process, timeout):
+        # Waits for the child and returns its resource use as a partial usage
+        # dict ({} where wait4 is missing). CPU times come from wait4; the
+        # peak is sampled from /proc while it runs, because ru_maxrss starts
+        # out at the judge's own size, and ru_maxrss is only trusted when it
+        # is larger than anything the judge itself used.
+        if not hasattr(os, "wait4"):
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # The output threads only finish once the child is gone
+                kill_process(process)
+                process.wait()
+                raise
+            return {}
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = POLL_INTERVAL
+        sampled = 0
+        while True:
+            pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                break
+            sampled = max(sampled, read_peak_rss(process.pid))
+            if deadline is not None and time.monotonic() >= deadline:
+                kill_process(process)
+                _, status, _ = os.wait4(process.pid, 0)
+                process.returncode = exit_code(status)
+                raise subprocess.TimeoutExpired(process.args, timeout)
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+        process.returncode = exit_code(status)
+
+        usage = rusage_fields(rusage)
+        own_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // MAXRSS_UNIT
+        if usage["peak_rss_kb"] <= own_peak:
+            usage["peak_rss_kb"] = sampled or None
+        return usage
+
+    def capture_output(self, process, input_data, timeout, output_limit):
+        # communicate() with a cap: both pipes are read as the child writes
+        # them, and once they hold more than output_limit bytes together the
+        # process group is killed, so a print loop can't eat the machine's memory
+        buffers = [bytearray(), bytearray()]
+        lock = threading.Lock()
+        exceeded = threading.Event()
+
+        def drain(stream, buffer):
+            while True:
+                chunk = os.read(stream.fileno(), OUTPUT_CHUNK)
+                if not chunk:
+                    break
+                with lock:
+                    if len(buffers[0]) + len(buffers[1]) + len(chunk) > output_limit:
+                        exceeded.set()
+                        kill_process(process)
+                        break
+                    buffer.extend(chunk)
+
+        def feed():
+            try:
+                process.stdin.write(input_data)
+                process.stdin.close()
+            except OSError:
+                pass
+
+        threads = [threading.Thread(target=drain, args=(process.stdout, buffers[0])),
+                   threading.Thread(target=drain, args=(process.stderr, buffers[1]))]
+        if input_data is not None:
+            threads.append(threading.Thread(target=feed))
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            usage = self.wait_process(process, timeout)
+        finally:
+            # Anything the submission left running still holds the pipes open
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            for thread in threads:
+                thread.join()
+            process.stdout.close()
+            process.stderr.close()
+
+        if exceeded.is_set():
+            raise OutputLimitExceeded()
+        return bytes(buffers[0]), bytes(buffers[1]), usage
+
+    def compile_and_run(self, code, language, test_cases, problem=None, fail_fast=False):
+        self.cancelled.clear()
+
+        limits = problem_limits(problem, self.speed_factor)
+        counting = self.counts_instructions(language)
+        has_hidden = problem is not None and bool(problem.get("stress_tests"))
+
+        # Identical code against the identical test set is a lookup, made
+        # before anything runs. The key leaves out whatever the speed factor
+        # scales, since it is measured anew on every start, and knows the
+        # hidden tests by what generates them, not by their measured limits.
+        key = None
+        if self.cache is not None:
+            key_limits = problem_limits(problem)
+            if counting:
+                key_limits["instructions"] = problem.get("instruction_limit") if problem else None
+            hidden = None
+            if has_hidden:
+                hidden = {"problem": problem["id"], "tests": problem["stress_tests"], "reference": problem["reference"]}
+            key = result_key(code, language, test_cases, key_limits, hidden)
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.log("No changes since the last run, showing the stored results.")
+                for message in entry["log"]:
+                    self.log(message)
+                return entry["score"], entry["results"]
+
+        # The problem's hidden stress tests run after the visible ones
+        if has_hidden:
+            try:
+                stress_tests = self.stress_tests(problem)
+            except GradingCancelled:
+                self.log("\nGrading cancelled.")
+                return 0, self.failed_results(test_cases, "SKIP")
+            if not stress_tests:
+                key = None  # Graded without them this time; not what the key stands for
+            test_cases = test_cases + [
+                dict(test_case, time_limit=self.hidden_time_limit(test_case, language))
+                for test_case in stress_tests
+            ]
+
+        if counting:
+            # The budget replaces the time limits, which only catch hangs now
+            limits["instructions"] = (problem or {}).get("instruction_limit")
+            limits["cpu"] *= COUNTING_SLOWDOWN
+            test_cases = [
+                dict(test_case, time_limit=self.test_timeout * COUNTING_SLOWDOWN,
+                     instruction_limit=limits["instructions"])
+                for test_case in test_cases
+            ]
+
+        # Python harnesses get every input already parsed
+        if language in ("Python", "Python3"):
+            test_cases = [with_wire(test_case) for test_case in test_cases]
+
+        self.transcript = []
+        try:
+            score, results, cacheable = self.grade(code, language, test_cases, limits, fail_fast)
+            if key is not None and cacheable and not self.cancelled.is_set():
+                self.cache.put(key, {"score": score, "results": results, "log": self.transcript})
+        finally:
+            self.transcript = None
+        return score, results
+
+    def grade(self, code, language, test_cases, limits, fail_fast=False):
+        # Returns (score, results, cacheable); runs that ended in a timeout,
+        # an internal error or a cancel may turn out differently next time.
+        # Every test case gets its own verdict; with fail_fast the run stops
+        # at the first one that doesn't pass and the rest are skipped.
+        score = 0
+        results = []
+        cacheable = True
+
+        if language not in self.compilers:
+            self.log(f"Error: Unsupported language {language}")
+            return 0, self.failed_results(test_cases, "IE"), True
+
+        with self.workspaces.workspace() as temp_dir:
+            try:
+                try:
+                    # Build the submission exactly once
+                    run_command = self.compilers[language](code, language, temp_dir)
+                    execute = self.build_executor(code, language, run_command, temp_dir, limits)
+                    if self.uses_batch(language):
+                        cases = self.run_batch(code, run_command[0], temp_dir, test_cases, execute, limits)
+                    else:
+                        cases = self.run_test_cases(execute, test_cases)
+                except GradingCancelled:
+                    self.log("\nGrading cancelled.")
+                    return 0, self.failed_results(test_cases, "SKIP"), False
+                except CompilationError as e:
+                    self.log(f"Compilation Error:\n{e}")
+                    return 0, self.failed_results(test_cases, "CE"), True
+                except Exception as e:
+                    self.log(f"Error: {str(e)}")
+                    return 0, self.failed_results(test_cases, "IE"), False
+
+                try:
+                    # Run every test case against the same artifact
+                    for i, (test_case, result) in enumerate(cases, 1):
+                        self.report_result(i, test_case, result)
+                        score += result["points"]
+                        results.append({
+                            "verdict": result["verdict"],
+                            "passed": result["passed"],
+                            "points": result["points"],
+                            "usage": result["usage"]
+                        })
+                        if result["verdict"] == "IE" or (result["verdict"] == "TLE" and "time_limit" not in test_case):
+                            cacheable = False
+                        if fail_fast and not result["passed"] and i < len(test_cases):
+                            # Closing the generator cancels the cases not yet started
+                            cases.close()
+                            self.log(f"\nStopped at the first failure, {len(test_cases) - i} test case(s) skipped.")
+                            results.extend(self.failed_results(test_cases[i:], "SKIP"))
+                            cacheable = False
+                            break
+                except GradingCancelled:
+                    self.log("\nGrading cancelled.")
+                    return 0, self.failed_results(test_cases, "SKIP"), False
+                except Exception as e:
+                    self.log(f"Error: {str(e)}")
+                    return 0, self.failed_results(test_cases, "IE"), False
+            finally:
+                # JVM runners belong to this submission only
+                self.stop_java_workers()
+
+        return score, results, cacheable
+
+    def stress_tests(self, problem):
+        # Builds the hidden test cases once per problem: the reference solution
+        # supplies the expected output, and its time here sets the limit
+        if problem["id"] in self.stress_cache:
+            return self.stress_cache[problem["id"]]
+
+        language = "Python3" if "python3" in self.python_interpreters else "Python"
+        if language.lower() not in self.python_interpreters:
+            self.log("No Python interpreter found, skipping the hidden performance tests.")
+            return []
+
+        self.log("Preparing hidden performance tests...")
+        test_cases = []
+        with self.workspaces.workspace() as temp_dir:
+            try:
+                run_command = self.compile_python(problem["reference"], language, temp_dir)
+                execute = self.build_executor(problem["reference"], language, run_command, temp_dir,
+                                              problem_limits(problem))
+                # A visible test is too small to time anything but startup,
+                # but the reference still has to answer it
+                visible = problem["test_cases"][0]
+                output, startup = self.reference_time(execute, with_wire(visible))
+                if not outputs_match(io.StringIO(output), io.StringIO(visible["output"])):
+                    raise RuntimeError("the reference solution fails the first visible test")
+                for test in problem["stress_tests"]:
+                    test_case = with_wire({"input_file": input_file(problem["id"], test["size"], test["seed"])})
+                    output, best = self.reference_time(execute, test_case)
+                    test_case.update({
+                        "output": output.strip(),
+                        "points": test["points"],
+                        "startup": startup,
+                        "work": max(best - startup, 0.0),
+                        "hidden": True
+                    })
+                    test_cases.append(test_case)
+            except GradingCancelled:
+                raise
+            except Exception as e:
+                # Our problem, not the contestant's: grade without the hidden tests
+                self.log(f"Hidden performance tests unavailable: {e}")
+                return []
+
+        self.stress_cache[problem["id"]] = test_cases
+        return test_cases
+
+    def reference_time(self, execute, test_case):
+        # (output, best wall time over REFERENCE_RUNS) of the reference
+        best = None
+        for _ in range(REFERENCE_RUNS):
+            output, error, _, usage = execute(test_case, self.test_timeout)
+            if error.strip():
+                raise RuntimeError(error.strip())
+            best = usage["wall_time"] if best is None else min(best, usage["wall_time"])
+        return output, best
+
+    def hidden_time_limit(self, test_case, language):
+        # A VM started for every case pays its startup each time; a persistent
+        # JVM reports its cases' time without it
+        startup = test_case["startup"]
+        if language in RUNTIME_STARTUP and not (language == "Java" and self.java_mode == "server"):
+            startup = RUNTIME_STARTUP[language] * self.speed_factor
+        return startup + max(TIME_LIMIT_FACTOR * test_case["work"], MIN_WORK_LIMIT * self.speed_factor)
+
+    def estimate_complexity(self, code, language, problem):
+        # Runs the submission on growing generated inputs for the problem and
+        # fits the timings (see complexity_estimator.py). Returns the estimate,
+        # or None when there was nothing to fit.
+        self.cancelled.clear()
+        if language not in self.compilers:
+            self.log(f"Error: Unsupported language {language}")
+            return None
+        if not problem.get("stress_tests"):
+            self.log("This problem has no generated inputs to estimate complexity with.")
+            return None
+
+        limits = problem_limits(problem, self.speed_factor)
+        largest = 2 * max(test["size"] for test in problem["stress_tests"])
+        sizes = sorted({max(1, largest >> step) for step in range(ESTIMATE_STEPS)})
+        samples = []
+
+        with self.workspaces.workspace() as temp_dir:
+            try:
+                run_command = self.compilers[language](code, language, temp_dir)
+                execute = self.build_executor(code, language, run_command, temp_dir, limits)
+                self.log("\n=== Complexity estimate ===")
+                budget = ESTIMATE_BUDGET * self.speed_factor
+                for size in sizes:
+                    sample = self.time_size(execute, language, problem, size)
+                    if sample is None:
+                        break
+                    samples.append(sample)
+                    if sample[1] > budget:
+                        break
+                # A slow solution is over the budget from the first sizes on;
+                # smaller inputs still show how it grows
+                size = sizes[0]
+                while sum(seconds <= budget for _, seconds in samples) < MIN_SAMPLES and size > 1:
+                    size //= 2
+                    sample = self.time_size(execute, language, problem, size)
+                    if sample is None:
+                        break
+                    samples.insert(0, sample)
+            except GradingCancelled:
+                self.log("\nEstimate cancelled.")
+                return None
+            except CompilationError as e:
+                self.log(f"Compilation Error:\n{e}")
+                return None
+            except Exception as e:
+                self.log(f"Error: {str(e)}")
+                return None
+            finally:
+                self.stop_java_workers()
+
+        result = estimate(samples)
+        if result is None:
+            self.log("Too few inputs finished in time to estimate the complexity.")
+            return None
+        self.log(f"Estimated complexity: {result['model']} (fit R² = {result['r_squared']:.3f})")
+        if result["model"] == "O(1)":
+            self.log("Run times barely grew; the inputs may be too small for this solution to show its growth.")
+        return result
+
+    def time_size(self, execute, language, problem, size):
+        # (n, best wall time) on the generated input of this size, or None
+        # over the time or memory limit
+        n = input_elements(problem["id"], size)
+        test_case = {"input_file": input_file(problem["id"], size, ESTIMATE_SEED)}
+        if language in ("Python", "Python3"):
+            test_case = with_wire(test_case)
+        seconds = self.time_input(execute, test_case)
+        if seconds is None:
+            self.log(f"n = {n}: over the time or memory limit")
+            return None
+        self.log(f"n = {n}: {seconds:.3f}s")
+        return n, seconds
+
+    def time_input(self, execute, test_case):
+        # Best wall time over ESTIMATE_RUNS, or None once a run hits the time
+        # or memory limit
+        best = None
+        for _ in range(ESTIMATE_RUNS):
+            self.check_cancelled()
+            try:
+                _, error, returncode, usage = execute(test_case, self.test_timeout)
+            except subprocess.TimeoutExpired:
+                return None
+            except OutputLimitExceeded:
+                raise RuntimeError("The solution printed too much output.")
+            if returncode in CPU_LIMIT_STATUSES or any(marker in error for marker in MEMORY_ERRORS):
+                return None
+            if returncode != 0 or error.strip():
+                # Just the last line; the traceback may echo the generated input
+                raise RuntimeError((error.strip() or describe_exit(returncode)).splitlines()[-1])
+            best = usage["wall_time"] if best is None else min(best, usage["wall_time"])
+        return best
+
+    def failed_results(self, test_cases, verdict):
+        return [{"verdict": verdict, "passed": False, "points": 0} for _ in test_cases]
+
+    def build_executor(self, code, language, run_command, work_dir, limits):
+        # Returns a callable taking a test case and giving back (stdout, stderr, returncode, usage)
+        if language == "Java":
+            run_command = run_command[:1] + [f"-Xmx{limits['memory']}m"] + run_command[1:]
+        if language in MANAGED_RUNTIMES:
+            limited_command = limit_command(run_command, limits["cpu"])
+        else:
+            limited_command = limit_command(run_command, limits["cpu"], limits["memory"])
+        if language in ("Python", "Python3"):
+            execute = functools.partial(self.execute_python_process, limited_command, work_dir)
+        else:
+            execute = functools.partial(self.execute_process, limited_command, work_dir)
+        if language == "Java" and self.java_mode == "server":
+            # Same classpath, JudgeServer instead of JudgeMain; stopped by
+            # grade(). One JVM runs every case, so only the heap is limited.
+            worker = JavaWorker(run_command[:-1] + ["JudgeServer"], self.start_process, self.finish_process)
+            self.java_workers.append(worker)
+            return functools.partial(self.execute_worker, worker.run, execute)
+        if language not in ("Python", "Python3") or self.python_mode != "warm":
+            return execute
+
+        # The fork server execs the bare submission inside the harness it has
+        # already imported, so it only needs the contestant's code
+        source_path = self.write_submission(code, work_dir)
+        worker = self.warm_worker(run_command[0])
+        run = functools.partial(worker.run, source_path, limits=limits)
+        return functools.partial(self.execute_worker, run, execute)
+
+    def stop_java_workers(self):
+        workers, self.java_workers = self.java_workers, []
+        for worker in workers:
+            worker.close()
+
+    def write_submission(self, code, work_dir):
+        source_path = os.path.join(work_dir, "submission.py")
+        with open(source_path, "w") as f:
+            f.write(code)
+        return source_path
+
+    def counts_instructions(self, language):
+        # Every Python mode counts: the warm worker, the batch harness and
+        # judge_harness.main in a fresh process
+        return self.cost_model == "instructions" and language in ("Python", "Python3")
+
+    def uses_batch(self, language):
+        return (language in ("Python", "Python3") and self.python_mode == "batch"
+                and hasattr(signal, "setitimer"))
+
+    def run_batch(self, code, interpreter, work_dir, test_cases, fallback, limits):
+        source_path = self.write_submission(code, work_dir)
+        frames = self.execute_batch(interpreter, source_path, work_dir, test_cases, limits)
+
+        for test_case, frame in zip(test_cases, frames):
+            yield test_case, self.run_test_case(functools.partial(self.replay_frame, frame, source_path), test_case)
+
+        # The batch process died part-way: run what's left in isolation
+        if len(frames) < len(test_cases):
+            self.log(f"\nBatch run stopped after {len(frames)} test case(s), running the rest individually")
+            yield from self.run_test_cases(fallback, test_cases[len(frames):])
+
+    def execute_batch(self, interpreter, source_path, work_dir, test_cases, limits):
+        # SIGALRM can't interrupt every hang (e.g. inside a C call), so the
+        # whole batch also gets a hard deadline. The rlimits cover the batch
+        # as a whole: memory is shared and CPU time adds up across cases.
+        budget = sum(test_case.get("time_limit", self.test_timeout) for test_case in test_cases)
+        process = self.start_process(
+            limit_command([interpreter, HARNESS_SCRIPT, "--batch", source_path], int(budget) + 1, limits["memory"]),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=work_dir
+        )
+        watchdog = threading.Timer(budget + BATCH_GRACE, kill_process, args=(process,))
+        watchdog.start()
+        feeder = threading.Thread(target=self.feed_batch, args=(process.stdin, test_cases, limits))
+        feeder.daemon = True
+        feeder.start()
+
+        frames = []
+        try:
+            while len(frames) < len(test_cases):
+                try:
+                    frame = read_frame(process.stdout)
+                except ValueError:
+                    frame = None
+                if frame is None:
+                    break
+                frames.append(frame)
+        finally:
+            watchdog.cancel()
+            kill_process(process)
+            process.wait()
+            self.finish_process(process)
+        self.check_cancelled()
+        return frames
+
+    def feed_batch(self, stream, test_cases, limits):
+        try:
+            for test_case in test_cases:
+                request = input_fields(test_case)
+                request["timeout"] = test_case.get("time_limit", self.test_timeout)
+                request["output_limit"] = OUTPUT_LIMIT
+                request["cpu_limit"] = limits["cpu"]
+                if "instructions" in limits:
+                    request["instruction_limit"] = limits["instructions"]
+                write_frame(stream, request)
+            stream.close()
+        except OSError:
+            pass
+
+    def replay_frame(self, frame, source_path, test_case, timeout=TEST_TIMEOUT):
+        if frame["timed_out"]:
+            raise subprocess.TimeoutExpired(source_path, timeout)
+        if frame["output_limit_exceeded"]:
+            raise OutputLimitExceeded()
+        # A spent CPU budget is reported as the signal RLIMIT_CPU would have sent
+        returncode = CPU_LIMIT_STATUSES[0] if frame["cpu_limit_exceeded"] else frame["exit_status"]
+        return frame["stdout"], frame["stderr"], returncode, make_usage(frame["time"], **frame["usage"])
+
+    def run_test_cases(self, execute, test_cases):
+        # Yields (test_case, result) pairs in test order. In parallel mode the
+        # cases are fanned out over a thread pool (each thread just waits on
+        # its child process), so the slowest case bounds the whole run
+        workers = min(MAX_PARALLEL_TESTS, len(test_cases))
+        if not self.parallel or workers <= 1:
+            for test_case in test_cases:
+                yield test_case, self.run_test_case(execute, test_case)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.run_test_case, execute, test_case)
+                for test_case in test_cases
+            ]
+            try:
+                for test_case, future in zip(test_cases, futures):
+                    yield test_case, future.result()
+            finally:
+                # Stopped early: only the cases already running are waited for
+                for future in futures:
+                    future.cancel()
+
+    # Executors take (test_case, timeout) and return (stdout, stderr,
+    # returncode, usage), raising TimeoutExpired when the case runs out of
+    # time and OutputLimitExceeded when it prints more than OUTPUT_LIMIT bytes
+    def execute_process(self, run_command, work_dir, test_case, timeout=TEST_TIMEOUT):
+        if "input_file" in test_case:
+            # Generated inputs go straight from their file to the child's stdin
+            with open(test_case["input_file"], "rb") as stdin:
+                start = time.perf_counter()
+                returncode, stdout, stderr, usage = self.run_process(
+                    run_command, timeout=timeout, cwd=work_dir, stdin=stdin,
+                    output_limit=OUTPUT_LIMIT
+                )
+        else:
+            start = time.perf_counter()
+            returncode, stdout, stderr, usage = self.run_process(
+                run_command,
+                test_case["input"].encode(),
+                timeout=timeout,
+                cwd=work_dir,
+                output_limit=OUTPUT_LIMIT
+            )
+        usage = make_usage(time.perf_counter() - start, **usage)
+        return stdout.decode(), stderr.decode(), returncode, usage
+
+    def execute_python_process(self, run_command, work_dir, test_case, timeout=TEST_TIMEOUT):
+        # judge_harness.main takes the pre-parsed arguments when the command
+        # line says where they are: in a file, or on stdin in place of the
+        # text. A counted run leaves its instruction count in a stats file.
+        stats_path = None
+        if "instruction_limit" in test_case:
+            fd, stats_path = tempfile.mkstemp(dir=work_dir, suffix=".stats")
+            os.close(fd)
+            run_command = run_command + ["--stats", stats_path]
+            if test_case["instruction_limit"] is not None:
+                run_command += ["--instruction-limit", str(test_case["instruction_limit"])]
+        if "wire_file" in test_case:
+            result = self.execute_process(run_command + ["--wire-file", test_case["wire_file"]], work_dir,
+                                          test_case, timeout)
+        elif "wire" in test_case:
+            result = self.execute_process(run_command + ["--wire"], work_dir, {"input": test_case["wire"]}, timeout)
+        else:
+            result = self.execute_process(run_command, work_dir, test_case, timeout)
+        if stats_path is not None:
+            result[3]["instructions"] = read_count(open(stats_path, "rb"))
+        return result
+
+    def execute_worker(self, run, fallback, test_case, timeout=TEST_TIMEOUT):
+        # run(test_case, timeout) asks a warm Python worker or a JVM runner
+        start = time.perf_counter()
+        try:
+            response = run(test_case, timeout)
+        except WorkerError:
+            # A dead worker must not cost the contestant the test case
+            self.check_cancelled()
+            return fallback(test_case, timeout)
+
+        if response["timed_out"]:
+            raise subprocess.TimeoutExpired("solution", timeout)
+        if response["output_limit_exceeded"]:
+            raise OutputLimitExceeded()
+        # A worker that runs one case at a time reports the case's own wall
+        # time; measured here it would include the cases queued ahead of it
+        usage = make_usage(response.get("wall_time", time.perf_counter() - start), **response["usage"])
+        return response["stdout"], response["stderr"], response.get("returncode", 0), usage
+
+    def run_test_case(self, execute, test_case):
+        # Verdicts: AC, WA, TLE, MLE, OLE, RE, or IE when the judge itself
+        # failed. A bad case never stops the others from running.
+        self.check_cancelled()
+        time_limit = test_case.get("time_limit")
+        result = {"output": "", "error": "", "verdict": "RE", "passed": False, "points": 0, "time": None, "usage": None}
+
+        try:
+            output, error, returncode, usage = execute(test_case, time_limit or self.test_timeout)
+        except subprocess.TimeoutExpired:
+            result["verdict"] = "TLE"
+            result["limit"] = "time"
+            result["time"] = time_limit or self.test_timeout
+            return result
+        except OutputLimitExceeded:
+            result["verdict"] = "OLE"
+            return result
+        except GradingCancelled:
+            raise
+        except Exception as e:
+            result["verdict"] = "IE"
+            result["error"] = str(e)
+            return result
+
+        result["output"] = output.strip()
+        result["error"] = error.strip()
+        result["time"] = usage["wall_time"]
+        result["usage"] = usage
+        # Limits enforced inside the process show up as a signal, a failed
+        # allocation or an instruction count over the budget
+        budget = test_case.get("instruction_limit")
+        if budget is not None and usage["instructions"] is not None and usage["instructions"] > budget:
+            result["verdict"] = "TLE"
+            result["limit"] = "instructions"
+            return result
+        if returncode in CPU_LIMIT_STATUSES:
+            result["verdict"] = "TLE"
+            result["limit"] = "cpu"
+            return result
+        if any(marker in result["error"] for marker in MEMORY_ERRORS):
+            result["verdict"] = "MLE"
+            return result
+        if returncode != 0 and not result["error"]:
+            result["error"] = describe_exit(returncode)
+        if result["error"]:
+            return result
+        if time_limit is not None and usage["wall_time"] > time_limit:
+            result["verdict"] = "TLE"
+            result["limit"] = "time"
+            return result
+
+        result["verdict"] = "WA"
+        if outputs_match(
+            io.StringIO(output),
+            io.StringIO(test_case["output"]),
+            test_case.get("abs_tolerance", ABS_TOLERANCE),
+            test_case.get("rel_tolerance", REL_TOLERANCE)
+        ):
+            result["verdict"] = "AC"
+            result["passed"] = True
+            result["points"] = test_case["points"]
+        return result
+
+    def report_result(self, index, test_case, result):
+        if test_case.get("hidden"):
+            self.report_hidden_result(index, test_case, result)
+            return
+
+        self.log(f"\n=== Test Case {index} ===")
+        self.log(f"Input: {test_case['input']}")
+        self.log(f"Expected Output: {test_case['output']}")
+
+        verdict = result["verdict"]
+        if verdict == "OLE":
+            self.log(f"Result: ✗ Failed (Output Limit Exceeded, over {OUTPUT_LIMIT // (1024 * 1024)} MB)")
+            return
+        if verdict == "TLE":
+            if result["usage"] is None:
+                self.log(f"Result: ✗ Failed (Time Limit Exceeded, no result after {result['time']:g}s)")
+                return
+            self.log(f"Resources: {format_usage(result['usage'])}")
+            if result["limit"] == "instructions":
+                self.log(f"Result: ✗ Failed (Time Limit Exceeded, over {test_case['instruction_limit']:,} instructions)")
+            else:
+                self.log("Result: ✗ Failed (Time Limit Exceeded, CPU limit reached)")
+            return
+        if verdict == "MLE":
+            self.log(f"Resources: {format_usage(result['usage'])}")
+            self.log("Result: ✗ Failed (Memory Limit Exceeded)")
+            return
+        if verdict == "IE":
+            self.log(f"Error: {result['error']}")
+            self.log("Result: ✗ Failed (Judge Error)")
+            return
+        if verdict == "RE":
+            self.log(f"Error:\n{result['error']}")
+            self.log(f"Resources: {format_usage(result['usage'])}")
+            self.log("Result: ✗ Failed (Runtime Error)")
+            return
+
+        self.log(f"Your Output: {result['output']}")
+        self.log(f"Resources: {format_usage(result['usage'])}")
+        if verdict == "AC":
+            self.log("Result: ✓ Passed")
+        else:
+            self.log("Result: ✗ Failed (Wrong Answer)")
+
+    def report_hidden_result(self, index, test_case, result):
+        # Stress inputs are far too large to echo; show the timing instead
+        self.log(f"\n=== Test Case {index} (hidden performance test) ===")
+        size = os.path.getsize(test_case["input_file"])
+        self.log(f"Input: {size} bytes, time limit {test_case['time_limit']:.2f}s")
+
+        verdict = result["verdict"]
+        if verdict == "TLE":
+            if result["limit"] == "instructions":
+                self.log(f"Result: ✗ Failed (Time Limit Exceeded, over {test_case['instruction_limit']:,} instructions)")
+            else:
+                self.log("Result: ✗ Failed (Time Limit Exceeded)")
+            return
+        if verdict == "OLE":
+            self.log("Result: ✗ Failed (Output Limit Exceeded)")
+            return
+        if verdict == "MLE":
+            self.log("Result: ✗ Failed (Memory Limit Exceeded)")
+            return
+        if verdict == "IE":
+            self.log(f"Error: {result['error']}")
+            self.log("Result: ✗ Failed (Judge Error)")
+            return
+        if verdict == "RE":
+            # Just the exception line; the traceback may echo the hidden input
+            self.log(f"Error: {result['error'].splitlines()[-1]}")
+            self.log("Result: ✗ Failed (Runtime Error)")
+            return
+
+        self.log(f"Resources: {format_usage(result['usage'])}")
+        if verdict == "AC":
+            self.log("Result: ✓ Passed")
+        else:
+            self.log("Result: ✗ Failed (Wrong Answer)")
+
+    def check_compile(self, command, build_dir=None):
+        returncode, _, stderr, _ = self.run_process(command)
+        if returncode != 0:
+            message = stderr.decode()
+            if build_dir is not None:
+                # Show "solution.cpp:3:5" rather than a scratch directory path
+                message = message.replace(build_dir + os.sep, "")
+            raise CompilationError(message)
+
+    def compile_python(self, code, language, work_dir):
+        file_path = os.path.join(work_dir, "solution.py")
+        bytecode_path = os.path.join(work_dir, "solution.pyc")
+        shebang = "#!/usr/bin/env python3\n" if language == "Python3" else "#!/usr/bin/env python\n"
+        with open(file_path, "w") as f:
+            f.write(shebang + PYTHON_PRELUDE + code + PYTHON_MAIN)
+
+        # Make file executable on Unix-like systems
+        if platform.system() != 'Windows':
+            os.chmod(file_path, 0o755)
+
+        interpreter = self.python_interpreters['python3' if language == "Python3" else 'python']
+
+        # Compile to bytecode once; every test case runs the same .pyc, which
+        # imports the harness from the judge_harness.pyc beside it
+        command = [interpreter, "-c", PY_COMPILE_SCRIPT, file_path, bytecode_path]
+        harness_path = os.path.join(work_dir, "judge_harness.pyc")
+        cached = self.python_harness(interpreter, work_dir)
+        if cached is not None:
+            shutil.copyfile(cached, harness_path)
+        else:
+            command += [HARNESS_SCRIPT, harness_path]
+        self.check_compile(command)
+        return [interpreter, bytecode_path]
+
+    def python_harness(self, interpreter, work_dir):
+        # judge_harness.pyc for this interpreter from the artifact cache, or
+        # None when it has to be compiled along with the submission
+        if self.artifacts is None:
+            return None
+
+        def build(build_dir):
+            source_path = os.path.join(build_dir, "judge_harness.py")
+            self.check_compile([interpreter, "-c", PY_COMPILE_SCRIPT, source_path, source_path + "c"])
+            return ["judge_harness.pyc"]
+
+        with open(HARNESS_SCRIPT, "r") as f:
+            source = f.read()
+        try:
+            harness_dir, _ = self.artifacts.build({"judge_harness.py": source}, interpreter, ["py_compile"], build,
+                                                  work_dir)
+        except (CompilationError, OSError):
+            return None
+        return os.path.join(harness_dir, "judge_harness.pyc")
+
+    def build_native(self, language, work_dir, sources, compiler, flags, build):
+        # Writes the sources, compiles them with build(directory) and returns
+        # the directory holding the artifacts. With an artifact cache, an
+        # unchanged source/compiler/flags combination skips compilation.
+        self.log(f"Compiling {language} code...")
+        if self.artifacts is None:
+            for name, text in sources.items():
+                with open(os.path.join(work_dir, name), "w") as f:
+                    f.write(text)
+            build(work_dir)
+            artifact_dir = work_dir
+        else:
+            # Compiled in the workspace; only the artifacts are copied to the cache
+            artifact_dir, hit = self.artifacts.build(sources, compiler, flags, build, work_dir)
+            if hit:
+                self.log("Code unchanged, reusing the previous build.")
+        self.log("Compilation successful!")
+        return artifact_dir
+
+    def cpp_harness(self, flags, work_dir):
+        # Returns (extra sources, extra flags). The harness header goes through
+        # a precompiled header kept in the artifact cache; without one it is
+        # compiled along with the submission.
+        header = read_harness("judge_harness.hpp")
+        if self.artifacts is None:
+            return {"judge_harness.hpp": header}, []
+
+        def build(build_dir):
+            header_path = os.path.join(build_dir, "judge_harness.hpp")
+            self.check_compile(["g++"] + flags + ["-x", "c++-header", header_path, "-o", header_path + ".gch"])
+            return ["judge_harness.hpp", "judge_harness.hpp.gch"]
+
+        try:
+            pch_dir, _ = self.artifacts.build({"judge_harness.hpp": header}, "g++", flags + ["-x", "c++-header"], build,
+                                              work_dir)
+        except (CompilationError, OSError):
+            return {"judge_harness.hpp": header}, []
+        return {}, ["-I", pch_dir]
+
+    def compile_cpp(self, code, language, work_dir):
+        flags = ["-std=c++11", "-O2"]
+        sources, include_flags = self.cpp_harness(flags, work_dir)
+
+        def build(build_dir):
+            self.check_compile(
+                ["g++"] + flags + include_flags +
+                [os.path.join(build_dir, "solution.cpp"), "-o", os.path.join(build_dir, "solution")],
+                build_dir
+            )
+            return ["solution"]
+
+        # #line keeps compiler messages pointing at the contestant's lines
+        sources["solution.cpp"] = '#include "judge_harness.hpp"\n#line 1 "solution.cpp"\n' + code + CPP_MAIN
+        artifact_dir = self.build_native("C++", work_dir, sources, "g++", flags + include_flags, build)
+        return [os.path.join(artifact_dir, "solution")]
+
+    def java_harness(self, work_dir):
+        # JudgeMain and TreeNode only change with the harness, so they are
+        # compiled once and shared by every submission
+        sources = {name: read_harness(name) for name in JAVA_HARNESS_SOURCES}
+
+        def build(build_dir):
+            self.check_compile(
+                ["javac", "-d", build_dir] + [os.path.join(build_dir, name) for name in sources],
+                build_dir
+            )
+            return [name for name in os.listdir(build_dir) if name.endswith(".class")]
+
+        if self.artifacts is None:
+            harness_dir = os.path.join(work_dir, "harness")
+            os.makedirs(harness_dir)
+            for name, text in sources.items():
+                with open(os.path.join(harness_dir, name), "w") as f:
+                    f.write(text)
+            build(harness_dir)
+            return harness_dir
+        harness_dir, _ = self.artifacts.build(sources, "javac", [], build, work_dir)
+        return harness_dir
+
+    def compile_java(self, code, language, work_dir):
+        harness_dir = self.java_harness(work_dir)
+        flags = ["-cp", harness_dir]
+
+        def build(build_dir):
+            self.check_compile(
+                ["javac"] + flags + ["-d", build_dir, os.path.join(build_dir, "Solution.java")],
+                build_dir
+            )
+            return [name for name in os.listdir(build_dir) if name.endswith(".class")]
+
+        artifact_dir = self.build_native("Java", work_dir, {"Solution.java": wrap_java(code)}, "javac", flags, build)
+        return ["java", "-cp", artifact_dir + os.pathsep + harness_dir, "JudgeMain"]
+
+    def compile_c(self, code, language, work_dir):
+        flags = ["-std=c11", "-O2"]
+
+        def build(build_dir):
+            self.check_compile(
+                ["gcc"] + flags +
+                [os.path.join(build_dir, "solution.c"), "-o", os.path.join(build_dir, "solution"), "-lm"],
+                build_dir
+            )
+            return ["solution"]
+
+        # The C harness is small enough to compile with every submission
+        sources = {
+            "judge_harness.h": read_harness("judge_harness.h"),
+            "solution.c": '#include "judge_harness.h"\n#line 1 "solution.c"\n' + code + C_MAIN
+        }
+        artifact_dir = self.build_native("C", work_dir, sources, "gcc", flags, build)
+        return [os.path.join(artifact_dir, "solution")]
+
+    def compile_csharp(self, code, language, work_dir):
+        def build(build_dir):
+            exe_path = os.path.join(build_dir, "Solution.exe")
+            self.check_compile(["csc", "-out:" + exe_path, os.path.join(build_dir, "Solution.cs")], build_dir)
+            return ["Solution.exe"]
+
+        artifact_dir = self.build_native("C#", work_dir, {"Solution.cs": code}, "csc", [], build)
+        return ["mono", os.path.join(artifact_dir, "Solution.exe")]
@@ -0,0 +1,460 @@
+import os
+import io
+import sys
+import ast
+import time
+import json
+import signal
+import traceback
+import contextlib
+
+# The names every submission can use without importing them
+__all__ = ['sys', 'ast', 'json', 'TreeNode', 'build_tree']
+
+OUTPUT_LIMIT = 8 * 1024 * 1024  # Bytes of stdout plus stderr allowed per test case
+MAXRSS_UNIT = 1024 if sys.platform == 'darwin' else 1  # ru_maxrss is bytes on macOS, KB elsewhere
+
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+def build_tree(nodes):
+    # Level order with None gaps; the queue is walked with an index rather
+    # than popped from the front, so big trees build in linear time
+    if not nodes:
+        return None
+    root = TreeNode(nodes[0])
+    queue = [root]
+    front = 0
+    i = 1
+    while front < len(queue) and i < len(nodes):
+        node = queue[front]
+        front += 1
+        if nodes[i] is not None:
+            node.left = TreeNode(nodes[i])
+            queue.append(node.left)
+        i += 1
+        if i < len(nodes) and nodes[i] is not None:
+            node.right = TreeNode(nodes[i])
+            queue.append(node.right)
+        i += 1
+    return root
+
+
+def parse_value(text):
+    # Arrays go through the JSON parser first, which is far faster than
+    # literal_eval; Python-only literals such as None fall back to it
+    if text.startswith('['):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return ast.literal_eval(text)
+
+
+def parse_input(input_data):
+    # The arguments a test input stands for: {'args': [...], 'tree': bool},
+    # where a tree input is a single level-order list to build a TreeNode from
+    input_data = input_data.strip()
+    # Handle different input formats
+    if '\n' in input_data:
+        # Multi-line input
+        lines = input_data.split('\n')
+        if len(lines) == 2:
+            # Two lines (e.g., array and number), or two plain strings
+            try:
+                return {'args': [parse_value(lines[0]), parse_value(lines[1])], 'tree': False}
+            except Exception:
+                return {'args': lines, 'tree': False}
+        # Multiple arrays
+        return {'args': [parse_value(line) for line in lines], 'tree': False}
+    if input_data.startswith('[') and input_data.endswith(']'):
+        value = parse_value(input_data)
+        if isinstance(value, tuple):
+            # Arguments separated by top-level commas ("[1,3], [2]"), as
+            # the C++ and Java harnesses split them
+            return {'args': list(value), 'tree': False}
+        # Single array input (BST case)
+        return {'args': [value], 'tree': True}
+    # String or number input
+    try:
+        input_data = parse_value(input_data)
+    except Exception:
+        pass
+    if isinstance(input_data, tuple):
+        return {'args': list(input_data), 'tree': False}
+    return {'args': [input_data], 'tree': False}
+
+
+def encode_input(input_data):
+    # The parsed input as JSON, for the judge to send in place of the text
+    # so the harness only has to json.loads it; None when parsing fails or
+    # the arguments don't survive JSON (tuples, sets, non-string keys)
+    try:
+        parsed = parse_input(input_data)
+        wire = json.dumps(parsed)
+    except Exception:
+        return None
+    return wire if json.loads(wire) == parsed else None
+
+
+def read_arguments(request):
+    # Pre-parsed arguments when the judge sent them, else the parsed text
+    if 'wire' in request:
+        return json.loads(request['wire'])
+    if 'wire_file' in request:
+        with open(request['wire_file']) as f:
+            return json.load(f)
+    with open_input(request) as f:
+        return parse_input(f.read())
+
+
+def call_solution(solution, parsed):
+    if parsed['tree']:
+        return solution(build_tree(parsed['args'][0]))
+    return solution(*parsed['args'])
+
+
+def format_result(result):
+    if isinstance(result, (list, tuple, dict)):
+        return json.dumps(result)
+    return str(result)
+
+
+def solution_globals():
+    # A fresh namespace to exec a submission in, with the same names a
+    # process-mode solution.py imports
+    namespace = {'__name__': 'solution', '__builtins__': __builtins__}
+    namespace.update((name, globals()[name]) for name in __all__)
+    return namespace
+
+
+class InstructionBudgetExceeded(BaseException):
+    pass
+
+
+class InstructionCounter:
+    # Counts the bytecode instructions executed by the submission's own code,
+    # never the harness or the standard library, so a run costs the same on
+    # every PC (counts differ between Python versions, whose bytecode does).
+    # Python 3.12+ instruments just the submission's code objects through
+    # sys.monitoring; older versions trace opcodes of its frames.
+    def __init__(self, code, budget=None):
+        self.code = code
+        self.budget = budget
+        self.count = 0
+        self.monitoring = None
+
+    def code_objects(self, code):
+        yield code
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                yield from self.code_objects(const)
+
+    def tick(self, *args):
+        self.count += 1
+        if self.budget is not None and self.count > self.budget:
+            raise InstructionBudgetExceeded()
+
+    def trace_call(self, frame, event, arg):
+        if frame.f_code.co_filename != self.code.co_filename:
+            return None
+        frame.f_trace_lines = False
+        frame.f_trace_opcodes = True
+        return self.trace_opcode
+
+    def trace_opcode(self, frame, event, arg):
+        if event == 'opcode':
+            self.tick()
+        return self.trace_opcode
+
+    def __enter__(self):
+        monitoring = getattr(sys, 'monitoring', None)
+        if monitoring is not None:
+            try:
+                monitoring.use_tool_id(monitoring.PROFILER_ID, 'judge')
+                self.monitoring = monitoring
+            except ValueError:
+                pass  # Profiler slot taken; fall back to tracing
+        if self.monitoring is None:
+            sys.settrace(self.trace_call)
+            return self
+
+        self.monitoring.register_callback(self.monitoring.PROFILER_ID, self.monitoring.events.INSTRUCTION, self.tick)
+        for code in self.code_objects(self.code):
+            self.monitoring.set_local_events(self.monitoring.PROFILER_ID, code, self.monitoring.events.INSTRUCTION)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.monitoring is None:
+            sys.settrace(None)
+            return
+        for code in self.code_objects(self.code):
+            self.monitoring.set_local_events(self.monitoring.PROFILER_ID, code, 0)
+        self.monitoring.register_callback(self.monitoring.PROFILER_ID, self.monitoring.events.INSTRUCTION, None)
+        self.monitoring.free_tool_id(self.monitoring.PROFILER_ID)
+        self.monitoring = None
+
+
+def run(solution, request, counter=None):
+    # request carries the test input (see input_fields); counter is an
+    # InstructionCounter for the solution call, if any
+    try:
+        parsed = read_arguments(request)
+        with counter or contextlib.nullcontext():
+            result = call_solution(solution, parsed)
+        print(format_result(result))
+    except MemoryError:
+        print('Error: MemoryError', file=sys.stderr)
+    except Exception as e:
+        print(f'Error: {str(e)}', file=sys.stderr)
+
+
+def main(namespace):
+    # Entry point of a process-mode solution.py. The test input is on stdin,
+    # or already parsed: "--wire" puts the JSON on stdin instead,
+    # "--wire-file PATH" names a file holding it. Leading "--stats PATH"
+    # counts the solution's instructions into that file, stopping past
+    # "--instruction-limit N".
+    if 'solution' not in namespace:
+        print("Error: name 'solution' is not defined", file=sys.stderr)
+        return
+    args = sys.argv[1:]
+    stats_path = budget = None
+    while args[:1] in (['--stats'], ['--instruction-limit']) and len(args) >= 2:
+        if args[0] == '--stats':
+            stats_path = args[1]
+        else:
+            budget = int(args[1])
+        args = args[2:]
+    if args[:1] == ['--wire-file'] and len(args) == 2:
+        request = {'wire_file': args[1]}
+    elif args == ['--wire']:
+        request = {'wire': sys.stdin.read()}
+    else:
+        request = {'input': sys.stdin.read()}
+
+    counter = None
+    if stats_path is not None:
+        # The caller is solution.py's module code, whose functions are counted
+        counter = InstructionCounter(sys._getframe(1).f_code, budget)
+    try:
+        run(namespace['solution'], request, counter)
+    except InstructionBudgetExceeded:
+        pass  # Judged from the count
+    finally:
+        if counter is not None:
+            with open(stats_path, 'w') as f:
+                f.write(str(counter.count))
+
+
+def exit_status(code):
+    # The status sys.exit(code) leaves a process with; like the interpreter,
+    # a code that isn't a number is printed to stderr
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+    print(code, file=sys.stderr)
+    return 1
+
+
+# ---------------------------------------------------------------------------
+# Batch mode: one interpreter runs every test case of a submission
+# ---------------------------------------------------------------------------
+
+class TimeBudgetExceeded(BaseException):
+    # BaseException so a contestant's "except Exception" can't swallow it
+    pass
+
+
+class CpuBudgetExceeded(BaseException):
+    pass
+
+
+class OutputLimitExceeded(BaseException):
+    pass
+
+
+class CappedOutput(io.StringIO):
+    # Capture for one stream of a test case; stdout and stderr share the
+    # one-element budget list, counted in characters
+    def __init__(self, budget):
+        super().__init__()
+        self.budget = budget
+
+    def write(self, text):
+        self.budget[0] -= len(text)
+        if self.budget[0] < 0:
+            raise OutputLimitExceeded()
+        return super().write(text)
+
+
+def read_frame(stream):
+    header = stream.readline()
+    if not header:
+        return None
+    return json.loads(stream.read(int(header)))
+
+
+def write_frame(stream, payload):
+    data = json.dumps(payload).encode()
+    stream.write(b'%d\n' % len(data))
+    stream.write(data)
+    stream.flush()
+
+
+def input_fields(test_case):
+    # Large generated inputs stay on disk and travel as a path; a pre-parsed
+    # form goes along when the judge made one
+    if 'input_file' in test_case:
+        fields = {'input_file': test_case['input_file']}
+    else:
+        fields = {'input': test_case['input']}
+    for key in ('wire', 'wire_file'):
+        if key in test_case:
+            fields[key] = test_case[key]
+    return fields
+
+
+def open_input(request):
+    if 'input_file' in request:
+        return open(request['input_file'])
+    return io.StringIO(request['input'])
+
+
+def rusage_fields(rusage, before=None):
+    # CPU seconds and peak resident memory (KB) of a run; with `before`, the
+    # CPU time is what was spent since that earlier sample
+    user, system = rusage.ru_utime, rusage.ru_stime
+    if before is not None:
+        user, system = user - before.ru_utime, system - before.ru_stime
+    return {'cpu_user': user, 'cpu_system': system, 'peak_rss_kb': rusage.ru_maxrss // MAXRSS_UNIT}
+
+
+def read_peak_rss(pid='self'):
+    # VmHWM of a live process in KB, 0 where /proc isn't available. Unlike
+    # ru_maxrss it covers only the current program image: Linux carries the
+    # parent's peak over fork and exec into the child's ru_maxrss.
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def on_time_budget(signum, frame):
+    raise TimeBudgetExceeded()
+
+
+def on_cpu_budget(signum, frame):
+    raise CpuBudgetExceeded()
+
+
+def run_batch(source_path):
+    # Frames travel over private copies of stdin/stdout; the real descriptors
+    # point at /dev/null so stray writes can't corrupt the stream
+    import resource
+    requests = os.fdopen(os.dup(0), 'rb')
+    responses = os.fdopen(os.dup(1), 'wb')
+    null_fd = os.open(os.devnull, os.O_RDWR)
+    os.dup2(null_fd, 0)
+    os.dup2(null_fd, 1)
+    signal.signal(signal.SIGALRM, on_time_budget)
+    signal.signal(signal.SIGPROF, on_cpu_budget)
+
+    # The module runs once, so what its top level prints is kept and
+    # replayed into every case, as if it ran per case like the other modes
+    namespace = solution_globals()
+    setup_out, setup_err = io.StringIO(), io.StringIO()
+    setup_status = None  # Set when the module itself ended the "process"
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(), setup_out, setup_err
+    try:
+        with open(source_path) as f:
+            code = compile(f.read(), source_path, 'exec')
+        exec(code, namespace)
+    except SystemExit as e:
+        setup_status = exit_status(e.code)
+    except BaseException as e:
+        setup_err.write(''.join(traceback.format_exception(type(e), e, e.__traceback__.tb_next)))
+        setup_status = 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = sys.__stdin__, sys.__stdout__, sys.__stderr__
+
+    while True:
+        request = read_frame(requests)
+        if request is None:
+            break
+
+        budget = [request['output_limit']]
+        out, err = CappedOutput(budget), CappedOutput(budget)
+        stdin = open_input(request)
+        sys.stdin, sys.stdout, sys.stderr = stdin, out, err
+        timed_out = output_limit_exceeded = cpu_limit_exceeded = False
+        status = setup_status or 0
+        counter = None
+        if 'instruction_limit' in request and setup_status is None:
+            counter = InstructionCounter(code, request['instruction_limit'])
+        before = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        try:
+            # Wall-clock and CPU budgets, like the per-process timeout and RLIMIT_CPU
+            signal.setitimer(signal.ITIMER_REAL, request['timeout'])
+            signal.setitimer(signal.ITIMER_PROF, request['cpu_limit'])
+            out.write(setup_out.getvalue())
+            err.write(setup_err.getvalue())
+            if setup_status is None and 'solution' not in namespace:
+                print("Error: name 'solution' is not defined", file=err)
+            elif setup_status is None:
+                run(namespace['solution'], request, counter)
+        except TimeBudgetExceeded:
+            timed_out = True
+        except CpuBudgetExceeded:
+            cpu_limit_exceeded = True
+        except InstructionBudgetExceeded:
+            pass  # Judged from the count
+        except OutputLimitExceeded:
+            output_limit_exceeded = True
+        except SystemExit as e:
+            try:
+                status = exit_status(e.code)
+            except OutputLimitExceeded:
+                output_limit_exceeded = True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            elapsed = time.perf_counter() - start
+            # One process runs every case, so the peak is the batch's so far
+            usage = rusage_fields(resource.getrusage(resource.RUSAGE_SELF), before)
+            usage['peak_rss_kb'] = read_peak_rss() or usage['peak_rss_kb']
+            usage['instructions'] = counter.count if counter else None
+            stdin.close()
+            sys.stdin, sys.stdout, sys.stderr = sys.__stdin__, sys.__stdout__, sys.__stderr__
+
+        if output_limit_exceeded:
+            out, err = io.StringIO(), io.StringIO()
+        write_frame(responses, {
+            'stdout': out.getvalue(),
+            'stderr': err.getvalue(),
+            'timed_out': timed_out,
+            'output_limit_exceeded': output_limit_exceeded,
+            'cpu_limit_exceeded': cpu_limit_exceeded,
+            'exit_status': status,
+            'time': elapsed,
+            'usage': usage
+        })
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--batch':
+        run_batch(sys.argv[2])
+    else:
+        print('usage: judge_harness.py --batch SOURCE', file=sys.stderr)
+        sys.exit(2)
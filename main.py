@@ -1,9 +1,12 @@
 from PyQt5.QtWidgets import QApplication
 from login_page import LoginPage
+from toolchain_registry import registry as toolchains
 import sys
 
 def main():
     app = QApplication(sys.argv)
+    # Probe compilers/interpreters while the contestant logs in
+    toolchains.start()
     window = LoginPage()
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,113 @@
+import re
+import math
+
+# Token-by-token comparison of a solution's output with the expected one.
+# Both sides are read from streams in fixed-size chunks and compared as they
+# are read, so memory stays constant however large the output is and a
+# mismatch stops the comparison straight away.
+#
+# Tokens are separated by whitespace, and brackets, braces, parentheses,
+# commas and colons are tokens of their own, so "[1, 2]" matches "[1,2]".
+# Numbers with a fractional part or exponent are compared with a tolerance;
+# integers and everything else must match exactly.
+ABS_TOLERANCE = 1e-6
+REL_TOLERANCE = 1e-6
+CHUNK_SIZE = 65536  # Characters read from a stream at a time
+MAX_PART = 4096  # Longer tokens are compared piece by piece
+
+DELIMITERS = '[]{}(),:'
+SEPARATOR = re.compile(r'[\s\[\]{}(),:]')
+NON_SPACE = re.compile(r'\S')
+INTEGER = re.compile(r'[+-]?\d+$')
+NUMBER = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+
+
+class TokenReader:
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+
+    def fill(self):
+        # False once the stream is exhausted
+        if self.pos < len(self.buffer):
+            return True
+        self.buffer = self.stream.read(self.chunk_size)
+        self.pos = 0
+        return bool(self.buffer)
+
+    def next_token(self):
+        # (first part, more) of the next token, or (None, False) at the end
+        while self.fill():
+            match = NON_SPACE.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                continue
+            self.pos = match.start()
+            if self.buffer[self.pos] in DELIMITERS:
+                self.pos += 1
+                return self.buffer[self.pos - 1], False
+            return self.next_part()
+        return None, False
+
+    def next_part(self):
+        # Up to MAX_PART more characters of the current token
+        parts = []
+        size = 0
+        while size < MAX_PART and self.fill():
+            end = min(len(self.buffer), self.pos + MAX_PART - size)
+            match = SEPARATOR.search(self.buffer, self.pos, end)
+            stop = match.start() if match else end
+            parts.append(self.buffer[self.pos:stop])
+            size += stop - self.pos
+            self.pos = stop
+            if match:
+                return ''.join(parts), False
+        more = size == MAX_PART and self.fill() and not SEPARATOR.match(self.buffer, self.pos)
+        return ''.join(parts), more
+
+
+def tokens_match(actual, expected, abs_tolerance=ABS_TOLERANCE, rel_tolerance=REL_TOLERANCE):
+    if actual == expected:
+        return True
+    if not (NUMBER.match(actual) and NUMBER.match(expected)):
+        return False
+    if INTEGER.match(actual) and INTEGER.match(expected):
+        return int(actual) == int(expected)
+    return math.isclose(float(actual), float(expected), rel_tol=rel_tolerance, abs_tol=abs_tolerance)
+
+
+def long_tokens_match(actual, expected, first, second):
+    # Exact comparison of a token too long to hold whole; the two sides may
+    # arrive in differently sized parts
+    a, a_more = first
+    b, b_more = second
+    while True:
+        size = min(len(a), len(b))
+        if a[:size] != b[:size]:
+            return False
+        a, b = a[size:], b[size:]
+        if not a and a_more:
+            a, a_more = actual.next_part()
+        if not b and b_more:
+            b, b_more = expected.next_part()
+        if not a and not b:
+            return True
+        if (not a and not a_more) or (not b and not b_more):
+            return False
+
+
+def outputs_match(actual_stream, expected_stream, abs_tolerance=ABS_TOLERANCE, rel_tolerance=REL_TOLERANCE):
+    actual = TokenReader(actual_stream)
+    expected = TokenReader(expected_stream)
+    while True:
+        first = actual.next_token()
+        second = expected.next_token()
+        if first[0] is None or second[0] is None:
+            return first[0] is None and second[0] is None
+        if first[1] or second[1]:
+            if not long_tokens_match(actual, expected, first, second):
+                return False
+        elif not tokens_match(first[0], second[0], abs_tolerance, rel_tolerance):
+            return False
@@ -0,0 +1,438 @@
+# Problem pools for the DSA rounds, kept free of Qt so the judge and command
+# line tools can load them too. Besides the visible test cases every problem
+# has a Python reference solution and, in test_generators.py, a seeded input
+# generator for its hidden stress tests; the judge runs the reference on each
+# generated input to get the expected output and, timed on this machine, the
+# time limit. Stress inputs are sized so the reference works for around a
+# tenth of a second, which makes its time rather than startup set the limit;
+# references use the approach the question asks for (a stack for palindromes).
+#
+# "instruction_limit" is the per-test budget of bytecode instructions for
+# Python submissions when the judge counts instructions instead of timing
+# them: three times what the reference needs on the largest hidden input,
+# and at least about 50 per input element so that a plain Python loop can
+# match a reference that leans on C builtins.
+
+# The Python harness turns any single-line list input into a TreeNode, so
+# references taking a plain list or grid undo that first
+AS_LIST = '''
+def as_list(value):
+    if not isinstance(value, TreeNode):
+        return value
+    values = []
+    queue = [value]
+    for node in queue:
+        values.append(node.val)
+        queue.extend(child for child in (node.left, node.right) if child is not None)
+    return values
+
+'''
+
+BST_MAX = '''
+def solution(root):
+    best = root.val
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        best = max(best, node.val)
+        stack.extend(child for child in (node.left, node.right) if child is not None)
+    return best
+'''
+
+PALINDROME = '''
+def solution(s):
+    stack = list(s)
+    for c in s:
+        if stack.pop() != c:
+            return False
+    return True
+'''
+
+LEVEL_ORDER = '''
+from collections import deque
+
+def solution(root):
+    values = []
+    queue = deque([root] if root else [])
+    while queue:
+        node = queue.popleft()
+        values.append(node.val)
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+    return values
+'''
+
+LONGEST_UNIQUE = '''
+def solution(s):
+    last_seen = {}
+    start = best = 0
+    for i, c in enumerate(s):
+        if last_seen.get(c, -1) >= start:
+            start = last_seen[c] + 1
+        last_seen[c] = i
+        best = max(best, i - start + 1)
+    return best
+'''
+
+MEDIAN = '''
+def solution(nums1, nums2):
+    merged = sorted(nums1 + nums2)
+    middle = len(merged) // 2
+    if len(merged) % 2:
+        return float(merged[middle])
+    return (merged[middle - 1] + merged[middle]) / 2.0
+'''
+
+ISLANDS = AS_LIST + '''
+def solution(grid):
+    grid = as_list(grid)
+    rows, cols = len(grid), len(grid[0]) if grid else 0
+    seen = [[False] * cols for _ in range(rows)]
+    islands = 0
+    for r in range(rows):
+        for c in range(cols):
+            if grid[r][c] != 1 or seen[r][c]:
+                continue
+            islands += 1
+            seen[r][c] = True
+            stack = [(r, c)]
+            while stack:
+                y, x = stack.pop()
+                for ny, nx in ((y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1)):
+                    if 0 <= ny < rows and 0 <= nx < cols and grid[ny][nx] == 1 and not seen[ny][nx]:
+                        seen[ny][nx] = True
+                        stack.append((ny, nx))
+    return islands
+'''
+
+COIN_CHANGE = '''
+def solution(coins, amount):
+    unreachable = amount + 1
+    fewest = [0] + [unreachable] * amount
+    for coin in coins:
+        for total in range(coin, amount + 1):
+            if fewest[total - coin] + 1 < fewest[total]:
+                fewest[total] = fewest[total - coin] + 1
+    return fewest[amount] if fewest[amount] != unreachable else -1
+'''
+
+LONGEST_PALINDROME = '''
+def solution(s):
+    best_start, best_length = 0, 0
+    for center in range(2 * len(s) - 1):
+        left, right = center // 2, center // 2 + center % 2
+        while left >= 0 and right < len(s) and s[left] == s[right]:
+            left -= 1
+            right += 1
+        if right - left - 1 > best_length:
+            best_start, best_length = left + 1, right - left - 1
+    return s[best_start:best_start + best_length]
+'''
+
+MAX_PRODUCT = AS_LIST + '''
+def solution(nums):
+    nums = as_list(nums)
+    best = high = low = nums[0]
+    for value in nums[1:]:
+        candidates = (value, high * value, low * value)
+        high, low = max(candidates), min(candidates)
+        best = max(best, high)
+    return best
+'''
+
+MIN_WINDOW = '''
+from collections import Counter
+
+def solution(s, t):
+    need = Counter(t)
+    missing = len(t)
+    start, best = 0, (0, len(s) + 1)
+    for end, c in enumerate(s, 1):
+        if need[c] > 0:
+            missing -= 1
+        need[c] -= 1
+        if missing == 0:
+            while need[s[start]] < 0:
+                need[s[start]] += 1
+                start += 1
+            if end - start < best[1] - best[0]:
+                best = (start, end)
+            need[s[start]] += 1
+            missing += 1
+            start += 1
+    return s[best[0]:best[1]] if best[1] <= len(s) else ""
+'''
+
+
+ROUND1_PROBLEMS = [
+    {
+        "id": "dsa1-bst-max",
+        "question": "Implement a function to find the maximum element in a binary search tree.",
+        "input_format": "The function should take the root of the BST as input.",
+        "output_format": "Return the maximum value in the BST.",
+        "test_cases": [
+            {"input": "[5,3,7,2,4,6,8]", "output": "8", "points": 2.5},
+            {"input": "[10,5,15,3,7,12,20]", "output": "20", "points": 2.5},
+            {"input": "[1]", "output": "1", "points": 2.5},
+            {"input": "[5,3,7,2,4,6,8,9]", "output": "9", "points": 2.5},
+            {"input": "[10,5,15,3,7,12,20,25]", "output": "25", "points": 2.5},
+            {"input": "[5,3,7,2,4,6,8,9,10]", "output": "10", "points": 2.5},
+            {"input": "[10,5,15,3,7,12,20,25,30]", "output": "30", "points": 2.5},
+            {"input": "[5,3,7,2,4,6,8,9,10,11]", "output": "11", "points": 2.5},
+            {"input": "[10,5,15,3,7,12,20,25,30,35]", "output": "35", "points": 2.5},
+            {"input": "[5,3,7,2,4,6,8,9,10,11,12]", "output": "12", "points": 2.5}
+        ],
+        "total_points": 30,
+        "reference": BST_MAX,
+        "stress_tests": [
+            {"size": 40000, "seed": 1, "points": 2.5},
+            {"size": 40000, "seed": 2, "points": 2.5}
+        ],
+        "instruction_limit": 6_000_000
+    },
+    {
+        "id": "dsa1-palindrome",
+        "question": "Write a function to check if a given string is a palindrome using a stack.",
+        "input_format": "The function should take a string as input.",
+        "output_format": "Return True if the string is a palindrome, False otherwise.",
+        "test_cases": [
+            {"input": "racecar", "output": "True", "points": 2.5},
+            {"input": "hello", "output": "False", "points": 2.5},
+            {"input": "madam", "output": "True", "points": 2.5},
+            {"input": "random", "output": "False", "points": 2.5},  # Random test case
+            {"input": "level", "output": "True", "points": 2.5},
+            {"input": "python", "output": "False", "points": 2.5},
+            {"input": "radar", "output": "True", "points": 2.5},
+            {"input": "random", "output": "False", "points": 2.5},  # Random test case
+            {"input": "civic", "output": "True", "points": 2.5},
+            {"input": "random", "output": "False", "points": 2.5}   # Random test case
+        ],
+        "total_points": 30,
+        "reference": PALINDROME,
+        "stress_tests": [
+            {"size": 2000000, "seed": 1, "points": 2.5},
+            {"size": 2000000, "seed": 2, "points": 2.5}
+        ],
+        "instruction_limit": 100_000_000
+    },
+    {
+        "id": "dsa1-level-order",
+        "question": "Implement a function to perform level order traversal of a binary tree.",
+        "input_format": "The function should take the root of the binary tree as input.",
+        "output_format": "Return a list of values in level order.",
+        "test_cases": [
+            {"input": "[3,9,20,null,null,15,7]", "output": "[3,9,20,15,7]", "points": 2.5},
+            {"input": "[1]", "output": "[1]", "points": 2.5},
+            {"input": "[]", "output": "[]", "points": 2.5},
+            {"input": "[1,2,3,4,5]", "output": "[1,2,3,4,5]", "points": 2.5},
+            {"input": "[1,null,2,3]", "output": "[1,2,3]", "points": 2.5},
+            {"input": "[1,2,3,4,null,null,5]", "output": "[1,2,3,4,5]", "points": 2.5},
+            {"input": "[1,2,3,null,4,5]", "output": "[1,2,3,4,5]", "points": 2.5},
+            {"input": "[1,2,3,4,5,6,7]", "output": "[1,2,3,4,5,6,7]", "points": 2.5},
+            {"input": "[1,2,3,4,5,null,6]", "output": "[1,2,3,4,5,6]", "points": 2.5},
+            {"input": "[1,2,3,4,5,6]", "output": "[1,2,3,4,5,6]", "points": 2.5}
+        ],
+        "total_points": 30,
+        "reference": LEVEL_ORDER,
+        "stress_tests": [
+            {"size": 40000, "seed": 1, "points": 2.5},
+            {"size": 40000, "seed": 2, "points": 2.5}
+        ],
+        "instruction_limit": 4_000_000
+    },
+    {
+        "id": "dsa1-longest-unique",
+        "question": "Implement a function to find the longest substring without repeating characters.",
+        "input_format": "The function should take a string as input.",
+        "output_format": "Return the length of the longest substring without repeating characters.",
+        "test_cases": [
+            {"input": "abcabcbb", "output": "3", "points": 2.5},
+            {"input": "bbbbb", "output": "1", "points": 2.5},
+            {"input": "pwwkew", "output": "3", "points": 2.5},
+            {"input": "abcdef", "output": "6", "points": 2.5},
+            {"input": "aab", "output": "2", "points": 2.5},
+            {"input": "dvdf", "output": "3", "points": 2.5},
+            {"input": "anviaj", "output": "5", "points": 2.5},
+            {"input": "qrsvbspk", "output": "5", "points": 2.5},
+            {"input": "tmmzuxt", "output": "5", "points": 2.5},
+            {"input": "bbtablud", "output": "6", "points": 2.5}
+        ],
+        "total_points": 30,
+        "reference": LONGEST_UNIQUE,
+        "stress_tests": [
+            {"size": 200000, "seed": 1, "points": 2.5},
+            {"size": 200000, "seed": 2, "points": 2.5}
+        ],
+        "instruction_limit": 18_000_000
+    },
+    {
+        "id": "dsa1-median",
+        "question": "Implement a function to find the median of two sorted arrays.",
+        "input_format": "The function should take two sorted arrays as input.",
+        "output_format": "Return the median of the two arrays.",
+        "test_cases": [
+            {"input": "[1,3], [2]", "output": "2.0", "points": 2.5},
+            {"input": "[1,2], [3,4]", "output": "2.5", "points": 2.5},
+            {"input": "[0,0], [0,0]", "output": "0.0", "points": 2.5},
+            {"input": "[1,3,5], [2,4,6]", "output": "3.5", "points": 2.5},
+            {"input": "[1,2,3], [4,5,6]", "output": "3.5", "points": 2.5},
+            {"input": "[1,3,5,7], [2,4,6,8]", "output": "4.5", "points": 2.5},
+            {"input": "[1,2,3,4], [5,6,7,8]", "output": "4.5", "points": 2.5},
+            {"input": "[1,3,5,7,9], [2,4,6,8,10]", "output": "5.5", "points": 2.5},
+            {"input": "[1,2,3,4,5], [6,7,8,9,10]", "output": "5.5", "points": 2.5},
+            {"input": "[1,3,5,7,9,11], [2,4,6,8,10,12]", "output": "6.5", "points": 2.5}
+        ],
+        "total_points": 30,
+        "reference": MEDIAN,
+        "stress_tests": [
+            {"size": 100000, "seed": 1, "points": 2.5},
+            {"size": 100000, "seed": 2, "points": 2.5}
+        ],
+        "instruction_limit": 10_000_000
+    }
+]
+
+
+
+ROUND2_PROBLEMS = [
+    {
+        "id": "dsa2-islands",
+        "question": "Implement a function to find the number of islands in a 2D grid. An island is surrounded by water and is formed by connecting adjacent lands horizontally or vertically.",
+        "input_format": "The function should take a 2D grid of '1's (land) and '0's (water) as input.",
+        "output_format": "Return the number of islands.",
+        "test_cases": [
+            {"input": "[[1,1,1,1,0],[1,1,0,1,0],[1,1,0,0,0],[0,0,0,0,0]]", "output": "1", "points": 2.75},
+            {"input": "[[1,1,0,0,0],[1,1,0,0,0],[0,0,1,0,0],[0,0,0,1,1]]", "output": "3", "points": 2.75},
+            {"input": "[[1,0,1,0,1],[0,1,0,1,0],[1,0,1,0,1],[0,1,0,1,0]]", "output": "10", "points": 2.75},
+            {"input": "[[1,1,1],[0,1,0],[1,1,1]]", "output": "1", "points": 2.75},
+            {"input": "[[1,0,1,0,1],[1,0,1,0,1],[1,1,1,1,1]]", "output": "1", "points": 2.75},
+            {"input": "[[1,1,1,1,1],[1,0,0,0,1],[1,0,1,0,1],[1,0,0,0,1],[1,1,1,1,1]]", "output": "2", "points": 2.75},
+            {"input": "[[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0]]", "output": "0", "points": 2.75},
+            {"input": "[[1,1,1,1,1],[1,1,1,1,1],[1,1,1,1,1],[1,1,1,1,1]]", "output": "1", "points": 2.75},
+            {"input": "[[1,0,1,0,1],[0,1,0,1,0],[1,0,1,0,1],[0,1,0,1,0],[1,0,1,0,1]]", "output": "13", "points": 2.75},
+            {"input": "[[1,1,0,0,0,0],[1,1,0,0,0,0],[0,0,1,1,0,0],[0,0,1,1,0,0],[0,0,0,0,1,1],[0,0,0,0,1,1]]", "output": "3", "points": 2.75},
+            {"input": "[[1,0,0,0,0,1],[0,1,0,0,1,0],[0,0,1,1,0,0],[0,0,1,1,0,0],[0,1,0,0,1,0],[1,0,0,0,0,1]]", "output": "6", "points": 2.75},
+            {"input": "[[1,1,1,0,0,0],[1,0,1,0,0,0],[1,1,1,0,0,0],[0,0,0,1,1,1],[0,0,0,1,0,1],[0,0,0,1,1,1]]", "output": "2", "points": 2.75}
+        ],
+        "total_points": 40,
+        "reference": ISLANDS,
+        "stress_tests": [
+            {"size": 450, "seed": 1, "points": 3.5},
+            {"size": 450, "seed": 2, "points": 3.5}
+        ],
+        "instruction_limit": 60_000_000
+    },
+    {
+        "id": "dsa2-coin-change",
+        "question": "Implement a function to find the minimum number of coins needed to make up a given amount using coins of given denominations.",
+        "input_format": "The function should take an array of coin denominations and the target amount as input.",
+        "output_format": "Return the minimum number of coins needed to make up the amount. If it's not possible, return -1.",
+        "test_cases": [
+            {"input": "[1,2,5]\n11", "output": "3", "points": 2.75},
+            {"input": "[2]\n3", "output": "-1", "points": 2.75},
+            {"input": "[1,2,5,10,20,50,100]\n73", "output": "4", "points": 2.75},
+            {"input": "[1,3,4,5]\n7", "output": "2", "points": 2.75},
+            {"input": "[1,2,5,10]\n18", "output": "4", "points": 2.75},
+            {"input": "[1,5,10,25]\n30", "output": "2", "points": 2.75},
+            {"input": "[1,2,5,10,20]\n43", "output": "5", "points": 2.75},
+            {"input": "[2,5,10,20]\n1", "output": "-1", "points": 2.75},
+            {"input": "[1,3,4,5]\n10", "output": "2", "points": 2.75},
+            {"input": "[1,2,5,10,20,50]\n65", "output": "3", "points": 2.75},
+            {"input": "[1,2,5,10,20,50,100]\n127", "output": "4", "points": 2.75},
+            {"input": "[1,2,5,10,20,50,100]\n200", "output": "2", "points": 2.75}
+        ],
+        "total_points": 40,
+        "reference": COIN_CHANGE,
+        "stress_tests": [
+            {"size": 100000, "seed": 1, "points": 3.5},
+            {"size": 100000, "seed": 2, "points": 3.5}
+        ],
+        "instruction_limit": 60_000_000
+    },
+    {
+        "id": "dsa2-longest-palindrome",
+        "question": "Implement a function to find the longest palindromic substring in a given string.",
+        "input_format": "The function should take a string as input.",
+        "output_format": "Return the longest palindromic substring.",
+        "test_cases": [
+            {"input": "babad", "output": "bab", "points": 2.75},
+            {"input": "cbbd", "output": "bb", "points": 2.75},
+            {"input": "a", "output": "a", "points": 2.75},
+            {"input": "ac", "output": "a", "points": 2.75},
+            {"input": "racecar", "output": "racecar", "points": 2.75},
+            {"input": "abacdfgdcaba", "output": "aba", "points": 2.75},
+            {"input": "forgeeksskeegfor", "output": "geeksskeeg", "points": 2.75},
+            {"input": "abcbabcbabcba", "output": "abcbabcbabcba", "points": 2.75},
+            {"input": "abacabacabbacabacab", "output": "bacabacabbacabacab", "points": 2.75},
+            {"input": "abacabacabbacabacaba", "output": "abacabacabbacabacaba", "points": 2.75},
+            {"input": "abacabacabbacabacabac", "output": "abacabacabbacabacaba", "points": 2.75},
+            {"input": "abacabacabbacabacabaca", "output": "abacabacabbacabacaba", "points": 2.75}
+        ],
+        "total_points": 40,
+        "reference": LONGEST_PALINDROME,
+        "stress_tests": [
+            {"size": 80000, "seed": 1, "points": 3.5},
+            {"size": 80000, "seed": 2, "points": 3.5}
+        ],
+        "instruction_limit": 28_000_000
+    },
+    {
+        "id": "dsa2-max-product",
+        "question": "Implement a function to find the maximum product subarray in a given array of integers.",
+        "input_format": "The function should take an array of integers as input.",
+        "output_format": "Return the maximum product of any contiguous subarray.",
+        "test_cases": [
+            {"input": "[2,3,-2,4]", "output": "6", "points": 2.75},
+            {"input": "[-2,0,-1]", "output": "0", "points": 2.75},
+            {"input": "[2,3,-2,4,-1]", "output": "48", "points": 2.75},
+            {"input": "[-2,-3,-4]", "output": "12", "points": 2.75},
+            {"input": "[0,2]", "output": "2", "points": 2.75},
+            {"input": "[-2,3,-4]", "output": "24", "points": 2.75},
+            {"input": "[2,-5,-2,-4,3]", "output": "24", "points": 2.75},
+            {"input": "[3,-1,4]", "output": "4", "points": 2.75},
+            {"input": "[1,2,-3,0,-4,-5]", "output": "20", "points": 2.75},
+            {"input": "[2,-5,3,1,-4,0,-10,2,8]", "output": "120", "points": 2.75},
+            {"input": "[-1,-2,-3,0]", "output": "6", "points": 2.75},
+            {"input": "[1,2,3,4,5,6,7,8,9,10]", "output": "3628800", "points": 2.75}
+        ],
+        "total_points": 40,
+        "reference": MAX_PRODUCT,
+        "stress_tests": [
+            {"size": 60000, "seed": 1, "points": 3.5},
+            {"size": 60000, "seed": 2, "points": 3.5}
+        ],
+        "instruction_limit": 13_500_000
+    },
+    {
+        "id": "dsa2-min-window",
+        "question": "Implement a function to find the minimum window substring in a given string that contains all characters of another string.",
+        "input_format": "The function should take two strings s and t as input.",
+        "output_format": "Return the minimum window substring of s that contains all characters of t.",
+        "test_cases": [
+            {"input": "ADOBECODEBANC\nABC", "output": "BANC", "points": 2.75},
+            {"input": "a\na", "output": "a", "points": 2.75},
+            {"input": "a\nb", "output": "", "points": 2.75},
+            {"input": "ab\nb", "output": "b", "points": 2.75},
+            {"input": "cabwefgewcwaefgcf\ncae", "output": "cwae", "points": 2.75},
+            {"input": "aaflslflsldkalskaaa\naaa", "output": "aaa", "points": 2.75},
+            {"input": "abababaabababaabababa\naba", "output": "aba", "points": 2.75},
+            {"input": "abababaabababaabababa\nabab", "output": "abab", "points": 2.75},
+            {"input": "abababaabababaabababa\nababa", "output": "ababa", "points": 2.75},
+            {"input": "abababaabababaabababa\nababab", "output": "ababab", "points": 2.75},
+            {"input": "abababaabababaabababa\nabababa", "output": "abababa", "points": 2.75},
+            {"input": "abababaabababaabababa\nabababab", "output": "abababaab", "points": 2.75}
+        ],
+        "total_points": 40,
+        "reference": MIN_WINDOW,
+        "stress_tests": [
+            {"size": 150000, "seed": 1, "points": 3.5},
+            {"size": 150000, "seed": 2, "points": 3.5}
+        ],
+        "instruction_limit": 21_000_000
+    }
+]
+
+
+PROBLEMS = {problem["id"]: problem for problem in ROUND1_PROBLEMS + ROUND2_PROBLEMS}
@@ -0,0 +1,319 @@
+import os
+import sys
+import json
+import time
+import select
+import signal
+import tempfile
+import threading
+import traceback
+import subprocess
+import judge_harness
+
+WORKER_SCRIPT = os.path.abspath(__file__)
+WORKER_GRACE = 2  # Extra seconds the client waits beyond the per-case timeout
+POLL_INTERVAL = 0.0002  # First wait between child status checks
+MAX_POLL_INTERVAL = 0.005
+MAX_CACHED_SOURCES = 16
+
+
+class WorkerError(Exception):
+    pass
+
+
+def exit_code(status):
+    # os.waitstatus_to_exitcode, which contestants' Python 3.8 lacks: the
+    # exit status, or minus the signal that ended the process
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+class WarmPythonWorker:
+    # Client side of the fork server: one long-lived interpreter per Python
+    # version with the harness already imported. Requests may overlap; the
+    # server forks a child for each and answers in completion order.
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.process = None
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.next_id = 0
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        with self.lock:
+            if self.alive():
+                return
+            self.process = subprocess.Popen(
+                [self.interpreter, WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=os.path.dirname(WORKER_SCRIPT)
+            )
+            reader = threading.Thread(target=self.read_responses, args=(self.process,))
+            reader.daemon = True
+            reader.start()
+
+    def read_responses(self, process):
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+            with self.lock:
+                waiter = self.pending.pop(response.get('id'), None)
+            if waiter:
+                waiter['response'] = response
+                waiter['event'].set()
+
+        # Worker exited: wake everyone still waiting on it
+        with self.lock:
+            orphans = [key for key, waiter in self.pending.items() if waiter['process'] is process]
+            waiters = [self.pending.pop(key) for key in orphans]
+        for waiter in waiters:
+            waiter['event'].set()
+
+    def run(self, source_path, test_case, timeout, output_limit=judge_harness.OUTPUT_LIMIT, limits=None):
+        # limits: {"cpu": seconds, "memory": MB} applied to the forked child,
+        # plus "instructions" (a budget, or None) when instructions are counted
+        self.start()
+        waiter = {'event': threading.Event(), 'response': None}
+
+        with self.lock:
+            request_id = self.next_id
+            self.next_id += 1
+            waiter['process'] = self.process
+            self.pending[request_id] = waiter
+            request = {
+                'id': request_id,
+                'source': source_path,
+                'timeout': timeout,
+                'output_limit': output_limit,
+                'limits': limits
+            }
+            request.update(judge_harness.input_fields(test_case))
+            if limits and 'instructions' in limits:
+                request['instruction_limit'] = limits['instructions']
+            try:
+                self.process.stdin.write((json.dumps(request) + '\n').encode())
+                self.process.stdin.flush()
+            except (OSError, ValueError) as e:
+                del self.pending[request_id]
+                raise WorkerError(f"Python worker unavailable: {e}")
+
+        # The server enforces the timeout itself; only a wedged worker gets here
+        if not waiter['event'].wait(timeout + WORKER_GRACE):
+            self.close()
+            raise WorkerError("Python worker stopped responding")
+        if waiter['response'] is None:
+            raise WorkerError("Python worker exited unexpectedly")
+        return waiter['response']
+
+    def close(self):
+        with self.lock:
+            process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=1)
+        except Exception:
+            process.kill()
+
+
+# ---------------------------------------------------------------------------
+# Server side, executed by the contestant's interpreter
+# ---------------------------------------------------------------------------
+
+def load_code(path, cache):
+    # Workspaces are reused, so the same path can hold a new submission
+    # written within the filesystem's timestamp granularity
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+    cached = cache.get(path)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with open(path) as f:
+        code = compile(f.read(), path, 'exec')
+    if len(cache) >= MAX_CACHED_SOURCES:
+        cache.clear()
+    cache[path] = (version, code)
+    return code
+
+
+def apply_limits(limits):
+    import resource
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    resource.setrlimit(resource.RLIMIT_CPU, (limits['cpu'], limits['cpu'] + 1))
+    memory = limits['memory'] * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+
+
+def run_child(code, request, out_fd, err_fd, stats_fd):
+    # Runs in the forked child and never returns; a file input is only read
+    # here, so the server itself never holds it. An instruction count is
+    # left in the stats file for the server.
+    status = 0
+    counter = None
+    try:
+        # Own process group, so the server can kill whatever the case spawns
+        os.setpgid(0, 0)
+        if request.get('limits'):
+            apply_limits(request['limits'])
+        os.dup2(out_fd, 1)
+        os.dup2(err_fd, 2)
+        sys.stdin = judge_harness.open_input(request)
+        sys.stdout = open(1, 'w', closefd=False)
+        sys.stderr = open(2, 'w', closefd=False)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        namespace = judge_harness.solution_globals()
+        exec(code, namespace)
+        if 'instruction_limit' in request:
+            counter = judge_harness.InstructionCounter(code, request['instruction_limit'])
+        if 'solution' not in namespace:
+            print("Error: name 'solution' is not defined", file=sys.stderr)
+        else:
+            judge_harness.run(namespace['solution'], request, counter)
+    except judge_harness.InstructionBudgetExceeded:
+        pass  # Judged from the count
+    except SystemExit as e:
+        status = judge_harness.exit_status(e.code)
+    except BaseException as e:
+        # Hide the worker's own frame so the trace matches a standalone run
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        status = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if counter is not None:
+                os.write(stats_fd, str(counter.count).encode())
+        finally:
+            os._exit(status)
+
+
+def read_capture(f, limit):
+    f.seek(0)
+    data = f.read(limit).decode(errors='replace')
+    f.close()
+    return data
+
+
+def read_count(stats):
+    # The child's instruction count, or None if it didn't count or died first
+    if stats is None:
+        return None
+    stats.seek(0)
+    data = stats.read()
+    stats.close()
+    return int(data) if data else None
+
+
+def captured_size(out, err):
+    return os.fstat(out.fileno()).st_size + os.fstat(err.fileno()).st_size
+
+
+def kill_case(pid):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError:
+        os.kill(pid, signal.SIGKILL)
+
+
+def send(response):
+    sys.stdout.write(json.dumps(response) + '\n')
+    sys.stdout.flush()
+
+
+def start_case(request, cache, pending):
+    try:
+        code = load_code(request['source'], cache)
+    except Exception as e:
+        send({'id': request['id'], 'stdout': '', 'stderr': f'Error: {e}',
+              'returncode': 1, 'timed_out': False, 'output_limit_exceeded': False, 'usage': {}})
+        return
+
+    out = tempfile.TemporaryFile()
+    err = tempfile.TemporaryFile()
+    stats = tempfile.TemporaryFile() if 'instruction_limit' in request else None
+    sys.stdout.flush()
+    pid = os.fork()
+    if pid == 0:
+        run_child(code, request, out.fileno(), err.fileno(), stats.fileno() if stats else -1)
+    pending[pid] = (request['id'], time.monotonic() + request['timeout'], request['output_limit'], out, err, stats)
+
+
+def reap(pending):
+    # Captures go to temporary files, so a print loop is caught by their size
+    # at the next poll rather than by the server's memory
+    finished = False
+    now = time.monotonic()
+    for pid, (request_id, deadline, limit, out, err, stats) in list(pending.items()):
+        done, status, rusage = os.wait4(pid, os.WNOHANG)
+        timed_out = False
+        exceeded = captured_size(out, err) > limit
+        if done == 0:
+            if now < deadline and not exceeded:
+                continue
+            kill_case(pid)
+            _, status, rusage = os.wait4(pid, 0)
+            timed_out = not exceeded
+        else:
+            # Leftovers the case started in its process group
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+        del pending[pid]
+        finished = True
+        usage = judge_harness.rusage_fields(rusage)
+        usage['instructions'] = read_count(stats)
+        send({
+            'id': request_id,
+            'stdout': read_capture(out, 0 if exceeded else limit),
+            'stderr': read_capture(err, 0 if exceeded else limit),
+            'returncode': exit_code(status),
+            'timed_out': timed_out,
+            'output_limit_exceeded': exceeded,
+            'usage': usage
+        })
+    return finished
+
+
+def serve():
+    stdin_fd = sys.stdin.fileno()
+    cache = {}
+    pending = {}
+    buffer = b''
+    interval = POLL_INTERVAL
+
+    while True:
+        ready, _, _ = select.select([stdin_fd], [], [], interval if pending else None)
+        if ready:
+            chunk = os.read(stdin_fd, 65536)
+            if not chunk:
+                break
+            buffer += chunk
+            while b'\n' in buffer:
+                line, buffer = buffer.split(b'\n', 1)
+                start_case(json.loads(line), cache, pending)
+                interval = POLL_INTERVAL
+
+        if pending and not reap(pending):
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    # Parent went away: don't leave children behind
+    for pid in pending:
+        kill_case(pid)
+        os.waitpid(pid, 0)
+
+
+if __name__ == '__main__':
+    serve()
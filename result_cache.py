@@ -0,0 +1,84 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+CACHE_VERSION = 7  # Bump when judging changes so stale verdicts are dropped
+MAX_ENTRIES = 200
+MAX_BYTES = 5 * 1024 * 1024
+
+
+def result_key(code, language, test_cases, limits=None, hidden=None):
+    # hidden describes the generated hidden tests, which aren't in test_cases
+    payload = json.dumps(
+        [CACHE_VERSION, language, test_cases, limits, hidden, code],
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    # Judge verdicts keyed by (source, language, test set), kept in LRU order
+    # and persisted as a single JSON file so they survive a window restart
+    def __init__(self, path, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.total_bytes = 0
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, entry in stored:
+            self.add(key, entry)
+        self.evict()
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(list(self.entries.items()), f)
+        os.replace(temp_path, self.path)
+
+    def add(self, key, entry):
+        if key in self.entries:
+            self.total_bytes -= self.sizes[key]
+        size = len(json.dumps(entry))
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        self.sizes[key] = size
+        self.total_bytes += size
+
+    def evict(self):
+        while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            key, _ = self.entries.popitem(last=False)
+            self.total_bytes -= self.sizes.pop(key)
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            self.add(key, entry)
+            self.evict()
+            try:
+                self.save()
+            except OSError:
+                pass
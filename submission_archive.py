@@ -0,0 +1,72 @@
+import os
+import csv
+import zlib
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+
+ARCHIVE_DIR = "team_data/submissions"
+INDEX_COLUMNS = ['Timestamp', 'Team', 'Round', 'Problem ID', 'Kind', 'Language', 'Score', 'Verdicts', 'Hash']
+
+
+class SubmissionArchive:
+    # Every Run and Submit of the DSA rounds. Sources are stored once per
+    # content under objects/<hash[:2]>/<hash[2:]>, zlib-compressed, and
+    # index.csv has a row per run pointing at its source by hash.
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        self.index_file = os.path.join(root, "index.csv")
+        self.lock = threading.Lock()
+        if not os.path.exists(self.index_file):
+            os.makedirs(root, exist_ok=True)
+            with open(self.index_file, 'w', newline='') as f:
+                csv.writer(f).writerow(INDEX_COLUMNS)
+
+    def object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+    def store(self, code):
+        # Returns the source's hash; a source already archived isn't written again
+        data = code.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            return digest
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(data, 9))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return digest
+
+    def load(self, digest):
+        with open(self.object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read()).decode()
+
+    def record(self, team, round_name, problem_id, kind, language, code, score, verdicts):
+        # kind is 'Run' or 'Submit'
+        digest = self.store(code)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock:
+            with open(self.index_file, 'a', newline='') as f:
+                csv.writer(f).writerow([timestamp, team, round_name, problem_id, kind, language, score, verdicts, digest])
+        return digest
+
+    def entries(self):
+        with open(self.index_file, 'r', newline='') as f:
+            return list(csv.DictReader(f))
+
+    def latest(self, kind='Submit'):
+        # (team, problem id) -> the team's last index row of that kind
+        latest = {}
+        for entry in self.entries():
+            if entry['Kind'] == kind:
+                latest[(entry['Team'], entry['Problem ID'])] = entry
+        return latest
@@ -0,0 +1,210 @@
+import os
+import random
+import tempfile
+from judge_harness import encode_input
+
+# Seeded input generators for the hidden stress tests, one per problem id.
+# Inputs are written once to CACHE_DIR and handed to the judge as file
+# paths, so megabyte-sized tests are streamed to the contestant's stdin
+# instead of being held in memory as strings.
+CACHE_DIR = os.path.join("team_data", "test_inputs")
+GENERATOR_VERSION = 1  # Bump when a generator's output changes
+CHUNK = 4096  # Items joined per write
+
+
+def write_list(out, values):
+    out.write('[')
+    for start in range(0, len(values), CHUNK):
+        if start:
+            out.write(',')
+        out.write(','.join(map(str, values[start:start + CHUNK])))
+    out.write(']')
+
+
+def write_chars(out, chars):
+    for start in range(0, len(chars), CHUNK):
+        out.write(''.join(chars[start:start + CHUNK]))
+
+
+# ---------------------------------------------------------------------------
+# Generators: generator(size, rng, out) writes one test input to out
+# ---------------------------------------------------------------------------
+
+def complete_bst(size, rng, out):
+    # Level order of a complete BST: an in-order walk of the implicit tree
+    # hands out the sorted values
+    values = sorted(rng.sample(range(1, size * 10), size))
+    nodes = [None] * size
+    stack = []
+    index = position = 0
+    while stack or index < size:
+        while index < size:
+            stack.append(index)
+            index = 2 * index + 1
+        index = stack.pop()
+        nodes[index] = values[position]
+        position += 1
+        index = 2 * index + 2
+    write_list(out, nodes)
+
+
+def random_tree(size, rng, out):
+    # Level-order list with gaps; a null is only drawn while other child
+    # slots are still open, so the tree always reaches `size` nodes. Gaps are
+    # written as None, which every harness reads and literal_eval accepts.
+    nodes = [rng.randint(-1000, 1000)]
+    count, open_slots = 1, 2
+    while count < size:
+        open_slots -= 1
+        if open_slots > 0 and rng.random() < 0.2:
+            nodes.append('None')
+        else:
+            nodes.append(rng.randint(-1000, 1000))
+            count += 1
+            open_slots += 2
+    write_list(out, nodes)
+
+
+def long_palindrome(size, rng, out):
+    # Some seeds break the palindrome right next to the middle
+    broken = rng.random() < 0.5
+    half = [rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(size // 2)]
+    mirrored = half[::-1]
+    if broken:
+        half[-1] = 'z' if half[-1] != 'z' else 'y'
+    write_chars(out, half)
+    write_chars(out, mirrored)
+
+
+def alphanumeric_string(size, rng, out):
+    # Starts with a letter so the Python harness keeps it a plain string
+    alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+    out.write(rng.choice(alphabet[:52]))
+    remaining = size - 1
+    while remaining > 0:
+        count = min(CHUNK, remaining)
+        out.write(''.join(rng.choice(alphabet) for _ in range(count)))
+        remaining -= count
+
+
+def sorted_pair(size, rng, out):
+    # One array per line; the second is a little shorter so both parities occur
+    write_list(out, sorted(rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)))
+    out.write('\n')
+    write_list(out, sorted(rng.randint(-10 ** 6, 10 ** 6) for _ in range(size - rng.randint(0, 1))))
+
+
+def random_grid(size, rng, out):
+    # Land below the percolation threshold: many islands of varied size
+    out.write('[')
+    for row in range(size):
+        if row:
+            out.write(',')
+        write_list(out, [1 if rng.random() < 0.45 else 0 for _ in range(size)])
+    out.write(']')
+
+
+def coins_and_amount(size, rng, out):
+    write_list(out, sorted(rng.sample(range(2, 200), 8)))
+    out.write('\n%d' % (size - rng.randint(0, 10)))
+
+
+def planted_palindrome(size, rng, out):
+    # Random text with one long palindrome planted in it, so the answer is unique
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    text = [rng.choice(letters) for _ in range(size)]
+    half = [rng.choice(letters) for _ in range(size // 20)]
+    planted = half + [rng.choice(letters)] + half[::-1]
+    start = rng.randint(0, size - len(planted))
+    text[start:start + len(planted)] = planted
+    write_chars(out, text)
+
+
+def signed_runs(size, rng, out):
+    # Runs of at most 30 factors of magnitude 1 or 2 between zeros, so
+    # every product fits in a 32-bit int
+    nums = []
+    while len(nums) < size:
+        nums.extend(rng.choice((-2, -1, 1, 2)) for _ in range(rng.randint(1, 30)))
+        nums.append(0)
+    write_list(out, nums[:size])
+
+
+def planted_window(size, rng, out):
+    # 'x', 'y' and 'z' occur exactly once, close together, so exactly one
+    # minimum window exists
+    text = [rng.choice('abcdefghijklmnopqrst') for _ in range(size)]
+    span = rng.randint(3, 200)
+    start = rng.randint(0, size - span)
+    for c, position in zip('xyz', rng.sample(range(start, start + span), 3)):
+        text[position] = c
+    write_chars(out, text)
+    out.write('\n' + ''.join(rng.sample('xyz', 3)))
+
+
+GENERATORS = {
+    'dsa1-bst-max': complete_bst,
+    'dsa1-palindrome': long_palindrome,
+    'dsa1-level-order': random_tree,
+    'dsa1-longest-unique': alphanumeric_string,
+    'dsa1-median': sorted_pair,
+    'dsa2-islands': random_grid,
+    'dsa2-coin-change': coins_and_amount,
+    'dsa2-longest-palindrome': planted_palindrome,
+    'dsa2-max-product': signed_runs,
+    'dsa2-min-window': planted_window
+}
+
+
+# Elements in an input of a given size, where that isn't the size itself
+ELEMENT_COUNTS = {
+    'dsa2-islands': lambda size: size * size
+}
+
+
+def input_elements(problem_id, size):
+    # The n of the input's complexity; grids are size x size
+    return ELEMENT_COUNTS.get(problem_id, lambda size: size)(size)
+
+
+def input_file(problem_id, size, seed, cache_dir=CACHE_DIR):
+    # Absolute path of the generated input, writing it on first use. The
+    # file is published with an atomic rename so concurrent judges never
+    # read a half-written input.
+    name = f"{problem_id}-n{size}-s{seed}-v{GENERATOR_VERSION}.txt"
+    path = os.path.abspath(os.path.join(cache_dir, name))
+    if os.path.exists(path):
+        return path
+
+    publish(path, lambda out: GENERATORS[problem_id](size, random.Random(seed), out))
+    return path
+
+
+def wire_file(path):
+    # The generated input at path parsed once into the JSON arguments the
+    # Python harness loads directly (see judge_harness.encode_input), kept
+    # next to it; None if the input has no JSON form
+    wire_path = path + '.json'
+    if os.path.exists(wire_path):
+        return wire_path
+    with open(path) as f:
+        wire = encode_input(f.read())
+    if wire is None:
+        return None
+    publish(wire_path, lambda out: out.write(wire))
+    return wire_path
+
+
+def publish(path, write):
+    # write(out) fills a temporary file that is then renamed into place
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='\n') as out:
+            write(out)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
@@ -0,0 +1,171 @@
+import os
+import json
+import hashlib
+import platform
+import threading
+import subprocess
+
+CACHE_FILE = "team_data/toolchains.json"
+PROBE_TIMEOUT = 10  # Seconds a single --version probe may take
+
+# Candidate commands per tool, tried in order
+TOOL_CANDIDATES = {
+    'Windows': {
+        'python': ['python', 'py'],
+        'python3': ['python3', 'py -3']
+    },
+    'Linux': {
+        'python': ['python', 'python2'],
+        'python3': ['python3']
+    },
+    'Darwin': {  # macOS
+        'python': ['python', 'python2'],
+        'python3': ['python3']
+    }
+}
+NATIVE_TOOLS = {
+    'g++': ['g++'],
+    'gcc': ['gcc'],
+    'javac': ['javac'],
+    'java': ['java'],
+    'csc': ['csc'],
+    'mono': ['mono']
+}
+VERSION_FLAGS = {
+    'javac': '-version',
+    'java': '-version',
+    'csc': '-version'
+}
+
+# Tools a language needs before it is offered in the round windows
+LANGUAGE_TOOLS = {
+    'Python': ['python'],
+    'Python3': ['python3'],
+    'C++': ['g++'],
+    'Java': ['javac', 'java'],
+    'C': ['gcc'],
+    'C#': ['csc', 'mono']
+}
+LANGUAGE_ORDER = ['Python', 'Python3', 'C++', 'Java', 'C', 'C#']
+
+
+def path_fingerprint():
+    # PATH itself plus every PATH directory's mtime, which changes whenever a
+    # binary is installed into or removed from it
+    parts = [os.environ.get('PATH', '')]
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        try:
+            parts.append(f"{directory}:{os.stat(directory).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{directory}:missing")
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+def probe(tool, command):
+    try:
+        result = subprocess.run(
+            [command, VERSION_FLAGS.get(tool, '--version')],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    # java/javac print their version on stderr
+    lines = (result.stdout or result.stderr).strip().splitlines()
+    return lines[0] if lines else ''
+
+
+class ToolchainRegistry:
+    # Probes every supported interpreter/compiler once, off the GUI thread,
+    # and remembers the answer on disk until PATH changes
+    def __init__(self, cache_file=CACHE_FILE):
+        self.cache_file = cache_file
+        self.tools = {}
+        self.thread = None
+        self.ready = threading.Event()
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self.load)
+            self.thread.daemon = True
+            self.thread.start()
+
+    def wait(self):
+        self.start()
+        self.ready.wait()
+
+    def load(self):
+        try:
+            fingerprint = path_fingerprint()
+            cached = self.read_cache()
+            if cached and cached.get('fingerprint') == fingerprint:
+                self.tools = cached['tools']
+            else:
+                self.tools = self.probe_all()
+                self.write_cache(fingerprint)
+        finally:
+            self.ready.set()
+
+    def probe_all(self):
+        candidates = dict(TOOL_CANDIDATES.get(platform.system(), {}))
+        candidates.update(NATIVE_TOOLS)
+
+        tools = {}
+        for tool, commands in candidates.items():
+            for command in commands:
+                version = probe(tool, command)
+                if version is not None:
+                    tools[tool] = {'command': command, 'version': version}
+                    break
+        return tools
+
+    def read_cache(self):
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write_cache(self, fingerprint):
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(self.cache_file, 'w') as f:
+                json.dump({'fingerprint': fingerprint, 'tools': self.tools}, f, indent=4)
+        except OSError:
+            pass
+
+    def command(self, tool):
+        self.wait()
+        entry = self.tools.get(tool)
+        return entry['command'] if entry else None
+
+    def version(self, tool):
+        self.wait()
+        entry = self.tools.get(tool)
+        return entry['version'] if entry else None
+
+    def python_interpreters(self):
+        self.wait()
+        return {
+            version: self.tools[version]['command']
+            for version in ('python', 'python3') if version in self.tools
+        }
+
+    def available_languages(self):
+        self.wait()
+        return [
+            language for language in LANGUAGE_ORDER
+            if all(tool in self.tools for tool in LANGUAGE_TOOLS[language])
+        ]
+
+
+# Shared by the whole app; main() starts probing before the login window shows
+registry = ToolchainRegistry()
@@ -0,0 +1,77 @@
+import os
+import atexit
+import shutil
+import tempfile
+import threading
+import contextlib
+
+RAM_DIR = "/dev/shm"
+POOL_SIZE = 4  # Workspaces created up front; busier judges make more on demand
+
+
+def ram_root():
+    # /dev/shm if sources can be written and binaries executed there, else
+    # None for the system temporary directory
+    if not os.path.isdir(RAM_DIR) or not os.access(RAM_DIR, os.W_OK | os.X_OK):
+        return None
+    try:
+        flags = os.statvfs(RAM_DIR).f_flag
+    except (OSError, AttributeError):
+        return None
+    if flags & (getattr(os, "ST_NOEXEC", 0) | getattr(os, "ST_RDONLY", 0)):
+        return None
+    return RAM_DIR
+
+
+def clear(path):
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+class WorkspacePool:
+    # Scratch directories for building and running submissions, kept on
+    # tmpfs so sources and binaries never reach the disk. A workspace is
+    # emptied when it is handed back and reused by the next run, instead of
+    # creating and deleting a directory per run.
+    def __init__(self, root=None, size=POOL_SIZE):
+        self.root = tempfile.mkdtemp(prefix="judge-", dir=root or ram_root())
+        self.size = size
+        self.lock = threading.Lock()
+        self.free = [self.create() for _ in range(size)]
+        atexit.register(self.close)
+
+    def create(self):
+        os.makedirs(self.root, exist_ok=True)
+        return tempfile.mkdtemp(dir=self.root)
+
+    @contextlib.contextmanager
+    def workspace(self):
+        with self.lock:
+            path = self.free.pop() if self.free else None
+        if path is None:
+            path = self.create()
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def release(self, path):
+        try:
+            clear(path)
+        except OSError:
+            # Something in it couldn't be removed: retire the workspace
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        with self.lock:
+            if len(self.free) < self.size:
+                self.free.append(path)
+                return
+        shutil.rmtree(path, ignore_errors=True)
+
+    def close(self):
+        with self.lock:
+            self.free = []
+        shutil.rmtree(self.root, ignore_errors=True)